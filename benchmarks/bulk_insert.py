@@ -0,0 +1,55 @@
+"""
+Compare bulk inserts with inserting ORM instances of nested documents.
+
+Run from the repository root:
+
+    python benchmarks/bulk_insert.py [datasets]
+"""
+
+import sys
+import time
+
+from mdmodels import sql
+from mdmodels.datamodel import DataModel
+
+
+def main(count: int = 50):
+    lib = DataModel.from_markdown("tests/fixtures/model_database_nested.md")
+    models = sql.generate_sqlmodel(data_model=lib)
+    datasets = [
+        lib.Dataset(
+            name=f"dataset {index}",
+            species=[
+                lib.Species(id=f"s{number}", name="Species", mw=1.0)
+                for number in range(10)
+            ],
+            measurements=[
+                lib.Measurement(time=float(number), value=1.0) for number in range(100)
+            ],
+        )
+        for index in range(count)
+    ]
+
+    durations = {}
+
+    for name, bulk in (("ORM", False), ("Bulk", True)):
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+        start = time.perf_counter()
+
+        with db as session:
+            if bulk:
+                sql.insert_bulk(datasets, session, models)
+            else:
+                session.add_all(sql.insert_nested(datasets, lib, session, models))
+
+        durations[name] = time.perf_counter() - start
+
+    for name, duration in durations.items():
+        print(f"{name:<5} {duration * 1e3:8.1f} ms")
+
+    print(f"Speedup: {durations['ORM'] / durations['Bulk']:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
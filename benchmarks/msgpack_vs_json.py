@@ -0,0 +1,66 @@
+"""
+Compare the size and decoding time of MessagePack and JSON documents.
+
+Run from the repository root:
+
+    python benchmarks/msgpack_vs_json.py [points]
+"""
+
+import sys
+import time
+
+from mdmodels import DataModel
+
+REPEATS = 5
+
+
+def best_of(function, repeats: int = REPEATS) -> float:
+    """The fastest of several runs of a function, in seconds."""
+    durations = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main(points: int = 100_000):
+    lib = DataModel.from_markdown("tests/fixtures/model_timecourse.md")
+    document = lib.TimeCourse(
+        name="Kinetics",
+        time=[i * 0.5 for i in range(points)],
+        counts=list(range(points)),
+        unit="mmol / l",
+        status=lib.Status.DONE,
+        replicates=[
+            lib.Replicate(id=f"r{i}", values=[i + j / 3 for j in range(points)])
+            for i in range(3)
+        ],
+    )
+
+    as_json = document.model_dump_json().encode()
+    as_msgpack = document.to_msgpack()
+
+    timings = {
+        "JSON": (
+            len(as_json),
+            best_of(lambda: lib.TimeCourse.model_validate_json(as_json)),
+        ),
+        "MessagePack": (
+            len(as_msgpack),
+            best_of(lambda: lib.TimeCourse.from_msgpack(as_msgpack)),
+        ),
+        "MessagePack (trusted)": (
+            len(as_msgpack),
+            best_of(lambda: lib.TimeCourse.from_msgpack(as_msgpack, trusted=True)),
+        ),
+    }
+
+    for name, (size, duration) in timings.items():
+        print(f"{name:<22} {size / 1e6:8.2f} MB {duration * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
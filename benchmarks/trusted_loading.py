@@ -0,0 +1,51 @@
+"""
+Compare trusted loading of documents with their validation.
+
+Run from the repository root:
+
+    python benchmarks/trusted_loading.py [items]
+"""
+
+import sys
+import time
+
+from mdmodels import DataModel
+
+REPEATS = 20
+
+
+def best_of(function, repeats: int = REPEATS) -> float:
+    """The fastest of several runs of a function, in seconds."""
+    durations = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main(items: int = 200):
+    lib = DataModel.from_markdown("tests/fixtures/model.md")
+    data = lib.Test(
+        name="Test",
+        number=2.0,
+        to_reference=["abc", "def"],
+        single_object=lib.Nested(reference="abc", names=["a", "b"], number=2.0),
+        nested_array=[
+            lib.Nested(reference="abc", names=["x"], number=float(i))
+            for i in range(items)
+        ],
+        ontology=lib.Ontology.GO,
+    ).model_dump(mode="json")
+
+    validated = best_of(lambda: lib.Test.model_validate(data))
+    trusted = best_of(lambda: lib.Test.load_trusted(data))
+
+    print(f"Validated: {validated * 1e3:8.2f} ms")
+    print(f"Trusted:   {trusted * 1e3:8.2f} ms ({validated / trusted:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
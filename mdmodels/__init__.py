@@ -22,6 +22,7 @@
 import nest_asyncio
 
 from .datamodel import DataModel
+from .streaming import query
 from .templates import Templates
 
 __version__ = "0.2.4"
@@ -33,5 +34,6 @@ def patch_nest_asyncio():
 
 __all__ = [
     "DataModel",
+    "query",
     "Templates",
 ]
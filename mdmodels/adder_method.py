@@ -20,7 +20,6 @@
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
 import builtins
-from typing import Union, get_origin, get_args, Annotated
 import warnings
 
 import forge
@@ -28,8 +27,7 @@ import forge
 from forge import FParameter, sign, FSignature
 
 from mdmodels import DataModel
-from mdmodels.units.unit_definition import UnitDefinition, BaseUnit
-from mdmodels.utils import extract_dtype
+from mdmodels.units.unit_definition import BaseUnit
 
 
 def apply_adder_methods(cls: type[DataModel]):
@@ -39,24 +37,21 @@ def apply_adder_methods(cls: type[DataModel]):
     Args:
         cls (type[DataModel]): The DataModel class to which adder methods will be applied.
     """
-    for name, field in cls.model_fields.items():
-        if get_origin(field.annotation) is not list:
+    for name, field in cls.__mdmodels__.fields.items():  # type: ignore
+        if not field.is_array:
             continue
 
         method_name = f"add_to_{name}"
-        underlying_type = get_args(field.annotation)
 
-        if len(underlying_type) != 1 or get_origin(underlying_type[0]) is Union:
+        if field.is_union:
             warnings.warn(
                 f"Only one type is supported for adder methods. {cls.__name__}.{name} has multiple types. Skipping.",
             )
             continue
         else:
-            underlying_type = underlying_type[0]
+            underlying_type = field.dtype
 
-        if underlying_type in [UnitDefinition, BaseUnit] or is_builtin_type(
-            underlying_type
-        ):
+        if not field.is_model or underlying_type is BaseUnit:
             continue
 
         add_method = _create_add_method(underlying_type, name)
@@ -110,19 +105,15 @@ def _create_signature(coll_cls: type[DataModel]):
     Returns:
         FSignature: The created signature.
     """
-    if get_origin(coll_cls) is Annotated:
-        coll_cls = extract_dtype(coll_cls)
-
-    annotations = coll_cls.__annotations__
+    fields = coll_cls.__mdmodels__.fields  # type: ignore
     parameters = [
         FParameter(
             kind=FParameter.KEYWORD_ONLY,
             name=name,
-            type=annotations[name],
-            default=None if get_origin(annotations[name]) is not list else [],
+            type=field.annotation,
+            default=None if not field.is_array else [],
         )
-        for name in annotations
-        if name != "return"
+        for name, field in fields.items()
     ]
 
     return FSignature(
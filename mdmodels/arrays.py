@@ -0,0 +1,152 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from typing import Annotated, Any
+
+import numpy as np
+from pydantic import GetPydanticSchema, SerializationInfo, WithJsonSchema
+from pydantic_core import core_schema
+
+
+# NumPy dtypes of the items of NumPy-backed lists
+NUMPY_DTYPES = {
+    float: np.dtype(np.float64),
+    int: np.dtype(np.int64),
+}
+
+
+class NumericArray:
+    """
+    Marks a field as a one-dimensional NumPy array of a numeric type.
+
+    Attributes:
+        dtype (type): The Python type of the items, either 'float' or 'int'.
+        np_dtype (np.dtype): The NumPy dtype of the array.
+    """
+
+    def __init__(self, dtype: type, np_dtype: Any):
+        self.dtype = dtype
+        self.np_dtype = np.dtype(np_dtype)
+
+    def __repr__(self):
+        return f"NumericArray({self.dtype.__name__})"
+
+    def validate(self, value: Any) -> np.ndarray:
+        """
+        Convert a value into an array with a single vectorized conversion.
+
+        Arrays of the right dtype are passed through and buffers are wrapped
+        with 'np.frombuffer', both without copying. Strings, as found in XML,
+        are parsed as comma or whitespace separated numbers.
+
+        Args:
+            value (Any): An array, a buffer, a sequence of numbers or a string.
+
+        Returns:
+            np.ndarray: The one-dimensional array.
+
+        Raises:
+            ValueError: If the value is not a one-dimensional sequence of numbers.
+        """
+        if isinstance(value, np.ndarray) and value.dtype == self.np_dtype:
+            array = value
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            array = np.frombuffer(value, dtype=self.np_dtype)
+        elif isinstance(value, str):
+            items = value.strip().strip("[]").replace(",", " ").split()
+            array = np.array(items, dtype=self.np_dtype)
+        else:
+            array = self._cast(np.asarray(value))
+
+        if array.ndim != 1:
+            raise ValueError(
+                f"Expected a one-dimensional array, got {array.ndim} dimensions."
+            )
+
+        return array
+
+    def _cast(self, array: np.ndarray) -> np.ndarray:
+        """
+        Cast an array to the dtype of the field, rejecting lossy conversions.
+        """
+        if array.dtype == self.np_dtype:
+            return array
+
+        if array.dtype.kind in "OUS":
+            raise ValueError(f"Expected numbers, got an array of '{array.dtype}'.")
+
+        if self.np_dtype.kind == "i" and array.dtype.kind == "f":
+            if not np.all(np.mod(array, 1) == 0):
+                raise ValueError("Expected integers, got fractional numbers.")
+
+        return array.astype(self.np_dtype)
+
+    def schema(self, source: Any, handler: Any) -> core_schema.CoreSchema:
+        """
+        Build the core schema of the field.
+
+        The inner schema is a primitive, such that pydantic-xml serializes the
+        array as the text of a single element or attribute.
+        """
+        return core_schema.no_info_before_validator_function(
+            self.validate,
+            core_schema.lax_or_strict_schema(
+                core_schema.any_schema(), core_schema.any_schema()
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _serialize, info_arg=True
+            ),
+        )
+
+
+def _serialize(array: np.ndarray, info: SerializationInfo) -> Any:
+    """
+    Serialize an array to a list in JSON mode and keep it as is otherwise.
+    """
+    if info.mode_is_json():
+        return array.tolist()
+
+    return array
+
+
+def numeric_array(dtype: type) -> Any:
+    """
+    Create the annotation of a NumPy-backed list field.
+
+    Args:
+        dtype (type): The Python type of the items, either 'float' or 'int'.
+
+    Returns:
+        Any: The annotated array type.
+    """
+    marker = NumericArray(dtype, NUMPY_DTYPES[dtype])
+    item_type = "number" if dtype is float else "integer"
+
+    return Annotated[
+        np.ndarray,
+        marker,
+        GetPydanticSchema(marker.schema),
+        WithJsonSchema({"type": "array", "items": {"type": item_type}}),
+    ]
+
+
+FloatArray = numeric_array(float)
+IntArray = numeric_array(int)
@@ -0,0 +1,95 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+
+import pyarrow as pa
+
+from mdmodels.datamodel import DataModel
+from mdmodels.meta import FieldMeta
+
+SCALAR_TYPES = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    bytes: pa.binary(),
+}
+
+ENUM_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+# Union fields cannot be mapped onto a single Arrow type and are stored as JSON strings
+UNION_TYPE = pa.string()
+
+
+def arrow_schema(model: type[DataModel]) -> pa.Schema:
+    """
+    Derive an Arrow schema from the type graph of a data model.
+
+    Single objects become nested structs, arrays become lists and enumerations
+    are dictionary encoded. Fields accepting multiple types are stored as JSON
+    encoded strings.
+
+    Args:
+        model (type[DataModel]): The root data model.
+
+    Returns:
+        pa.Schema: The Arrow schema of the root data model.
+
+    Raises:
+        ValueError: If the data model is recursive.
+    """
+    return pa.schema(_struct_fields(model, ()))
+
+
+def _struct_fields(model: type[DataModel], seen: tuple[type, ...]) -> list[pa.Field]:
+    """
+    Map the fields of a model onto Arrow fields.
+    """
+    if model in seen:
+        path = " -> ".join(m.__name__ for m in seen + (model,))
+        raise ValueError(
+            f"Recursive data model '{path}' cannot be represented as an Arrow schema."
+        )
+
+    return [
+        pa.field(field.name, _field_type(field, seen + (model,)))
+        for field in model.__mdmodels__.fields.values()  # type: ignore
+    ]
+
+
+def _field_type(field: FieldMeta, seen: tuple[type, ...]) -> pa.DataType:
+    """
+    Map a single field onto an Arrow type.
+    """
+    if field.is_union:
+        dtype = UNION_TYPE
+    elif field.is_model:
+        dtype = pa.struct(_struct_fields(field.dtype, seen))
+    elif field.is_enum:
+        dtype = ENUM_TYPE
+    elif field.dtype in SCALAR_TYPES:
+        dtype = SCALAR_TYPES[field.dtype]
+    else:
+        raise ValueError(
+            f"Field '{field.name}' of type '{field.dtype}' has no Arrow equivalent."
+        )
+
+    return pa.list_(dtype) if field.is_array else dtype
@@ -0,0 +1,174 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import json
+from pathlib import Path
+from typing import Any, Generator, Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from mdmodels.datamodel import DataModel
+
+from .schema import arrow_schema
+
+
+def to_arrow(
+    documents: Iterable[DataModel | dict],
+    model: type[DataModel],
+) -> pa.Table:
+    """
+    Convert documents into an Arrow table with a schema derived from the data model.
+
+    Args:
+        documents (Iterable[DataModel | dict]): The documents, one per row.
+        model (type[DataModel]): The data model of the documents.
+
+    Returns:
+        pa.Table: The documents as an Arrow table.
+    """
+    schema = arrow_schema(model)
+    rows = [_to_row(document, model) for document in documents]
+
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+def to_parquet(
+    path: str | Path,
+    documents: Iterable[DataModel | dict],
+    model: type[DataModel],
+    row_group_size: int = 10_000,
+) -> int:
+    """
+    Write documents to a Parquet file, one row group at a time.
+
+    Only a single row group is held in memory, so documents can be streamed
+    from a generator.
+
+    Args:
+        path (str | Path): The target Parquet file.
+        documents (Iterable[DataModel | dict]): The documents, one per row.
+        model (type[DataModel]): The data model of the documents.
+        row_group_size (int, optional): The number of documents per row group. Defaults to 10,000.
+
+    Returns:
+        int: The number of written documents.
+    """
+    schema = arrow_schema(model)
+    written = 0
+    rows = []
+
+    with pq.ParquetWriter(str(path), schema) as writer:
+        for document in documents:
+            rows.append(_to_row(document, model))
+
+            if len(rows) == row_group_size:
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                written += len(rows)
+                rows = []
+
+        if rows or not written:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            written += len(rows)
+
+    return written
+
+
+def from_parquet(
+    path: str | Path,
+    model: type[DataModel],
+    batch_size: int = 10_000,
+) -> Generator[DataModel, None, None]:
+    """
+    Lazily read documents from a Parquet file.
+
+    The file is read in record batches and every row is validated into the
+    data model when it is reached.
+
+    Args:
+        path (str | Path): The Parquet file to read.
+        model (type[DataModel]): The data model of the documents.
+        batch_size (int, optional): The number of rows read at once. Defaults to 10,000.
+
+    Yields:
+        DataModel: The documents of the file in row order.
+    """
+    parquet_file = pq.ParquetFile(str(path))
+
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        for row in batch.to_pylist():
+            yield model.model_validate(_from_row(row, model))
+
+
+def _to_row(document: DataModel | dict, model: type[DataModel]) -> dict[str, Any]:
+    """
+    Dump a document into a row matching the Arrow schema of the model.
+    """
+    if not isinstance(document, model):
+        document = model.model_validate(document)
+
+    return _encode_unions(document.model_dump(mode="json"), model)
+
+
+def _encode_unions(data: dict[str, Any], model: type[DataModel]) -> dict[str, Any]:
+    """
+    Encode values of fields accepting multiple types as JSON strings.
+    """
+    for field in model.__mdmodels__.fields.values():  # type: ignore
+        value = data.get(field.name)
+
+        if value is None:
+            continue
+        elif field.is_union and field.is_array:
+            data[field.name] = [json.dumps(item) for item in value]
+        elif field.is_union:
+            data[field.name] = json.dumps(value)
+        elif field.is_model and field.is_array:
+            data[field.name] = [_encode_unions(item, field.dtype) for item in value]
+        elif field.is_model:
+            data[field.name] = _encode_unions(value, field.dtype)
+
+    return data
+
+
+def _from_row(row: dict[str, Any], model: type[DataModel]) -> dict[str, Any]:
+    """
+    Decode union fields and drop missing values so that defaults apply.
+    """
+    data = {}
+
+    for field in model.__mdmodels__.fields.values():  # type: ignore
+        value = row.get(field.name)
+
+        if value is None:
+            continue
+        elif field.is_union and field.is_array:
+            value = [json.loads(item) for item in value]
+        elif field.is_union:
+            value = json.loads(value)
+        elif field.is_model and field.is_array:
+            value = [_from_row(item, field.dtype) for item in value]
+        elif field.is_model:
+            value = _from_row(value, field.dtype)
+
+        data[field.name] = value
+
+    return data
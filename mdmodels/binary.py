@@ -0,0 +1,305 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import sys
+from array import array
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from .meta import FieldMeta, _resolve_forward_ref
+from .trusted import construct
+
+# Extension type codes of packed numeric arrays
+FLOAT_ARRAY = 1
+INT_ARRAY = 2
+
+_ARRAY_TYPES = {FLOAT_ARRAY: "d", INT_ARRAY: "q"}
+_NUMPY_TYPES = {FLOAT_ARRAY: np.dtype("<f8"), INT_ARRAY: np.dtype("<i8")}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def to_msgpack(document: BaseModel) -> bytes:
+    """
+    Serialize a document to a compact, schema-aware MessagePack buffer.
+
+    Objects are packed as arrays of their field values in field order, so no
+    field names are stored. Enumerations are packed as ordinals, unit
+    definitions as nested tuples and lists of floats or integers as typed
+    binary arrays. Both sides of the exchange must use the same data model.
+
+    Args:
+        document (BaseModel): The document to serialize.
+
+    Returns:
+        bytes: The MessagePack buffer.
+    """
+    msgpack = _import_msgpack()
+
+    return msgpack.packb(_encode_model(document), use_bin_type=True)
+
+
+def from_msgpack(
+    model: type[BaseModel],
+    buffer: bytes,
+    trusted: bool = False,
+) -> BaseModel:
+    """
+    Deserialize a document from a buffer created by 'to_msgpack'.
+
+    Args:
+        model (type[BaseModel]): The data model of the document.
+        buffer (bytes): The MessagePack buffer.
+        trusted (bool, optional): Whether to skip validation and construct the document
+            directly. Only use this for buffers produced by this library. Defaults to False.
+
+    Returns:
+        BaseModel: The deserialized document.
+    """
+    msgpack = _import_msgpack()
+
+    packed = msgpack.unpackb(buffer, raw=False)
+    data = _decode_model(model, packed, trusted)
+
+    if trusted:
+        return data
+
+    return model.model_validate(data)
+
+
+def _encode_model(document: BaseModel) -> list[Any]:
+    """
+    Pack the field values of a document in field order.
+    """
+    fields = type(document).__mdmodels__.fields  # type: ignore
+
+    return [
+        _encode_field(field, getattr(document, name)) for name, field in fields.items()
+    ]
+
+
+def _encode_field(field: FieldMeta, value: Any) -> Any:
+    """
+    Pack the value of a single field.
+    """
+    if value is None:
+        return None
+
+    if not field.is_array:
+        return _encode_value(field, value)
+
+    if not field.is_union and field.dtype in (float, int):
+        return _encode_array(field.dtype, value)
+
+    return [_encode_value(field, item) for item in value]
+
+
+def _encode_value(field: FieldMeta, value: Any) -> Any:
+    """
+    Pack a single (non-list) value. Values of union fields are tagged with
+    the index of their type.
+    """
+    if field.is_union:
+        index = _union_index(field, value)
+        dtype = _resolve_forward_ref(field.dtypes[index])
+        return [index, _encode_typed(dtype, value)]
+
+    return _encode_typed(field.dtype, value)
+
+
+def _encode_typed(dtype: Any, value: Any) -> Any:
+    """
+    Pack a value of a known type.
+    """
+    if isinstance(value, BaseModel):
+        return _encode_model(value)
+
+    if isinstance(value, Enum):
+        return _ordinals(type(value))[value]
+
+    return value
+
+
+def _encode_array(dtype: type, values: list | np.ndarray) -> Any:
+    """
+    Pack a list of numbers as a typed binary array, if all values fit.
+    """
+    msgpack = _import_msgpack()
+    code = FLOAT_ARRAY if dtype is float else INT_ARRAY
+
+    if isinstance(values, np.ndarray):
+        return msgpack.ExtType(
+            code, np.asarray(values, dtype=_NUMPY_TYPES[code]).tobytes()
+        )
+
+    if dtype is int and not all(_INT64_MIN <= v <= _INT64_MAX for v in values):
+        return list(values)
+
+    packed = array(_ARRAY_TYPES[code], values)
+
+    if sys.byteorder == "big":
+        packed.byteswap()
+
+    return msgpack.ExtType(code, packed.tobytes())
+
+
+def _decode_array(packed: Any, numpy: bool) -> list | np.ndarray:
+    """
+    Unpack a typed binary array into a list of numbers. NumPy arrays are
+    views of the buffer and not copied.
+    """
+    code, data = packed
+
+    if code not in _ARRAY_TYPES:
+        raise ValueError(f"Unknown MessagePack extension type '{code}'.")
+
+    if numpy:
+        return np.frombuffer(data, dtype=_NUMPY_TYPES[code])
+
+    values = array(_ARRAY_TYPES[code])
+    values.frombytes(data)
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tolist()
+
+
+def _decode_model(model: type[BaseModel], packed: list[Any], trusted: bool) -> Any:
+    """
+    Unpack the field values of an object. Trusted objects are built by
+    'construct', others are returned as dictionaries for validation.
+    """
+    fields = model.__mdmodels__.fields  # type: ignore
+
+    if len(packed) != len(fields):
+        raise ValueError(
+            f"Expected {len(fields)} fields for '{model.__name__}', got {len(packed)}. "
+            "The buffer was created with a different data model."
+        )
+
+    data = {
+        name: _decode_field(field, value, trusted)
+        for (name, field), value in zip(fields.items(), packed)
+    }
+
+    if trusted:
+        return construct(model, data)
+
+    return data
+
+
+def _decode_field(field: FieldMeta, value: Any, trusted: bool) -> Any:
+    """
+    Unpack the value of a single field.
+    """
+    if value is None:
+        return None
+
+    if field.is_unit:
+        # Units stay dictionaries, such that 'construct' interns them
+        trusted = False
+
+    if not field.is_array:
+        return _decode_value(field, value, trusted)
+
+    if not field.is_union and field.dtype in (float, int):
+        if isinstance(value, list):
+            return np.array(value) if field.is_numpy else value
+
+        return _decode_array(value, field.is_numpy)
+
+    return [_decode_value(field, item, trusted) for item in value]
+
+
+def _decode_value(field: FieldMeta, value: Any, trusted: bool) -> Any:
+    """
+    Unpack a single (non-list) value.
+    """
+    if field.is_union:
+        index, value = value
+        return _decode_typed(_resolve_forward_ref(field.dtypes[index]), value, trusted)
+
+    return _decode_typed(field.dtype, value, trusted)
+
+
+def _decode_typed(dtype: Any, value: Any, trusted: bool) -> Any:
+    """
+    Unpack a value of a known type.
+    """
+    if isinstance(dtype, type) and issubclass(dtype, BaseModel):
+        return _decode_model(dtype, value, trusted)
+
+    if isinstance(dtype, type) and issubclass(dtype, Enum):
+        return _members(dtype)[value]
+
+    return value
+
+
+def _union_index(field: FieldMeta, value: Any) -> int:
+    """
+    Find the index of the type of a union field that a value belongs to.
+    """
+    dtypes = [_resolve_forward_ref(dtype) for dtype in field.dtypes]
+
+    for index, dtype in enumerate(dtypes):
+        if type(value) is dtype:
+            return index
+
+    for index, dtype in enumerate(dtypes):
+        if isinstance(dtype, type) and isinstance(value, dtype):
+            return index
+
+    raise ValueError(f"Value '{value}' does not match any type of '{field.name}'.")
+
+
+@lru_cache(maxsize=None)
+def _ordinals(enum: type[Enum]) -> dict[Enum, int]:
+    """
+    Map the members of an enumeration to their ordinals.
+    """
+    return {member: index for index, member in enumerate(enum)}
+
+
+@lru_cache(maxsize=None)
+def _members(enum: type[Enum]) -> tuple[Enum, ...]:
+    """
+    List the members of an enumeration by ordinal.
+    """
+    return tuple(enum)
+
+
+def _import_msgpack():
+    """
+    Import msgpack, which is an optional dependency.
+    """
+    try:
+        import msgpack
+    except ImportError:
+        raise ImportError(
+            "MessagePack serialization requires the 'msgpack' package. "
+            "Install it with 'pip install mdmodels[msgpack]'."
+        )
+
+    return msgpack
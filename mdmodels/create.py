@@ -27,6 +27,7 @@ from functools import partial
 from typing import Any, Annotated, ForwardRef, Union
 
 import httpx
+import numpy as np
 import validators
 from mdmodels_core import DataModel as RSDataModel  # type: ignore
 from pydantic import BeforeValidator
@@ -34,6 +35,7 @@ from pydantic_core.core_schema import ValidationInfo
 from pydantic_xml import RootXmlModel, create_model, attr, element, wrapped
 
 from mdmodels.adder_method import apply_adder_methods
+from mdmodels.arrays import NUMPY_DTYPES, FloatArray, IntArray
 from mdmodels.datamodel import DataModel
 from mdmodels.library import Library
 from mdmodels.path import PathFactory
@@ -53,6 +55,16 @@ TYPE_MAPPING = {
 }
 
 
+# Annotations of arrays of numbers when backed by NumPy
+NUMERIC_ARRAYS = {
+    float: FloatArray,
+    int: IntArray,
+}
+
+# Whether the module being built backs arrays of numbers by NumPy
+use_numpy_arrays = False
+
+
 class StringElement(RootXmlModel):
     root: str
 
@@ -87,6 +99,7 @@ def build_module(
     content: str | None = None,
     data_model: RSDataModel | None = None,
     ignore_attributes: list[str] = [],
+    numpy_arrays: bool = False,
 ) -> Library:
     """
     Create a data model module from a markdown file.
@@ -95,6 +108,7 @@ def build_module(
         path (pathlib.Path | str): Path to the markdown file.
         content (str | None): The content of the markdown file.
         data_model (RSDataModel | None): The data model. If None, it will be initialized from the path.
+        numpy_arrays (bool): Whether to back arrays of floats and integers by NumPy arrays.
 
     Returns:
         Library: A module containing the generated data model.
@@ -113,10 +127,25 @@ def build_module(
     else:
         raise ValueError("Either 'path' or 'data_model' must be provided")
 
+    if data_model:
+        build_args = None
+    elif path:
+        build_args = {"path": str(path)}
+    else:
+        build_args = {"content": content}
+
+    if build_args is not None:
+        build_args.update(
+            ignore_attributes=list(ignore_attributes),
+            numpy_arrays=numpy_arrays,
+        )
+
     global path_factory
     global references
     global module
+    global use_numpy_arrays
 
+    use_numpy_arrays = numpy_arrays
     references = {}
     path_factory = PathFactory(model=dm)
     module = Library(rust_model=dm, path_factory=path_factory)
@@ -124,10 +153,12 @@ def build_module(
     for rs_type in dm.model.objects:
         if rs_type.name in module:
             module[rs_type.name].__mdmodels__.path_factory = path_factory
+            module[rs_type.name].__mdmodels__.build_args = build_args
             continue
 
         py_type = build_type(dm, rs_type, module, ignore_attributes=ignore_attributes)
         py_type.__mdmodels__.path_factory = path_factory  # type: ignore
+        py_type.__mdmodels__.build_args = build_args  # type: ignore
 
         module[rs_type.name] = py_type
 
@@ -221,7 +252,14 @@ def build_type(
         else:
             dtype = dtypes[0]
 
-        if attribute.is_array:
+        is_numeric_array = (
+            use_numpy_arrays and attribute.is_array and dtype in (float, int)
+        )
+
+        if is_numeric_array:
+            np_dtype = NUMPY_DTYPES[dtype]
+            dtype = NUMERIC_ARRAYS[dtype]
+        elif attribute.is_array:
             dtype = list[dtype]
 
         if description := attribute.docstring:
@@ -231,6 +269,9 @@ def build_type(
 
         if not attribute.required and not attribute.is_array:
             dtype = dtype | None  # type: ignore
+        elif not attribute.required and is_numeric_array:
+            params["default_factory"] = partial(np.empty, 0, dtype=np_dtype)
+            del params["default"]
         elif not attribute.required and attribute.is_array:
             params["default_factory"] = list
             del params["default"]
@@ -22,18 +22,17 @@
 
 import asyncio
 from pathlib import Path
-from typing import Any, get_origin, Coroutine
-from xml.dom import minidom
+from typing import IO, Any, Coroutine, Iterable
 
 import jsonpath
+import numpy as np
 from pydantic import model_validator, ValidationError
 from pydantic_core import InitErrorDetails
 from pydantic_xml import BaseXmlModel
+from pydantic_xml.element.native import etree
 from rich.console import Console
 from rich.table import Table
 
-from mdmodels.utils import extract_dtype
-
 from .git_utils import create_github_url
 from .library import Library
 from .meta import DataModelMeta
@@ -49,6 +48,16 @@ class DataModel(
     A class to represent a data model with various utility methods.
     """
 
+    def __eq__(self, other: Any) -> bool:
+        try:
+            return super().__eq__(other)
+        except ValueError:
+            # NumPy-backed fields do not compare to a single boolean
+            return type(self) is type(other) and all(
+                _values_equal(getattr(self, name), getattr(other, name))
+                for name in type(self).model_fields
+            )
+
     def validate(self):  # noqa
         """
         Revalidate the dataset.
@@ -140,10 +149,10 @@ class DataModel(
         table.add_column("Type", style="magenta")
         table.add_column("Adder", style="green")
 
-        for name, field in cls.model_fields.items():
-            dtype = extract_dtype(field.annotation)
+        for name, field in cls.__mdmodels__.fields.items():  # type: ignore
+            dtype = field.dtype
 
-            if get_origin(field.annotation) is list:
+            if field.is_array:
                 dtype = list[dtype]
                 annot = (
                     repr(dtype).replace("pydantic_xml.model.", "").replace("[", r"\[")
@@ -182,12 +191,14 @@ class DataModel(
         cls,
         path: Path | str,
         ignore_attributes: list[str] = [],
+        numpy_arrays: bool = False,
     ) -> Library:
         """
         Create a data model from a markdown file.
 
         Args:
             path (Path | str): Path to the markdown file.
+            numpy_arrays (bool): Whether to back arrays of floats and integers by NumPy arrays.
 
         Returns:
             Library: A dotted dict containing the generated modules
@@ -197,13 +208,18 @@ class DataModel(
         if isinstance(path, Path):
             path = str(path)
 
-        return build_module(path, ignore_attributes=ignore_attributes)
+        return build_module(
+            path,
+            ignore_attributes=ignore_attributes,
+            numpy_arrays=numpy_arrays,
+        )
 
     @classmethod
     def from_markdown_string(
         cls,
         content: str,
         ignore_attributes: list[str] = [],
+        numpy_arrays: bool = False,
     ) -> Library:
         """
         Create a data model from a markdown string.
@@ -211,6 +227,7 @@ class DataModel(
         Args:
             content (str): The content of the markdown file.
             ignore_attributes (list[str]): A list of attributes to ignore.
+            numpy_arrays (bool): Whether to back arrays of floats and integers by NumPy arrays.
 
         Returns:
             Library: A dotted dict containing the generated modules
@@ -220,7 +237,11 @@ class DataModel(
         """
         from .create import build_module
 
-        return build_module(content=content, ignore_attributes=ignore_attributes)
+        return build_module(
+            content=content,
+            ignore_attributes=ignore_attributes,
+            numpy_arrays=numpy_arrays,
+        )
 
     @classmethod
     def from_json_schema(
@@ -325,6 +346,186 @@ class DataModel(
         """
         return jsonpath.findall_async(path, self.model_dump())
 
+    def diff(self, other: "DataModel") -> list[dict[str, Any]]:
+        """
+        Compute the JSON-Patch operations that turn this document into another.
+
+        List items are matched by primary key where possible, such that small
+        edits of large documents result in small patches.
+
+        Args:
+            other (DataModel): The modified document.
+
+        Returns:
+            list[dict[str, Any]]: The 'add', 'remove' and 'replace' operations.
+        """
+        from .diff import diff
+
+        return diff(self, other)
+
+    def apply_patch(self, operations: list[dict[str, Any]]) -> "DataModel":
+        """
+        Apply JSON-Patch operations to this document in place.
+
+        Only the values touched by the operations are validated.
+
+        Args:
+            operations (list[dict[str, Any]]): The operations to apply, e.g. from 'diff'.
+
+        Returns:
+            DataModel: The patched document.
+        """
+        from .diff import apply_patch
+
+        return apply_patch(self, operations)
+
+    def normalize_units(self, target: str | dict = "si"):
+        """
+        Convert the numeric values of the object to canonical units, in place.
+
+        A unit field named '<name>_unit' applies to the float field '<name>' next
+        to it only; other unit fields and float fields are left as they are.
+        Values that share a unit are converted together in one vectorized
+        operation, and the object is only changed once all conversions succeeded.
+
+        Args:
+            target (str | dict, optional): 'si' to convert to SI base units, or a
+                mapping of source units to target units. Defaults to 'si'.
+
+        Returns:
+            DataModel: The normalized object.
+
+        Raises:
+            ValueError: If a target has a different dimension than its source.
+        """
+        from .units.normalize import normalize_units
+
+        return normalize_units(self, target)
+
+    def fingerprint(self, exclude: list[str] | None = None) -> str:
+        """
+        Compute a stable content hash of the document.
+
+        The hash does not depend on field order or float formatting and can be
+        used as a cache key for derived artifacts. Subtree hashes are cached and
+        only recomputed for subtrees that changed.
+
+        Args:
+            exclude (list[str] | None): Names of volatile fields to exclude at any level.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest.
+        """
+        from .fingerprint import fingerprint
+
+        return fingerprint(self, exclude)
+
+    def save(self, directory: str | Path) -> Path:
+        """
+        Save the object as JSON metadata with its numeric arrays in '.npy' sidecars.
+
+        Args:
+            directory (str | Path): The target directory, created if missing.
+
+        Returns:
+            Path: The path of the written JSON file.
+        """
+        from .sidecar import save
+
+        return save(self, directory)
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True):
+        """
+        Load an object saved with 'save'.
+
+        Numeric arrays of NumPy-backed fields are opened as read-only memory maps
+        and only paged in when accessed, such that the metadata of large documents
+        can be inspected without reading their arrays.
+
+        Args:
+            directory (str | Path): The directory the object was saved to.
+            mmap (bool, optional): Whether to memory map the arrays. Defaults to True.
+
+        Returns:
+            DataModel: The loaded object.
+        """
+        from .sidecar import load
+
+        return load(cls, directory, mmap=mmap)
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize the object to a compact, schema-aware MessagePack buffer.
+
+        Enumerations are stored as ordinals, unit definitions as tuples and
+        numeric lists as typed binary arrays. The buffer can only be read with
+        the same data model. Requires the 'msgpack' extra.
+
+        Returns:
+            bytes: The MessagePack buffer.
+        """
+        from .binary import to_msgpack
+
+        return to_msgpack(self)
+
+    @classmethod
+    def from_msgpack(cls, buffer: bytes, trusted: bool = False):
+        """
+        Deserialize an object from a buffer created by 'to_msgpack'.
+
+        Args:
+            buffer (bytes): The MessagePack buffer.
+            trusted (bool, optional): Whether to skip validation and construct the object
+                directly. Only use this for buffers produced by this library. Defaults to False.
+
+        Returns:
+            DataModel: The deserialized object.
+        """
+        from .binary import from_msgpack
+
+        return from_msgpack(cls, buffer, trusted=trusted)
+
+    @classmethod
+    def load_trusted(cls, data: dict | str | bytes):
+        """
+        Load an object from trusted data, skipping validation.
+
+        The object is constructed directly along the type graph of the data model,
+        which is considerably faster than 'model_validate'. Strings and bytes are
+        parsed as XML if they start with a tag and as JSON otherwise. Only use this
+        for data that has been validated before or was produced by this library,
+        e.g. documents read back from your own storage.
+
+        Args:
+            data (dict | str | bytes): The data as dictionary, JSON or XML.
+
+        Returns:
+            DataModel: The loaded object.
+        """
+        from .trusted import load
+
+        return load(cls, data)
+
+    @classmethod
+    def lazy_load(cls, data: str | bytes | dict):
+        """
+        Parse a document into a proxy that validates its subtrees on first access.
+
+        Scalar fields are validated right away, nested objects and the elements
+        of lists of objects are validated when they are accessed. This saves the
+        validation of large documents of which only a few fields are used.
+
+        Args:
+            data (str | bytes | dict): The document as JSON or dictionary.
+
+        Returns:
+            LazyDocument: The proxy of the document.
+        """
+        from .lazy import lazy_load
+
+        return lazy_load(cls, data)
+
     def xml(
         self,
         encoding: str = "unicode",
@@ -344,9 +545,151 @@ class DataModel(
         if encoding == "bytes":
             return self.to_xml()
 
-        raw_xml = self.to_xml(encoding=None, skip_empty=skip_empty)
-        parsed_xml = minidom.parseString(raw_xml)
-        return parsed_xml.toprettyxml(indent="  ")
+        tree = self._pretty_xml_tree(skip_empty)
+        return (
+            '<?xml version="1.0" ?>\n' + etree.tostring(tree, encoding="unicode") + "\n"
+        )
+
+    def write_xml(
+        self,
+        path_or_fileobj: str | Path | IO[bytes],
+        skip_empty: bool = True,
+    ) -> None:
+        """
+        Writes the object as indented XML to a file without building the full string.
+
+        Args:
+            path_or_fileobj (str | Path | IO[bytes]): The target path or a binary file object.
+            skip_empty (bool, optional): Whether to skip empty fields. Defaults to True.
+        """
+        if isinstance(path_or_fileobj, Path):
+            path_or_fileobj = str(path_or_fileobj)
+
+        tree = etree.ElementTree(self._pretty_xml_tree(skip_empty))
+        tree.write(path_or_fileobj, encoding="utf-8", xml_declaration=True)
+
+    @classmethod
+    def read_jsonl(
+        cls,
+        path: str | Path,
+        workers: int | None = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Read and validate the records of a JSON Lines file.
+
+        Files ending in '.gz' or '.zst' are decompressed on the fly. With workers,
+        records are validated in a process pool and yielded in file order.
+
+        Args:
+            path (str | Path): The path of the JSON Lines file.
+            workers (int | None, optional): The number of worker processes. Defaults to None,
+                which validates the records in this process.
+            batch_size (int, optional): The number of lines sent to a worker at once. Defaults to 1000.
+
+        Returns:
+            JSONLReader: An iterable of validated objects, exposing throughput statistics in 'stats'.
+        """
+        from .jsonl import JSONLReader
+
+        return JSONLReader(cls, path, workers=workers, batch_size=batch_size)
+
+    @classmethod
+    def write_jsonl(
+        cls,
+        path: str | Path,
+        records: Iterable["DataModel | dict"],
+        buffer_size: int = 1 << 20,
+    ):
+        """
+        Write records to a JSON Lines file using buffered writes.
+
+        Files ending in '.gz' or '.zst' are compressed on the fly.
+
+        Args:
+            path (str | Path): The path of the JSON Lines file.
+            records (Iterable[DataModel | dict]): The records to write, e.g. from a generator.
+            buffer_size (int, optional): The number of bytes to buffer between writes. Defaults to 1 MiB.
+
+        Returns:
+            JSONLStats: The throughput statistics of the write.
+        """
+        from .jsonl import write_jsonl
+
+        return write_jsonl(cls, path, records, buffer_size=buffer_size)
+
+    @classmethod
+    def iter_xml(
+        cls,
+        path_or_fileobj: str | Path | IO[bytes],
+        item_path: str | None = None,
+    ):
+        """
+        Stream the repeated child objects of a large XML document.
+
+        The document is parsed incrementally and each child is validated and
+        yielded on its own, so memory use stays flat regardless of file size.
+
+        Args:
+            path_or_fileobj (str | Path | IO[bytes]): The source path or a binary file object.
+            item_path (str | None, optional): The XML path (e.g. 'measurements/measurement') or
+                field name of the list to stream. Defaults to the only list of objects of the model.
+
+        Returns:
+            XMLItemReader: An iterable of child objects, exposing the scalar values of the root
+                in its 'attributes'.
+
+        Raises:
+            ValueError: If the item path does not address a list of objects.
+        """
+        from .xml_stream import XMLItemReader
+
+        return XMLItemReader(cls, path_or_fileobj, item_path)
+
+    @classmethod
+    def xml_writer(
+        cls,
+        path_or_fileobj: str | Path | IO[bytes],
+        field: str | None = None,
+        values: dict[str, Any] | None = None,
+        skip_empty: bool = False,
+    ):
+        """
+        Create an incremental writer for documents with very large lists of objects.
+
+        The items of the list field are written one at a time, the output is
+        byte-identical to 'to_xml' of the complete document.
+
+        Args:
+            path_or_fileobj (str | Path | IO[bytes]): The target path or a binary file object.
+            field (str | None, optional): The XML path or name of the list field to stream.
+                Defaults to the only list of objects of the model.
+            values (dict[str, Any] | None, optional): The values of all other fields of the root.
+            skip_empty (bool, optional): Whether to skip empty fields. Defaults to False.
+
+        Returns:
+            XMLStreamWriter: A writer to be used as a context manager.
+
+        Raises:
+            ValueError: If the field does not address a list of objects.
+        """
+        from .xml_stream import XMLStreamWriter
+
+        return XMLStreamWriter(cls, path_or_fileobj, field, values, skip_empty)
+
+    def _pretty_xml_tree(self, skip_empty: bool):
+        """
+        Serializes the object to an element tree and indents it in place.
+
+        Args:
+            skip_empty (bool): Whether to skip empty fields.
+
+        Returns:
+            The indented root element of the serialized object.
+        """
+        tree = self.to_xml_tree(skip_empty=skip_empty)
+        etree.indent(tree, space="  ")
+        return tree
 
     @classmethod
     def json_paths(cls, leafs: bool = True) -> list[str]:
@@ -360,3 +703,13 @@ class DataModel(
         path_factory = cls.__mdmodels__.path_factory
 
         return path_factory.get_all_paths(cls.__name__, leafs=leafs)
+
+
+def _values_equal(value: Any, other: Any) -> bool:
+    """
+    Compare two field values, treating NumPy arrays as values.
+    """
+    if isinstance(value, np.ndarray) or isinstance(other, np.ndarray):
+        return np.array_equal(value, other)
+
+    return value == other
@@ -0,0 +1,325 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+
+from typing import Any
+
+import numpy as np
+from pydantic_core import to_jsonable_python
+
+from .datamodel import DataModel
+from .meta import field_adapter
+
+
+def diff(source: DataModel, target: DataModel) -> list[dict[str, Any]]:
+    """
+    Compute the JSON-Patch operations that turn 'source' into 'target'.
+
+    Both documents are walked once. Lists of data models are matched by their
+    primary key, such that insertions and removals do not cascade into changes
+    of all subsequent items. Lists without usable keys are compared by position.
+
+    Args:
+        source (DataModel): The original document.
+        target (DataModel): The modified document.
+
+    Returns:
+        list[dict[str, Any]]: The 'add', 'remove' and 'replace' operations.
+
+    Raises:
+        TypeError: If the documents are not of the same data model.
+    """
+    if type(source) is not type(target):
+        raise TypeError(
+            f"Cannot diff '{type(source).__name__}' against '{type(target).__name__}'."
+        )
+
+    operations = []
+    _diff_model(source, target, "", operations)
+
+    return operations
+
+
+def apply_patch(document: DataModel, operations: list[dict[str, Any]]) -> DataModel:
+    """
+    Apply JSON-Patch operations to a document in place.
+
+    Only the values touched by an operation are validated, using the type of
+    the field they are assigned to. Cross-references of the document are
+    checked once after all operations have been applied.
+
+    Args:
+        document (DataModel): The document to patch.
+        operations (list[dict[str, Any]]): The operations to apply.
+
+    Returns:
+        DataModel: The patched document.
+
+    Raises:
+        ValueError: If an operation is not supported or its path is invalid.
+    """
+    for operation in operations:
+        _apply_operation(document, operation)
+
+    if type(document).__mdmodels__.reference_paths:  # type: ignore
+        document.validate_references()
+
+    return document
+
+
+def _diff_value(source: Any, target: Any, path: str, operations: list) -> None:
+    """
+    Compare two values and record the operations needed to align them.
+    """
+    if isinstance(source, DataModel) and type(source) is type(target):
+        _diff_model(source, target, path, operations)
+    elif isinstance(source, list) and isinstance(target, list):
+        _diff_list(source, target, path, operations)
+    elif isinstance(source, np.ndarray) or isinstance(target, np.ndarray):
+        if not np.array_equal(source, target):
+            operations.append(_operation("replace", path, np.asarray(target).tolist()))
+    elif type(source) is not type(target) or source != target:
+        operations.append(_operation("replace", path, target))
+
+
+def _diff_model(source: DataModel, target: DataModel, path: str, operations: list):
+    """
+    Compare two instances of the same data model field by field.
+    """
+    for name, field in type(source).__mdmodels__.fields.items():  # type: ignore
+        if field.is_unit:
+            _diff_unit(
+                getattr(source, name),
+                getattr(target, name),
+                f"{path}/{_escape(name)}",
+                operations,
+            )
+        else:
+            _diff_value(
+                getattr(source, name),
+                getattr(target, name),
+                f"{path}/{_escape(name)}",
+                operations,
+            )
+
+
+def _diff_unit(source: Any, target: Any, path: str, operations: list) -> None:
+    """
+    Compare the values of a unit field as a whole.
+
+    Unit definitions are shared and frozen, hence a changed unit is replaced
+    and validated into a shared instance again instead of being patched.
+    """
+    target_value = to_jsonable_python(target)
+
+    if to_jsonable_python(source) != target_value:
+        operations.append({"op": "replace", "path": path, "value": target_value})
+
+
+def _diff_list(source: list, target: list, path: str, operations: list) -> None:
+    """
+    Compare two lists, matching data models by primary key where possible.
+    """
+    source_keys = _list_keys(source)
+    target_keys = _list_keys(target)
+
+    if source_keys is None or target_keys is None:
+        _diff_positional(source, target, path, operations)
+        return
+
+    source_index = {key: index for index, key in enumerate(source_keys)}
+    target_set = set(target_keys)
+
+    kept_in_source = [key for key in source_keys if key in target_set]
+    kept_in_target = [key for key in target_keys if key in source_index]
+
+    if kept_in_source != kept_in_target:
+        # Items have been reordered, which JSON-Patch cannot express compactly
+        operations.append(_operation("replace", path, target))
+        return
+
+    for index in reversed(range(len(source_keys))):
+        if source_keys[index] not in target_set:
+            operations.append(_operation("remove", f"{path}/{index}"))
+
+    for index, key in enumerate(target_keys):
+        if key not in source_index:
+            operations.append(_operation("add", f"{path}/{index}", target[index]))
+
+    for index, key in enumerate(target_keys):
+        if key in source_index:
+            _diff_value(
+                source[source_index[key]],
+                target[index],
+                f"{path}/{index}",
+                operations,
+            )
+
+
+def _diff_positional(source: list, target: list, path: str, operations: list):
+    """
+    Compare two lists item by item.
+    """
+    common = min(len(source), len(target))
+
+    for index in range(common):
+        _diff_value(source[index], target[index], f"{path}/{index}", operations)
+
+    for index in range(common, len(target)):
+        operations.append(_operation("add", f"{path}/{index}", target[index]))
+
+    for index in reversed(range(common, len(source))):
+        operations.append(_operation("remove", f"{path}/{index}"))
+
+
+def _list_keys(items: list) -> list | None:
+    """
+    Extract the primary keys of a list of data models.
+
+    Returns:
+        list | None: The keys, or None if the items cannot be matched by key.
+    """
+    if not items or not isinstance(items[0], DataModel):
+        return None
+
+    cls = type(items[0])
+    pk = cls.__mdmodels__.primary_key  # type: ignore
+
+    if pk is None or any(type(item) is not cls for item in items):
+        return None
+
+    keys = [getattr(item, pk) for item in items]
+
+    if None in keys or len(set(keys)) != len(keys):
+        return None
+
+    return keys
+
+
+def _operation(op: str, path: str, value: Any = None) -> dict[str, Any]:
+    """
+    Create a JSON-Patch operation.
+    """
+    if op == "remove":
+        return {"op": op, "path": path}
+
+    return {"op": op, "path": path, "value": to_jsonable_python(value)}
+
+
+def _escape(token: str) -> str:
+    """
+    Escape a JSON pointer token.
+    """
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    """
+    Unescape a JSON pointer token.
+    """
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _apply_operation(document: DataModel, operation: dict[str, Any]) -> None:
+    """
+    Apply a single operation to a document.
+
+    Args:
+        document (DataModel): The document to patch.
+        operation (dict[str, Any]): The operation to apply.
+
+    Raises:
+        ValueError: If the operation is not supported or its path is invalid.
+    """
+    op, path = operation["op"], operation["path"]
+
+    if op not in ("add", "remove", "replace"):
+        raise ValueError(f"Unsupported patch operation '{op}'.")
+
+    tokens = [_unescape(token) for token in path.split("/")[1:]]
+
+    if not tokens:
+        raise ValueError("Patching the document root is not supported.")
+
+    container: Any = document
+    owner, field = None, None
+
+    for token in tokens[:-1]:
+        if isinstance(container, DataModel):
+            owner, field = container, _check_field(container, token, path)
+            container = getattr(container, token)
+        else:
+            container = container[_list_index(container, token, path)]
+
+    last = tokens[-1]
+
+    if isinstance(container, DataModel):
+        name = _check_field(container, last, path)
+
+        if op == "remove":
+            value = container.model_fields[name].get_default(call_default_factory=True)
+        else:
+            value = field_adapter(type(container), name).validate_python(
+                operation["value"]
+            )
+
+        setattr(container, name, value)
+    elif isinstance(container, list):
+        if op == "remove":
+            del container[_list_index(container, last, path)]
+            return
+
+        item = field_adapter(type(owner), field).validate_python(  # type: ignore
+            [operation["value"]]
+        )[0]
+
+        if op == "add" and last == "-":
+            container.append(item)
+        elif op == "add":
+            container.insert(_list_index(container, last, path, insert=True), item)
+        else:
+            container[_list_index(container, last, path)] = item
+    else:
+        raise ValueError(f"Path '{path}' does not point into a data model or list.")
+
+
+def _check_field(model: DataModel, name: str, path: str) -> str:
+    """
+    Ensure that a path token refers to a field of the model.
+    """
+    if name not in type(model).__mdmodels__.fields:  # type: ignore
+        raise ValueError(
+            f"Field '{name}' of path '{path}' not found in '{type(model).__name__}'."
+        )
+
+    return name
+
+
+def _list_index(items: list, token: str, path: str, insert: bool = False) -> int:
+    """
+    Convert a path token into a valid list index.
+    """
+    upper = len(items) if insert else len(items) - 1
+
+    if not token.isdigit() or int(token) > upper:
+        raise ValueError(f"Invalid list index '{token}' in path '{path}'.")
+
+    return int(token)
@@ -0,0 +1,177 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+
+import hashlib
+import json
+import math
+import weakref
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+
+from .datamodel import DataModel
+
+# Per-instance cache of subtree fingerprints. Entries are keyed by id() and
+# removed once the instance is garbage collected. The cache is kept outside of
+# the instances, since pydantic compares private attributes in '__eq__'.
+_CACHE: dict[int, tuple[weakref.ref, dict]] = {}
+
+
+def fingerprint(
+    document: DataModel,
+    exclude: Iterable[str] | None = None,
+) -> str:
+    """
+    Compute a stable content hash of a document.
+
+    The hash is computed over a canonical encoding with sorted keys, normalized
+    floats and units compared by their canonical form rather than their names.
+    Each subtree is hashed separately and cached together with the values it
+    was computed from, such that re-hashing a modified document only re-hashes
+    the modified subtrees.
+
+    Args:
+        document (DataModel): The document to hash.
+        exclude (Iterable[str] | None): Names of volatile fields to exclude at any level.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest.
+    """
+    return _digest(document, frozenset(exclude or ()))
+
+
+def _digest(node: DataModel, exclude: frozenset[str]) -> str:
+    """
+    Compute the fingerprint of a single node, reusing the cached one if unchanged.
+    """
+    snapshot = _snapshot(node, exclude)
+    cache = _cache_for(node)
+    cached = cache.get(exclude)
+
+    if cached is not None and cached[0] == snapshot:
+        return cached[1]
+
+    encoded = json.dumps(
+        [type(node).__name__, snapshot],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    cache[exclude] = (snapshot, digest)
+
+    return digest
+
+
+def _snapshot(node: DataModel, exclude: frozenset[str]) -> Any:
+    """
+    Build the canonical representation of a node.
+
+    Nested data models are represented by their fingerprint, such that the
+    snapshot of a node only grows with its direct fields.
+    """
+    from .units.unit_definition import UnitDefinition
+
+    if isinstance(node, UnitDefinition):
+        return _unit_snapshot(node)
+
+    return [
+        [name, _canonical(getattr(node, name), exclude)]
+        for name in sorted(type(node).__mdmodels__.fields)  # type: ignore
+        if name not in exclude
+    ]
+
+
+def _unit_snapshot(unit) -> list:
+    """
+    Represent a unit by its canonical form, ignoring its id and name.
+
+    Equal units hash equally however their base units are written down,
+    e.g. 'mmol / l' and 'mol / m3'.
+    """
+    dimensions, multiplier, scale, offset = unit.canonical
+
+    return [
+        [list(dimension) for dimension in dimensions],
+        _canonical_float(multiplier),
+        scale,
+        _canonical_float(offset),
+    ]
+
+
+def _canonical(value: Any, exclude: frozenset[str]) -> Any:
+    """
+    Convert a field value into its canonical JSON-compatible form.
+    """
+    if isinstance(value, DataModel):
+        return {"#": _digest(value, exclude)}
+    elif isinstance(value, list):
+        return [_canonical(item, exclude) for item in value]
+    elif isinstance(value, np.ndarray):
+        return [_canonical(item, exclude) for item in value.tolist()]
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, float):
+        return _canonical_float(value)
+    elif isinstance(value, bytes):
+        return value.hex()
+
+    return value
+
+
+def _canonical_float(value: float) -> float | str:
+    """
+    Normalize a float, mapping negative zero to zero and non-finite values to strings.
+    """
+    if math.isnan(value) or math.isinf(value):
+        return repr(value)
+
+    return value + 0.0
+
+
+def _cache_for(node: DataModel) -> dict:
+    """
+    Get the fingerprint cache of an instance.
+    """
+    key = id(node)
+    entry = _CACHE.get(key)
+
+    if entry is not None and entry[0]() is node:
+        return entry[1]
+
+    cache: dict = {}
+    _CACHE[key] = (weakref.ref(node, lambda ref, key=key: _evict(key, ref)), cache)
+
+    return cache
+
+
+def _evict(key: int, ref: weakref.ref):
+    """
+    Remove the cache of a collected instance.
+
+    The id of a collected instance may already be reused by a new instance
+    with its own cache, which must be kept.
+    """
+    entry = _CACHE.get(key)
+
+    if entry is not None and entry[0] is ref:
+        del _CACHE[key]
@@ -0,0 +1,308 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import gzip
+import io
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Generator, Iterable
+
+from pydantic import BaseModel
+
+from .datamodel import DataModel
+from .trusted import construct
+
+_WORKER_MODEL: type[DataModel] | None = None
+
+
+class JSONLStats(BaseModel):
+    """
+    Throughput statistics of reading or writing a JSON Lines file.
+
+    Attributes:
+        records (int): The number of records processed.
+        bytes (int): The number of uncompressed bytes processed.
+        seconds (float): The wall-clock time spent processing.
+    """
+
+    records: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        """
+        The number of records processed per second.
+        """
+        return self.records / self.seconds if self.seconds else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """
+        The number of uncompressed megabytes processed per second.
+        """
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+
+class JSONLReader:
+    """
+    Reads and validates the records of a JSON Lines file.
+
+    Records are yielded in file order. With workers, batches of lines are
+    validated in a process pool while the next batches are being read. The
+    workers rebuild the data model from the specification it was created from,
+    and the validated records are reassembled in this process without being
+    validated a second time.
+
+    Files ending in '.gz' are read with gzip, files ending in '.zst' or '.zstd'
+    with zstandard, which must be installed separately.
+
+    Attributes:
+        model (type[DataModel]): The data model of the records.
+        stats (JSONLStats): Throughput statistics, updated while iterating.
+    """
+
+    def __init__(
+        self,
+        model: type[DataModel],
+        path: str | Path,
+        workers: int | None = None,
+        batch_size: int = 1000,
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+
+        self.model = model
+        self.path = Path(path)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.stats = JSONLStats()
+
+    def __iter__(self) -> Generator[DataModel, None, None]:
+        self.stats = JSONLStats()
+        start = time.perf_counter()
+
+        with open_jsonl(self.path, "rb") as f:
+            if self.workers:
+                records = self._validate_parallel(f)
+            else:
+                records = self._validate(f)
+
+            for record in records:
+                self.stats.records += 1
+                self.stats.seconds = time.perf_counter() - start
+                yield record
+
+        self.stats.seconds = time.perf_counter() - start
+
+    def _lines(self, f: IO[bytes]) -> Generator[bytes, None, None]:
+        """
+        Yield the non-empty lines of the file.
+        """
+        for line in f:
+            self.stats.bytes += len(line)
+
+            if line.strip():
+                yield line
+
+    def _validate(self, f: IO[bytes]) -> Generator[DataModel, None, None]:
+        """
+        Validate the lines of the file one after another.
+        """
+        for line in self._lines(f):
+            yield self.model.model_validate_json(line)
+
+    def _validate_parallel(self, f: IO[bytes]) -> Generator[DataModel, None, None]:
+        """
+        Validate batches of lines in a process pool, keeping their order.
+        """
+        pending = deque()
+        window = 2 * self.workers  # type: ignore
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(_model_spec(self.model),),
+        ) as pool:
+            for batch in _batched(self._lines(f), self.batch_size):
+                pending.append(pool.submit(_validate_batch, batch))
+
+                if len(pending) >= window:
+                    yield from self._construct(pending.popleft().result())
+
+            while pending:
+                yield from self._construct(pending.popleft().result())
+
+    def _construct(self, batch: list[dict]) -> Generator[DataModel, None, None]:
+        """
+        Reassemble validated records without validating them again.
+        """
+        for data in batch:
+            yield construct(self.model, data)  # type: ignore
+
+
+def write_jsonl(
+    model: type[DataModel],
+    path: str | Path,
+    records: Iterable[DataModel | dict],
+    buffer_size: int = 1 << 20,
+) -> JSONLStats:
+    """
+    Write records to a JSON Lines file.
+
+    Serialized lines are collected in a buffer of roughly 'buffer_size' bytes
+    before being written. Dictionaries are validated against the model first.
+
+    Args:
+        model (type[DataModel]): The data model of the records.
+        path (str | Path): The target file, compressed according to its extension.
+        records (Iterable[DataModel | dict]): The records to write.
+        buffer_size (int, optional): The number of bytes to buffer between writes.
+
+    Returns:
+        JSONLStats: The throughput statistics of the write.
+    """
+    stats = JSONLStats()
+    start = time.perf_counter()
+    buffer: list[bytes] = []
+    buffered = 0
+
+    with open_jsonl(Path(path), "wb") as f:
+        for record in records:
+            if not isinstance(record, model):
+                record = model.model_validate(record)
+
+            line = record.model_dump_json().encode() + b"\n"
+            buffer.append(line)
+            buffered += len(line)
+            stats.records += 1
+
+            if buffered >= buffer_size:
+                f.write(b"".join(buffer))
+                stats.bytes += buffered
+                buffer.clear()
+                buffered = 0
+
+        f.write(b"".join(buffer))
+        stats.bytes += buffered
+
+    stats.seconds = time.perf_counter() - start
+
+    return stats
+
+
+def open_jsonl(path: Path, mode: str) -> IO[bytes]:
+    """
+    Open a JSON Lines file in binary mode, compressed according to its extension.
+
+    Args:
+        path (Path): The path of the file.
+        mode (str): Either 'rb' or 'wb'.
+
+    Returns:
+        IO[bytes]: The opened file.
+
+    Raises:
+        ImportError: If a zstandard file is opened without zstandard installed.
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore
+
+    if path.suffix in (".zst", ".zstd"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading and writing zstandard files requires the 'zstandard' package. "
+                "Install it with 'pip install zstandard'."
+            )
+
+        if mode == "rb":
+            return io.BufferedReader(zstandard.open(path, mode))  # type: ignore
+
+        return zstandard.open(path, mode)  # type: ignore
+
+    return open(path, mode)  # type: ignore
+
+
+def _model_spec(model: type[DataModel]) -> Any:
+    """
+    Describe the model in a way that can be sent to worker processes.
+
+    Generated models cannot be pickled and are rebuilt from the arguments of
+    'build_module' instead. Models defined in code are pickled by reference.
+    """
+    build_args = model.__mdmodels__.build_args  # type: ignore
+
+    if build_args is not None:
+        return build_args, model.__name__
+
+    if model.__module__ == "pydantic_xml.model":
+        raise ValueError(
+            f"Model '{model.__name__}' cannot be rebuilt in worker processes. "
+            "Parallel validation requires a model built from a markdown specification."
+        )
+
+    return model
+
+
+def _init_worker(spec: Any):
+    """
+    Set up the data model of a worker process.
+    """
+    global _WORKER_MODEL
+
+    if isinstance(spec, tuple):
+        from .create import build_module
+
+        build_args, name = spec
+        _WORKER_MODEL = build_module(**build_args)[name]
+    else:
+        _WORKER_MODEL = spec
+
+
+def _validate_batch(lines: list[bytes]) -> list[dict]:
+    """
+    Validate a batch of lines in a worker process.
+    """
+    model = _WORKER_MODEL
+    assert model is not None, "Worker has not been initialized"
+
+    return [model.model_validate_json(line).model_dump(mode="json") for line in lines]
+
+
+def _batched(lines: Iterable[bytes], size: int) -> Generator[list[bytes], None, None]:
+    """
+    Group lines into lists of at most 'size' lines.
+    """
+    batch = []
+
+    for line in lines:
+        batch.append(line)
+
+        if len(batch) == size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
@@ -0,0 +1,282 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import InitErrorDetails, from_json, to_json, to_jsonable_python
+
+from .datamodel import DataModel
+from .meta import field_adapter
+
+_UNSET = object()
+
+
+class LazyDocument:
+    """
+    A read-mostly proxy of a document that validates its subtrees on first access.
+
+    Scalar fields are validated when the proxy is created. Fields holding
+    objects stay raw until they are accessed; single objects are then
+    validated into data model instances and lists of objects are returned as
+    a 'LazyList', which validates its elements one by one. Validated values
+    are cached, untouched subtrees are passed through by 'model_dump'.
+
+    Model validators, such as the check of cross references, only run on the
+    subtrees that are validated. Use 'materialize' to obtain a fully validated
+    instance.
+
+    Args:
+        model (type[DataModel]): The data model of the document.
+        data (dict[str, Any]): The parsed document.
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: type[DataModel], data: dict[str, Any]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_raw", {})
+        object.__setattr__(self, "_values", {})
+
+        fields = model.__mdmodels__.fields  # type: ignore
+        errors = []
+
+        for name, info in model.model_fields.items():
+            if name not in data:
+                if info.is_required():
+                    errors.append({"type": "missing", "loc": (name,), "input": data})
+                else:
+                    self._values[name] = info.get_default(call_default_factory=True)
+            elif fields[name].is_model and data[name] is not None:
+                self._raw[name] = data[name]
+            else:
+                try:
+                    self._values[name] = field_adapter(model, name).validate_python(
+                        data[name]
+                    )
+                except ValidationError as e:
+                    errors += [_prefix_error(name, error) for error in e.errors()]
+
+        if errors:
+            raise ValidationError.from_exception_data(model.__name__, errors)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        elif name not in self._raw:
+            raise AttributeError(
+                f"'{self._model.__name__}' object has no attribute '{name}'"
+            )
+
+        raw = self._raw[name]
+        field = self._model.__mdmodels__.fields[name]  # type: ignore
+
+        if field.is_array and isinstance(raw, list):
+            value = LazyList(self._model, name, raw)
+        else:
+            value = field_adapter(self._model, name).validate_python(raw)
+
+        # Invalid subtrees stay raw, such that every access raises again
+        self._values[name] = value
+        del self._raw[name]
+
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        if name not in self._model.model_fields:
+            raise AttributeError(
+                f"'{self._model.__name__}' object has no field '{name}'"
+            )
+
+        self._raw.pop(name, None)
+        self._values[name] = field_adapter(self._model, name).validate_python(value)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={self._values[name]!r}" if name in self._values else f"{name}=..."
+            for name in self._model.model_fields
+        )
+        return f"Lazy{self._model.__name__}({fields})"
+
+    @property
+    def model(self) -> type[DataModel]:
+        """
+        The data model of the document.
+        """
+        return self._model
+
+    @property
+    def validated_fields(self) -> set[str]:
+        """
+        The names of the fields that have been validated.
+        """
+        return set(self._values)
+
+    def model_dump(self, mode: str = "python", exclude_none: bool = False) -> dict:
+        """
+        Dump the document to a dictionary.
+
+        Validated fields are dumped as usual, untouched subtrees are passed
+        through as they were parsed.
+
+        Args:
+            mode (str, optional): The dump mode, 'python' or 'json'. Defaults to 'python'.
+            exclude_none (bool, optional): Whether to exclude None values. Defaults to False.
+
+        Returns:
+            dict: The dumped document.
+        """
+        data = {}
+
+        for name in self._model.model_fields:
+            if name in self._raw:
+                value = self._raw[name]
+            else:
+                value = _dump(self._values[name], mode, exclude_none)
+
+            if value is not None or not exclude_none:
+                data[name] = value
+
+        return data
+
+    def model_dump_json(self, exclude_none: bool = False) -> str:
+        """
+        Dump the document to a JSON string.
+
+        Args:
+            exclude_none (bool, optional): Whether to exclude None values. Defaults to False.
+
+        Returns:
+            str: The JSON string.
+        """
+        data = self.model_dump(mode="json", exclude_none=exclude_none)
+        return to_json(data).decode()
+
+    def materialize(self) -> DataModel:
+        """
+        Validate the whole document into a data model instance.
+
+        Returns:
+            DataModel: The validated document.
+        """
+        return self._model.model_validate(self.model_dump())
+
+
+class LazyList(Sequence):
+    """
+    A list of objects that validates its elements on first access.
+
+    Attributes:
+        model (type[DataModel]): The data model owning the field.
+        field (str): The name of the field holding the list.
+    """
+
+    def __init__(self, model: type[DataModel], field: str, raw: list[Any]):
+        self.model = model
+        self.field = field
+        self._raw = raw
+        self._items: list[Any] = [_UNSET] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        item = self._items[index]
+
+        if item is _UNSET:
+            raw = self._raw[index]
+            item = self._items[index] = field_adapter(
+                self.model, self.field
+            ).validate_python([raw])[0]
+
+        return item
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyList):
+            other = list(other)
+
+        return isinstance(other, list) and list(self) == other
+
+    def __repr__(self) -> str:
+        items = ", ".join("..." if i is _UNSET else repr(i) for i in self._items)
+        return f"LazyList([{items}])"
+
+    def dump(self, mode: str = "python", exclude_none: bool = False) -> list[Any]:
+        """
+        Dump the list, passing untouched elements through.
+        """
+        return [
+            raw if item is _UNSET else _dump(item, mode, exclude_none)
+            for raw, item in zip(self._raw, self._items)
+        ]
+
+
+def lazy_load(model: type[DataModel], data: str | bytes | dict) -> LazyDocument:
+    """
+    Parse a document into a proxy that validates its subtrees on first access.
+
+    Args:
+        model (type[DataModel]): The data model of the document.
+        data (str | bytes | dict): The document as JSON or dictionary.
+
+    Returns:
+        LazyDocument: The proxy of the document.
+    """
+    if not isinstance(data, dict):
+        data = from_json(data)
+
+    return LazyDocument(model, data)
+
+
+def _dump(value: Any, mode: str, exclude_none: bool) -> Any:
+    """
+    Dump a validated value of a field.
+    """
+    if isinstance(value, LazyList):
+        return value.dump(mode, exclude_none)
+    elif isinstance(value, BaseModel):
+        return value.model_dump(mode=mode, exclude_none=exclude_none)
+    elif isinstance(value, list):
+        return [_dump(item, mode, exclude_none) for item in value]
+    elif mode == "json":
+        return to_jsonable_python(value)
+
+    return value
+
+
+def _prefix_error(name: str, error: dict[str, Any]) -> InitErrorDetails:
+    """
+    Re-raise a validation error of a field at the location of the field.
+    """
+    details = InitErrorDetails(
+        type=error["type"],
+        loc=(name, *error["loc"]),
+        input=error["input"],
+    )
+
+    if "ctx" in error:
+        details["ctx"] = error["ctx"]
+
+    return details
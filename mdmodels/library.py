@@ -22,7 +22,8 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Generator, List, Optional, Type
+from pathlib import Path
+from typing import Any, Generator, Iterable, List, Optional, Type
 
 import pandas as pd
 from dotted_dict import DottedDict
@@ -45,6 +46,26 @@ SQL_TYPE_MAPPING = {
 }
 
 
+def primary_key_attribute(obj) -> str:
+    """
+    Determine the primary key attribute of an object.
+
+    The primary key is the first attribute carrying one of the PK options,
+    falling back to 'id' if none is marked.
+
+    Args:
+        obj: The object of the Rust model.
+
+    Returns:
+        str: The name of the primary key attribute.
+    """
+    for attr in obj.attributes:
+        if extract_option(attr, PK_KEYS):
+            return attr.name
+
+    return "id"
+
+
 class CrossConnection(BaseModel):
     source_type: str
     source_attr: str | None = None
@@ -77,6 +98,7 @@ class Library(DottedDict):
         self._rust_model = rust_model
         self._path_factory = path_factory
         self._cross_connections: list[CrossConnection] = []
+        self._connection_index: dict[str, dict[str, CrossConnection]] = {}
 
     def __repr__(self):
         rep_str = ""
@@ -149,6 +171,7 @@ class Library(DottedDict):
         if source_type in enums or target_type in enums:
             return
 
+        self._connection_index.clear()
         self._cross_connections.append(
             CrossConnection(
                 source_type=source_type,
@@ -176,6 +199,28 @@ class Library(DottedDict):
             if connection.source_type == obj_name
         ]
 
+    def get_object_connection_map(self, obj_name: str) -> dict[str, CrossConnection]:
+        """
+        Get the cross connections for an object, keyed by source attribute.
+
+        The mapping is built once per object and reused for subsequent lookups.
+
+        Args:
+            obj_name (str): The object name.
+
+        Returns:
+            dict[str, CrossConnection]: The cross connections keyed by source attribute.
+        """
+        if obj_name not in self._connection_index:
+            connections = {}
+
+            for connection in self.get_object_connections(obj_name):
+                connections.setdefault(connection.source_attr, connection)
+
+            self._connection_index[obj_name] = connections
+
+        return self._connection_index[obj_name]
+
     def resolve_target_primary_keys(self, overwrite: bool = False):
         """
         Resolve the primary keys for target attributes in cross connections.
@@ -193,13 +238,7 @@ class Library(DottedDict):
                 continue
 
             obj = extract_object(connection.target_type, self._rust_model)
-            pk_attr = "id"
-
-            for attr in obj.attributes:
-                if extract_option(attr, PK_KEYS):
-                    pk_attr = attr.name
-                    break
-            connection.target_attr = pk_attr
+            connection.target_attr = primary_key_attribute(obj)
 
     def sql_schema(self, mode="tabular"):
         """
@@ -245,6 +284,81 @@ class Library(DottedDict):
             tables[obj.name] = pd.DataFrame(table).to_markdown(index=False)
         return tables
 
+    def to_arrow(self, documents: Iterable[Any], root: str):
+        """
+        Convert documents into an Arrow table with a schema derived from the data model.
+
+        Single objects become nested structs, arrays become lists and enumerations
+        are dictionary encoded. Requires the 'arrow' extra.
+
+        Args:
+            documents (Iterable[DataModel | dict]): The documents, one per row.
+            root (str): The name of the object type of the documents.
+
+        Returns:
+            pyarrow.Table: The documents as an Arrow table.
+        """
+        from mdmodels.arrow import to_arrow
+
+        return to_arrow(documents, self._root_model(root))
+
+    def to_parquet(
+        self,
+        path: str | Path,
+        documents: Iterable[Any],
+        root: str,
+        row_group_size: int = 10_000,
+    ) -> int:
+        """
+        Write documents to a Parquet file, one row group at a time.
+
+        Requires the 'arrow' extra.
+
+        Args:
+            path (str | Path): The target Parquet file.
+            documents (Iterable[DataModel | dict]): The documents, e.g. from a generator.
+            root (str): The name of the object type of the documents.
+            row_group_size (int): The number of documents per row group.
+
+        Returns:
+            int: The number of written documents.
+        """
+        from mdmodels.arrow import to_parquet
+
+        return to_parquet(path, documents, self._root_model(root), row_group_size)
+
+    def from_parquet(self, path: str | Path, root: str, batch_size: int = 10_000):
+        """
+        Lazily read documents from a Parquet file written by 'to_parquet'.
+
+        Requires the 'arrow' extra.
+
+        Args:
+            path (str | Path): The Parquet file to read.
+            root (str): The name of the object type of the documents.
+            batch_size (int): The number of rows read at once.
+
+        Returns:
+            Generator[DataModel, None, None]: The validated documents in row order.
+        """
+        from mdmodels.arrow import from_parquet
+
+        return from_parquet(path, self._root_model(root), batch_size)
+
+    def _root_model(self, root: str):
+        """
+        Look up the data model of an object type by name.
+
+        Raises:
+            ValueError: If the library does not contain the object type.
+        """
+        model = self.get(root)
+
+        if not isinstance(model, DataModelMeta):
+            raise ValueError(f"Object '{root}' not found in the data model.")
+
+        return model
+
     def models(self) -> Generator[tuple[str, Type[BaseModel]], None, None]:
         """
         Iterate over the models in the data_model.
@@ -19,13 +19,67 @@
 #   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
-from pydantic import BaseModel, Field
+import types
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, Any, ForwardRef, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from pydantic_xml.fields import XmlEntityInfo
 from pydantic_xml.model import XmlModelMeta  # noqa
+from pydantic_xml.typedefs import EntityLocation
 
 from .path import PathFactory
 from .reference import ReferenceContext
 
 
+class FieldMeta(BaseModel):
+    """
+    Precomputed type information of a single field of a data model.
+
+    Generic traversals (dumping, reference walking, SQL conversion) use this
+    table instead of introspecting the field annotations over and over again.
+
+    Attributes:
+        name (str): The name of the field.
+        annotation (Any): The full annotation of the field.
+        dtypes (tuple[Any, ...]): The underlying classes, stripped of lists, optionals and annotations.
+        is_array (bool): Whether the field holds a list of values.
+        is_optional (bool): Whether the field accepts None.
+        is_union (bool): Whether the field accepts more than one type.
+        is_model (bool): Whether any of the underlying classes is a data model.
+        is_enum (bool): Whether the underlying class is an enumeration.
+        is_unit (bool): Whether the underlying class is a unit definition.
+        is_numpy (bool): Whether the list is backed by a NumPy array.
+        is_xml_attr (bool): Whether the field is serialized as an XML attribute.
+        xml_tag (str): The XML tag or attribute name of the field.
+        xml_wrapper (str | None): The path of the XML element wrapping the field, if any.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    name: str
+    annotation: Any
+    dtypes: tuple[Any, ...]
+    is_array: bool = False
+    is_optional: bool = False
+    is_union: bool = False
+    is_model: bool = False
+    is_enum: bool = False
+    is_unit: bool = False
+    is_numpy: bool = False
+    is_xml_attr: bool = False
+    xml_tag: str
+    xml_wrapper: str | None = None
+
+    @property
+    def dtype(self) -> Any:
+        """
+        The first underlying class of the field.
+        """
+        return _resolve_forward_ref(self.dtypes[0])
+
+
 class MetaConfig(BaseModel):
     """
     Configuration class that contains all the metaclass options to control DataModel classes.
@@ -33,6 +87,7 @@ class MetaConfig(BaseModel):
     Attributes:
         reference_paths (list[ReferenceContext]): A list of reference paths to validate within a data model.
         path_factory (PathFactory | None): The path factory for the data model.
+        build_args (dict[str, Any] | None): The arguments of 'build_module' that created the data model.
     """
 
     reference_paths: list[ReferenceContext] = Field(
@@ -45,6 +100,69 @@ class MetaConfig(BaseModel):
         description="The path factory for the data model.",
     )
 
+    build_args: dict[str, Any] | None = Field(
+        None,
+        description="The arguments of 'build_module' that created the data model, used to rebuild it in other processes.",
+    )
+
+    _owner: Any = PrivateAttr(None)
+    _fields: dict[str, FieldMeta] | None = PrivateAttr(None)
+    _primary_key: str | None = PrivateAttr(None)
+
+    @property
+    def fields(self) -> dict[str, FieldMeta]:
+        """
+        The field metadata table of the data model.
+
+        The table is computed once per class. Classes with unresolved forward
+        references are rebuilt first, which is what pydantic does on first use.
+
+        Returns:
+            dict[str, FieldMeta]: The metadata of each field, keyed by field name.
+        """
+        if self._fields is None:
+            owner = self._owner
+
+            if not owner.__pydantic_complete__:
+                owner.model_rebuild(raise_errors=False)
+
+            self._fields = {
+                name: _extract_field_meta(name, field)
+                for name, field in owner.model_fields.items()
+            }
+
+        return self._fields
+
+    @property
+    def primary_key(self) -> str | None:
+        """
+        The primary key field of the data model, if it has one.
+
+        The primary key is detected the same way as for cross connections,
+        see 'Library.resolve_target_primary_keys'.
+
+        Returns:
+            str | None: The name of the primary key field.
+        """
+        from .library import primary_key_attribute
+        from .utils import extract_object
+
+        if self._primary_key is None:
+            pk = None
+
+            if self.path_factory is not None:
+                try:
+                    obj = extract_object(self._owner.__name__, self.path_factory.model)
+                    pk = primary_key_attribute(obj)
+                except ValueError:
+                    pk = None
+            elif "id" in self.fields:
+                pk = "id"
+
+            self._primary_key = pk if pk in self.fields else ""
+
+        return self._primary_key or None
+
 
 class DataModelMeta(XmlModelMeta):
     """
@@ -70,10 +188,16 @@ class DataModelMeta(XmlModelMeta):
 
         new_class = super().__new__(cls, name, bases, dct, **kwargs)
 
+        config = MetaConfig()
+        config._owner = new_class
+
+        if new_class.__pydantic_complete__:
+            config.fields  # noqa: B018
+
         setattr(
             new_class,
             "__mdmodels__",
-            MetaConfig(),
+            config,
         )
 
         return new_class
@@ -94,3 +218,183 @@ class DataModelMeta(XmlModelMeta):
             source_path=source_path,
             target_path=target_path,
         )
+
+
+@lru_cache(maxsize=1024)
+def field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    """
+    Create a type adapter validating values of a single field of a model.
+
+    Adapters are cached per model and field, such that single values can be
+    validated repeatedly without validating the whole model.
+
+    Args:
+        model (type[BaseModel]): The model owning the field.
+        name (str): The name of the field.
+
+    Returns:
+        TypeAdapter: The type adapter of the field.
+    """
+    return TypeAdapter(model.model_fields[name].rebuild_annotation())
+
+
+def select_model(field: FieldMeta, value: dict[str, Any]) -> type[BaseModel]:
+    """
+    Select the model of a (union) field that accepts all keys of the data.
+
+    Args:
+        field (FieldMeta): The metadata of the field.
+        value (dict[str, Any]): The data of the object.
+
+    Returns:
+        type[BaseModel]: The model to build the object with.
+    """
+    if not field.is_union:
+        return field.dtype
+
+    return candidate_models(field, value)[0]
+
+
+def candidate_models(field: FieldMeta, value: dict[str, Any]) -> list[type[BaseModel]]:
+    """
+    Find the models of a union field that accept all keys of the data.
+
+    Falls back to all models of the field if none of them accepts the keys.
+
+    Args:
+        field (FieldMeta): The metadata of the field.
+        value (dict[str, Any]): The data of the object.
+
+    Returns:
+        list[type[BaseModel]]: The candidate models, in the order of the field types.
+    """
+    keys = set(value)
+    dtypes = [_resolve_forward_ref(dtype) for dtype in field.dtypes]
+    models = [
+        dtype
+        for dtype in dtypes
+        if isinstance(dtype, type) and issubclass(dtype, BaseModel)
+    ]
+
+    return [m for m in models if keys <= set(m.model_fields)] or models
+
+
+def _extract_field_meta(name: str, field) -> FieldMeta:
+    """
+    Extract the metadata of a single model field.
+
+    Args:
+        name (str): The name of the field.
+        field (FieldInfo): The pydantic field info.
+
+    Returns:
+        FieldMeta: The metadata of the field.
+    """
+    from mdmodels.units.unit_definition import UnitDefinition
+
+    annotation = field.annotation
+    is_array = False
+    is_optional = False
+
+    members = _union_members(annotation)
+    if type(None) in members:
+        is_optional = True
+        members = tuple(m for m in members if m is not type(None))
+
+    if numeric_array := _find_numeric_array(field, members):
+        is_array = True
+        members = (numeric_array.dtype,)
+    elif len(members) == 1 and get_origin(members[0]) is list:
+        is_array = True
+        members = _union_members(get_args(members[0])[0])
+
+    dtypes = tuple(_strip_annotated(member) for member in members)
+    resolved = [_resolve_forward_ref(dtype) for dtype in dtypes]
+
+    xml_attr, xml_tag, xml_wrapper = _extract_xml_info(name, field)
+
+    return FieldMeta(
+        name=name,
+        annotation=annotation,
+        dtypes=dtypes,
+        is_array=is_array,
+        is_optional=is_optional,
+        is_union=len(dtypes) > 1,
+        is_model=any(
+            isinstance(dtype, (DataModelMeta, ForwardRef)) for dtype in resolved
+        ),
+        is_enum=isinstance(resolved[0], type) and issubclass(resolved[0], Enum),
+        is_unit=resolved[0] is UnitDefinition,
+        is_numpy=numeric_array is not None,
+        is_xml_attr=xml_attr,
+        xml_tag=xml_tag,
+        xml_wrapper=xml_wrapper,
+    )
+
+
+def _union_members(annotation) -> tuple:
+    """
+    Split a union into its members or wrap a single type.
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        return get_args(annotation)
+
+    return (annotation,)
+
+
+def _find_numeric_array(field, members: tuple):
+    """
+    Find the NumPy array marker of a field, if the field is backed by an array.
+    """
+    from mdmodels.arrays import NumericArray
+
+    metadata = list(field.metadata)
+
+    if len(members) == 1 and get_origin(members[0]) is Annotated:
+        metadata += get_args(members[0])[1:]
+
+    return next((m for m in metadata if isinstance(m, NumericArray)), None)
+
+
+def _strip_annotated(annotation):
+    """
+    Remove the 'Annotated' wrapper of a type, if present.
+    """
+    if get_origin(annotation) is Annotated:
+        return get_args(annotation)[0]
+
+    return annotation
+
+
+def _resolve_forward_ref(dtype):
+    """
+    Return the evaluated type of a forward reference, if it has been evaluated.
+    """
+    if isinstance(dtype, ForwardRef) and dtype.__forward_evaluated__:
+        return dtype.__forward_value__
+
+    return dtype
+
+
+def _extract_xml_info(name: str, field) -> tuple[bool, str, str | None]:
+    """
+    Extract the XML location of a field.
+
+    Args:
+        name (str): The name of the field.
+        field (FieldInfo): The pydantic field info.
+
+    Returns:
+        tuple[bool, str, str | None]: Whether the field is an attribute, its tag and its wrapper path.
+    """
+    entity = next((m for m in field.metadata if isinstance(m, XmlEntityInfo)), None)
+
+    if entity is None:
+        return False, name, None
+
+    if entity.location == EntityLocation.WRAPPED:
+        inner = entity.wrapped
+        tag = inner.path if inner is not None and inner.path else name
+        return False, tag, entity.path
+
+    return entity.location == EntityLocation.ATTRIBUTE, entity.path or name, None
@@ -19,14 +19,131 @@
 #   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
+import json
+import re
 from functools import partial
-from typing import Iterable, Any
+from typing import Iterable, Any, NamedTuple
 
 from bigtree import Node, findall, BaseNode
 from dotted_dict import DottedDict
 from mdmodels_core import DataModel
 from pydantic import computed_field, BaseModel, ConfigDict
 
+_SEGMENT_PATTERN = re.compile(
+    r"""
+    \.(?P<field>[A-Za-z_]\w*)
+    | \[(?P<quoted>'[^']*'|"[^"]*")\]
+    | \[(?P<wildcard>\*)\]
+    | \[(?P<index>-?\d+)\]
+    | \[\?\(\s*@\.(?P<filter_field>\w+)\s*
+        (?P<op>==|!=|<=|>=|<|>)\s*
+        (?P<value>'[^']*'|"[^"]*"|[^\s)]+)\s*\)\]
+    """,
+    re.VERBOSE,
+)
+
+
+class PathFilter(NamedTuple):
+    """
+    A simple comparison filter of the form '?(@.field op value)'.
+
+    Attributes:
+        field (str): The field of the current item to compare.
+        op (str): The comparison operator.
+        value (Any): The value to compare against.
+    """
+
+    field: str
+    op: str
+    value: Any
+
+
+class PathSegment(NamedTuple):
+    """
+    A single step of a parsed JSON path.
+
+    Attributes:
+        field (str | None): The field to descend into, if any.
+        wildcard (bool): Whether the step selects all items of an array.
+        index (int | None): The array index selected by the step, if any.
+        filter (PathFilter | None): The filter applied to array items, if any.
+    """
+
+    field: str | None = None
+    wildcard: bool = False
+    index: int | None = None
+    filter: PathFilter | None = None
+
+
+def parse_json_path(json_path: str) -> list[PathSegment]:
+    """
+    Parse the JSON path subset generated by the PathFactory.
+
+    Supported are field chains, wildcards, indices and simple comparison
+    filters such as '$.species[*].name' or "$.species[?(@.name == 'X')]".
+
+    Args:
+        json_path (str): The JSON path to parse.
+
+    Returns:
+        list[PathSegment]: The parsed segments without the root.
+
+    Raises:
+        ValueError: If the path is not part of the supported subset.
+    """
+    if not json_path.startswith("$"):
+        raise ValueError(f"JSON path '{json_path}' must start with '$'.")
+
+    segments = []
+    position = 1
+
+    while position < len(json_path):
+        match = _SEGMENT_PATTERN.match(json_path, position)
+
+        if match is None:
+            raise ValueError(
+                f"Unsupported JSON path expression '{json_path[position:]}' in '{json_path}'."
+            )
+
+        if match["field"]:
+            segments.append(PathSegment(field=match["field"]))
+        elif match["quoted"]:
+            segments.append(PathSegment(field=match["quoted"][1:-1]))
+        elif match["wildcard"]:
+            segments.append(PathSegment(wildcard=True))
+        elif match["index"]:
+            segments.append(PathSegment(index=int(match["index"])))
+        else:
+            path_filter = PathFilter(
+                field=match["filter_field"],
+                op=match["op"],
+                value=_parse_filter_value(match["value"]),
+            )
+            segments.append(PathSegment(filter=path_filter))
+
+        position = match.end()
+
+    return segments
+
+
+def _parse_filter_value(value: str) -> Any:
+    """
+    Parse the literal of a filter expression.
+
+    Args:
+        value (str): The literal as found in the path.
+
+    Returns:
+        Any: The parsed string, number, boolean or None.
+    """
+    if value[0] in ("'", '"'):
+        return value[1:-1]
+
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError(f"Invalid filter value '{value}'.")
+
 
 class PathFactory(BaseModel):
     """
@@ -0,0 +1,192 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic_core import to_jsonable_python
+
+from .arrays import NUMPY_DTYPES
+from .datamodel import DataModel
+from .meta import FieldMeta, select_model
+
+DOCUMENT_FILE = "document.json"
+ARRAY_DIR = "arrays"
+SIDECAR_KEY = "$npy"
+
+
+def save(document: DataModel, directory: str | Path) -> Path:
+    """
+    Save a document as JSON metadata with its numeric arrays in '.npy' sidecars.
+
+    Arrays of floats and integers are written to 'arrays/<path>.npy' and
+    replaced by a reference in 'document.json'. All other values are stored
+    in the JSON file as usual.
+
+    Args:
+        document (DataModel): The document to save.
+        directory (str | Path): The target directory, created if missing.
+
+    Returns:
+        Path: The path of the written JSON file.
+    """
+    directory = Path(directory)
+    (directory / ARRAY_DIR).mkdir(parents=True, exist_ok=True)
+
+    data = _dump_model(document, (), directory)
+    path = directory / DOCUMENT_FILE
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    return path
+
+
+def load(model: type[DataModel], directory: str | Path, mmap: bool = True) -> DataModel:
+    """
+    Load a document saved with 'save'.
+
+    Sidecar arrays of NumPy-backed fields are opened as read-only memory
+    maps, such that their data is only paged in when it is accessed. Loading
+    therefore only reads the JSON metadata and the headers of the sidecars.
+    Arrays of list-backed fields are read into lists.
+
+    Args:
+        model (type[DataModel]): The data model of the document.
+        directory (str | Path): The directory the document was saved to.
+        mmap (bool, optional): Whether to memory map the sidecars. Defaults to True.
+
+    Returns:
+        DataModel: The validated document.
+    """
+    directory = Path(directory)
+    data = json.loads((directory / DOCUMENT_FILE).read_text(encoding="utf-8"))
+
+    return model.model_validate(_resolve(model, data, directory, mmap))
+
+
+def _dump_model(node: DataModel, path: tuple[str, ...], directory: Path) -> dict:
+    """
+    Dump the fields of an object, writing numeric arrays to sidecars.
+    """
+    data = {}
+
+    for name, field in type(node).__mdmodels__.fields.items():  # type: ignore
+        value = getattr(node, name)
+        field_path = path + (name,)
+
+        if value is None:
+            data[name] = None
+        elif _is_numeric_array(field):
+            data[name] = _write_sidecar(field, value, field_path, directory)
+        elif isinstance(value, DataModel):
+            data[name] = _dump_model(value, field_path, directory)
+        elif isinstance(value, list):
+            data[name] = [
+                _dump_model(item, field_path + (str(index),), directory)
+                if isinstance(item, DataModel)
+                else to_jsonable_python(item)
+                for index, item in enumerate(value)
+            ]
+        else:
+            data[name] = to_jsonable_python(value)
+
+    return data
+
+
+def _write_sidecar(
+    field: FieldMeta,
+    value: Any,
+    path: tuple[str, ...],
+    directory: Path,
+) -> dict[str, str]:
+    """
+    Write a numeric array to a '.npy' file and return its reference.
+
+    The array is written to a temporary file that then replaces the sidecar,
+    since the value may be a memory map of the very file being written.
+    """
+    relative = f"{ARRAY_DIR}/{'.'.join(path)}.npy"
+    target = directory / relative
+    temporary = target.with_name(f"{target.name}.tmp")
+
+    with temporary.open("wb") as file:
+        np.save(file, np.asarray(value, dtype=NUMPY_DTYPES[field.dtype]))
+
+    os.replace(temporary, target)
+
+    return {SIDECAR_KEY: relative}
+
+
+def _resolve(
+    model: type[DataModel],
+    data: dict[str, Any],
+    directory: Path,
+    mmap: bool,
+) -> dict[str, Any]:
+    """
+    Replace sidecar references with the arrays they point to.
+    """
+    fields = model.__mdmodels__.fields  # type: ignore
+
+    for name, value in data.items():
+        field = fields.get(name)
+
+        if field is None or value is None:
+            continue
+        elif _is_numeric_array(field) and isinstance(value, dict):
+            data[name] = _read_sidecar(field, value, directory, mmap)
+        elif field.is_model and isinstance(value, dict):
+            data[name] = _resolve(select_model(field, value), value, directory, mmap)
+        elif field.is_model and isinstance(value, list):
+            data[name] = [
+                _resolve(select_model(field, item), item, directory, mmap)
+                if isinstance(item, dict)
+                else item
+                for item in value
+            ]
+
+    return data
+
+
+def _read_sidecar(
+    field: FieldMeta,
+    reference: dict[str, str],
+    directory: Path,
+    mmap: bool,
+) -> Any:
+    """
+    Open the array of a sidecar reference.
+    """
+    array = np.load(directory / reference[SIDECAR_KEY], mmap_mode="r" if mmap else None)
+
+    if field.is_numpy:
+        return array
+
+    return array.tolist()
+
+
+def _is_numeric_array(field: FieldMeta) -> bool:
+    """
+    Check whether a field holds an array of floats or integers.
+    """
+    return field.is_array and not field.is_union and field.dtype in NUMPY_DTYPES
@@ -22,6 +22,8 @@
 
 from sqlmodel import select  # noqa
 
-from .connector import DatabaseConnector  # noqa
+from .bulk import insert_bulk, insert_bulk_async  # noqa
+from .connector import AsyncDatabaseConnector, DatabaseConnector  # noqa
 from .create import generate_sqlmodel  # noqa
-from .insert import insert_nested  # noqa
+from .insert import insert_nested, insert_nested_async  # noqa
+from .query import json_path_to_select, query_json_path_async  # noqa
@@ -0,0 +1,349 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from enum import Enum
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import Integer, Table, func, insert, select
+from sqlalchemy.schema import sort_tables
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mdmodels.datamodel import DataModel
+from mdmodels.library import Library
+from mdmodels.sql.insert import get_primary_key
+
+# The number of rows written per statement and of keys looked up per query
+BATCH_SIZE = 1000
+
+
+def insert_bulk(
+    data: DataModel | List[DataModel],
+    session: Session,
+    models: Library,
+    batch_size: int = BATCH_SIZE,
+    deduplicate: bool = False,
+) -> List[Any]:
+    """
+    Insert one or multiple DataModel instances into the database in bulk.
+
+    Unlike 'insert_nested', no ORM instances are created. The documents are
+    flattened into rows per table, including the rows of the link tables, and
+    each table is written with batched 'executemany' inserts in dependency order.
+    Nested objects with a primary key that already exist in the database are
+    linked instead of inserted, using one 'IN' query per table and batch.
+
+    Integer primary keys that are not part of the documents are assigned
+    client-side, continuing from the largest key in the table. Hence, no other
+    process must insert into these tables concurrently.
+
+    Args:
+        data (DataModel | List[DataModel]): The data model instance(s) to insert.
+        session (Session): The active database session. The rows are committed
+            with the session.
+        models (Library): A library containing model classes.
+        batch_size (int): The number of rows written per statement.
+        deduplicate (bool): Whether subtrees with identical content are stored only once.
+            Subtrees are identified by their fingerprint.
+
+    Returns:
+        List[Any]: The primary keys of the inserted documents.
+
+    Raises:
+        ValueError: If the batch size is not positive, or if objects are nested
+            in objects of their own type, whose link tables cannot tell the
+            parent from the child.
+    """
+    if not isinstance(data, list):
+        data = [data]
+
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+
+    rows = _BulkRows(session, models, batch_size, deduplicate)
+    rows.fetch_existing(data)
+    keys = [rows.add(item) for item in data]
+    rows.write()
+
+    return keys
+
+
+async def insert_bulk_async(
+    data: DataModel | List[DataModel],
+    session: AsyncSession,
+    models: Library,
+    batch_size: int = BATCH_SIZE,
+    deduplicate: bool = False,
+) -> List[Any]:
+    """
+    Insert one or multiple DataModel instances in bulk through an asynchronous session.
+
+    The rows are collected and written as in 'insert_bulk', while the queries
+    and inserts are awaited through the session's asynchronous driver.
+
+    Args:
+        data (DataModel | List[DataModel]): The data model instance(s) to insert.
+        session (AsyncSession): The active asynchronous database session.
+        models (Library): A library containing model classes.
+        batch_size (int): The number of rows written per statement.
+        deduplicate (bool): Whether subtrees with identical content are stored only once.
+
+    Returns:
+        List[Any]: The primary keys of the inserted documents.
+    """
+    return await session.run_sync(
+        lambda sync_session: insert_bulk(
+            data, sync_session, models, batch_size, deduplicate
+        )
+    )
+
+
+class _TablePlan(NamedTuple):
+    """
+    How the objects of a data model class are written to their table.
+
+    Attributes:
+        table (Table): The table of the class.
+        pk (str): The name of the primary key column.
+        pk_in_data (bool): Whether the primary key is a field of the data model.
+        columns (Tuple[str, ...]): The fields stored in columns of the table.
+        links (Tuple[Tuple[str, Table], ...]): The fields stored in link tables.
+        nested (Tuple[str, ...]): The fields that may hold nested objects.
+    """
+
+    table: Table
+    pk: str
+    pk_in_data: bool
+    columns: Tuple[str, ...]
+    links: Tuple[Tuple[str, Table], ...]
+    nested: Tuple[str, ...]
+
+
+class _BulkRows:
+    """
+    The rows of a bulk insert, collected per table.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        models: Library,
+        batch_size: int,
+        deduplicate: bool,
+    ):
+        self.session = session
+        self.models = models
+        self.batch_size = batch_size
+        self.stored: Optional[Dict[str, Any]] = {} if deduplicate else None
+        self.rows: Dict[Table, List[Dict[str, Any]]] = {}
+        self.links: Dict[Table, Dict[Tuple[Any, Any], Dict[str, Any]]] = {}
+        self.identities: Set[Tuple[Table, Any]] = set()
+        self.existing: Dict[Table, Set[Any]] = {}
+        self._plans: Dict[type, _TablePlan] = {}
+        self._next_ids: Dict[Table, int] = {}
+        self._link_columns: Dict[Tuple[Table, Table], Tuple[str, str]] = {}
+
+    def fetch_existing(self, data: List[DataModel]) -> None:
+        """
+        Look up which nested objects with a primary key are already stored.
+        """
+        keys: Dict[Table, Set[Any]] = {}
+
+        for child in self._nested_objects(data):
+            plan = self._plan(type(child))
+            key = getattr(child, plan.pk) if plan.pk_in_data else None
+
+            if key is not None:
+                keys.setdefault(plan.table, set()).add(key)
+
+        for table, table_keys in keys.items():
+            column = table.primary_key.columns[0]
+            existing = self.existing.setdefault(table, set())
+
+            for batch in _batches(list(table_keys), self.batch_size):
+                statement = select(column).where(column.in_(batch))
+                existing.update(self.session.execute(statement).scalars())
+
+    def add(self, data: DataModel, nested: bool = False) -> Any:
+        """
+        Add the rows of a document and its nested objects.
+
+        Returns:
+            Any: The primary key of the document's row.
+        """
+        plan = self._plan(type(data))
+        table, pk = plan.table, plan.pk
+        key = getattr(data, pk) if plan.pk_in_data else None
+
+        if key is not None:
+            if (table, key) in self.identities or (
+                nested and key in self.existing.get(table, ())
+            ):
+                return key
+
+            self.identities.add((table, key))
+
+        if self.stored is not None:
+            fingerprint = data.fingerprint()
+
+            if fingerprint in self.stored:
+                return self.stored[fingerprint]
+
+        row = dict.fromkeys(table.columns.keys())
+
+        for name in plan.columns:
+            value = getattr(data, name)
+            row[name] = value.value if isinstance(value, Enum) else value
+
+        if row[pk] is None and isinstance(table.c[pk].type, Integer):
+            row[pk] = self._next_id(table, pk)
+
+        self.rows.setdefault(table, []).append(row)
+
+        if self.stored is not None:
+            self.stored[fingerprint] = row[pk]
+
+        for name, link_table in plan.links:
+            value = getattr(data, name)
+
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, DataModel):
+                    self._link(link_table, table, row[pk], item)
+
+        return row[pk]
+
+    def write(self) -> None:
+        """
+        Insert the collected rows, parents before the rows referencing them.
+        """
+        rows = {**self.rows}
+
+        for table, links in self.links.items():
+            rows[table] = list(links.values())
+
+        for table in sort_tables(rows):
+            for batch in _batches(rows[table], self.batch_size):
+                self.session.execute(insert(table), batch)
+
+    def _plan(self, cls: type) -> _TablePlan:
+        """
+        The table plan of a data model class, built once per insert.
+        """
+        if cls not in self._plans:
+            model = self.models[cls.__name__]
+            table = model.__table__
+            pk = get_primary_key(model)
+            fields = cls.__mdmodels__.fields  # type: ignore
+            relationships = model.__mapper__.relationships
+            links = {
+                name: relationships[name].secondary
+                for name in fields
+                if name in relationships and relationships[name].secondary is not None
+            }
+
+            self._plans[cls] = _TablePlan(
+                table=table,
+                pk=pk,
+                pk_in_data=pk in fields,
+                columns=tuple(
+                    name for name in fields if name in table.c and name not in links
+                ),
+                links=tuple(links.items()),
+                nested=tuple(name for name, meta in fields.items() if meta.is_model),
+            )
+
+        return self._plans[cls]
+
+    def _nested_objects(self, data: List[DataModel]) -> Iterator[DataModel]:
+        """
+        Iterate over all objects nested in the documents, excluding the documents.
+        """
+        stack = list(data)
+
+        while stack:
+            obj = stack.pop()
+
+            for name in self._plan(type(obj)).nested:
+                value = getattr(obj, name)
+
+                for item in value if isinstance(value, list) else [value]:
+                    if isinstance(item, DataModel):
+                        stack.append(item)
+                        yield item
+
+    def _link(self, link_table: Table, source: Table, key: Any, item: DataModel):
+        """
+        Add the nested object and the row linking it to its parent.
+        """
+        target_key = self.add(item, nested=True)
+        source_column, target_column = self._columns_of_link(link_table, source)
+
+        # Link tables cannot reference the same row twice within a collection
+        self.links.setdefault(link_table, {}).setdefault(
+            (key, target_key),
+            {source_column: key, target_column: target_key},
+        )
+
+    def _columns_of_link(self, link_table: Table, source: Table) -> Tuple[str, str]:
+        """
+        The names of the columns referencing the source and the target in a link table.
+        """
+        if (link_table, source) not in self._link_columns:
+            columns = {
+                foreign_key.column.table: column.name
+                for column in link_table.columns
+                for foreign_key in column.foreign_keys
+            }
+            target = next((table for table in columns if table is not source), None)
+
+            if target is None:
+                raise ValueError(
+                    f"Link table '{link_table.name}' has no column referencing a table "
+                    f"other than '{source.name}'. Objects nesting objects of their "
+                    "own type cannot be inserted in bulk."
+                )
+
+            self._link_columns[(link_table, source)] = (
+                columns[source],
+                columns[target],
+            )
+
+        return self._link_columns[(link_table, source)]
+
+    def _next_id(self, table: Table, pk: str) -> int:
+        """
+        Assign the next integer primary key of a table.
+        """
+        if table not in self._next_ids:
+            statement = select(func.max(table.c[pk]))
+            self._next_ids[table] = self.session.execute(statement).scalar() or 0
+
+        self._next_ids[table] += 1
+
+        return self._next_ids[table]
+
+
+def _batches(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split a list into consecutive batches of at most the given size.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
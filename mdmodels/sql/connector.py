@@ -25,7 +25,9 @@ from typing import Optional, Dict
 
 from pydantic import BaseModel, model_validator
 from sqlalchemy.engine.url import URL
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine, SQLModel, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class DatabaseType(Enum):
@@ -33,29 +35,31 @@ class DatabaseType(Enum):
     Enum representing different units of databases.
 
     Attributes:
-        POSTGRESQL (tuple): PostgreSQL database with psycopg2 driver.
-        MYSQL (tuple): MySQL database with pymysql driver.
-        SQLITE (tuple): SQLite database with no driver.
-        SQLSERVER (tuple): SQL Server database with pyodbc driver.
-        ORACLE (tuple): Oracle database with cx_oracle driver.
+        POSTGRESQL (tuple): PostgreSQL database with psycopg2 and asyncpg drivers.
+        MYSQL (tuple): MySQL database with pymysql and aiomysql drivers.
+        SQLITE (tuple): SQLite database with no driver and the aiosqlite driver.
+        SQLSERVER (tuple): SQL Server database with pyodbc and aioodbc drivers.
+        ORACLE (tuple): Oracle database with cx_oracle and oracledb_async drivers.
     """
 
-    POSTGRESQL = ("postgresql", "psycopg2")
-    MYSQL = ("mysql", "pymysql")
-    SQLITE = ("sqlite", None)
-    SQLSERVER = ("mssql", "pyodbc")
-    ORACLE = ("oracle", "cx_oracle")
+    POSTGRESQL = ("postgresql", "psycopg2", "asyncpg")
+    MYSQL = ("mysql", "pymysql", "aiomysql")
+    SQLITE = ("sqlite", None, "aiosqlite")
+    SQLSERVER = ("mssql", "pyodbc", "aioodbc")
+    ORACLE = ("oracle", "cx_oracle", "oracledb_async")
 
-    def __init__(self, db_name: str, default_driver: str):
+    def __init__(self, db_name: str, default_driver: str, async_driver: str):
         """
         Initialize the DatabaseType enum.
 
         Args:
             db_name (str): The name of the database.
             default_driver (str): The default driver for the database.
+            async_driver (str): The default driver for asynchronous connections.
         """
         self.db_name = db_name
         self.default_driver = default_driver
+        self.async_driver = async_driver
 
 
 class DatabaseConfig(BaseModel):
@@ -144,21 +148,16 @@ class DatabaseConnector:
             query (Optional[dict]): Additional query parameters for the connection string.
             db_type (DatabaseType): The type of the database.
         """
-        driver_name = db_type.db_name
-        if driver:
-            driver_name += f"+{driver}"
-        elif db_type.default_driver:
-            driver_name += f"+{db_type.default_driver}"
-
-        self.db_config = {
-            "drivername": driver_name,
-            "username": username,
-            "password": password,
-            "host": host,
-            "port": port,
-            "database": database,
-            "query": query,
-        }
+        self.db_config = _connection_config(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            driver=driver or db_type.default_driver,
+            database=database,
+            query=query,
+            db_type=db_type,
+        )
 
         self._active_session = None
         self._create_engine()
@@ -213,3 +212,161 @@ class DatabaseConnector:
             finally:
                 self._active_session.close()
             self._active_session = None
+
+
+class AsyncDatabaseConnector:
+    """
+    A class to manage asynchronous database connections and sessions.
+
+    The connector is used as an async context manager, which yields an
+    'AsyncSession' and commits it on exit. Database I/O is awaited through
+    the asynchronous driver of the database type, e.g. aiosqlite or asyncpg.
+
+    Attributes:
+        db_config (dict): The database configuration.
+        _active_session (Optional[AsyncSession]): The active database session.
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        driver: Optional[str] = None,
+        database: Optional[str] = None,
+        query: Optional[dict] = None,
+        db_type: DatabaseType = DatabaseType.SQLITE,
+    ):
+        """
+        Initialize the AsyncDatabaseConnector with the given parameters.
+
+        Args:
+            host (Optional[str]): The database host address.
+            port (Optional[int]): The port number for the database.
+            username (Optional[str]): The database username.
+            password (Optional[str]): The database password.
+            driver (Optional[str]): The asynchronous driver for the database.
+                Defaults to the asynchronous driver of the database type.
+            database (Optional[str]): The name of the database.
+            query (Optional[dict]): Additional query parameters for the connection string.
+            db_type (DatabaseType): The type of the database.
+        """
+        self.db_config = _connection_config(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            driver=driver or db_type.async_driver,
+            database=database,
+            query=query,
+            db_type=db_type,
+        )
+
+        self._active_session = None
+        self._create_engine()
+
+    async def create_tables(self, models: Dict[str, SQLModel]):
+        """
+        Create all tables in the database.
+        """
+
+        assert len(models) > 0, "No models to create"
+
+        async with self._create_engine().begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+
+    async def dispose(self):
+        """
+        Close all connections of the engine.
+        """
+        await self._create_engine().dispose()
+
+    def _create_engine(self):
+        """
+        Lazy-load the engine if not already created.
+
+        Returns:
+            AsyncEngine: The asynchronous SQLAlchemy engine.
+        """
+        if not hasattr(self, "_engine"):
+            connection_url = URL.create(**self.db_config)
+            self._engine = create_async_engine(connection_url)
+
+        return self._engine
+
+    async def __aenter__(self):
+        """
+        Enter the context manager, creating a session.
+
+        Rows are not expired on commit, since expired attributes cannot be
+        loaded implicitly outside of the session's awaits.
+
+        Returns:
+            AsyncSession: The active database session.
+        """
+        self._active_session = AsyncSession(
+            self._create_engine(), expire_on_commit=False
+        )
+        return self._active_session
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the context manager, ensuring the session is properly closed.
+
+        Args:
+            exc_type: The exception type.
+            exc_value: The exception value.
+            traceback: The traceback object.
+        """
+        if self._active_session:
+            try:
+                if exc_type:
+                    await self._active_session.rollback()
+                else:
+                    await self._active_session.commit()
+            finally:
+                await self._active_session.close()
+            self._active_session = None
+
+
+def _connection_config(
+    host: Optional[str],
+    port: Optional[int],
+    username: Optional[str],
+    password: Optional[str],
+    driver: Optional[str],
+    database: Optional[str],
+    query: Optional[dict],
+    db_type: DatabaseType,
+) -> dict:
+    """
+    Build the arguments of the connection URL.
+
+    Args:
+        host (Optional[str]): The database host address.
+        port (Optional[int]): The port number for the database.
+        username (Optional[str]): The database username.
+        password (Optional[str]): The database password.
+        driver (Optional[str]): The driver for the database.
+        database (Optional[str]): The name of the database.
+        query (Optional[dict]): Additional query parameters for the connection string.
+        db_type (DatabaseType): The type of the database.
+
+    Returns:
+        dict: The keyword arguments of 'URL.create'.
+    """
+    driver_name = db_type.db_name
+
+    if driver:
+        driver_name += f"+{driver}"
+
+    return {
+        "drivername": driver_name,
+        "username": username,
+        "password": password,
+        "host": host,
+        "port": port,
+        "database": database,
+        "query": query,
+    }
@@ -68,6 +68,7 @@ def generate_sqlmodel(
     linking_tables = _extract_linking_tables(model, typed_pks)
     models = Library(rust_model=data_model._rust_model)
     models._cross_connections = data_model._cross_connections
+    models._connection_index = data_model._connection_index
 
     for obj in model.objects:
         pk_name, _ = typed_pks.get(obj.name, (None, None))
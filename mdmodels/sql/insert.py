@@ -20,19 +20,27 @@
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
 import asyncio
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
-from sqlmodel import Session, SQLModel
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from mdmodels.datamodel import DataModel
 from mdmodels.library import CrossConnection, Library
 from mdmodels.sql.base import SQLBase
 
+# The number of primary keys looked up per query
+BATCH_SIZE = 1000
+
+# Rows of referenced objects, keyed by their table and primary key
+Identities = Dict[Tuple[Type[SQLModel], Any], asyncio.Future]
+
 
 def insert_nested(
     data: DataModel | List[DataModel],
     library: Library,
     session: Session,
     models: Library,
+    deduplicate: bool = False,
 ) -> List[SQLModel]:
     """
     Insert one or multiple DataModel instances into the database.
@@ -42,27 +50,36 @@ def insert_nested(
         library (Library): The library providing object connections.
         session (Session): The active database session.
         models (Library): A library containing model classes.
+        deduplicate (bool): Whether subtrees with identical content are stored only once.
+            Subtrees are identified by their fingerprint.
 
     Returns:
         List[SQLModel]: A list of SQLModel instances representing the inserted data.
     """
-    return asyncio.run(insert_nested_async(data, library, session, models))
+    return asyncio.run(insert_nested_async(data, library, session, models, deduplicate))
 
 
 async def insert_nested_async(
     data: DataModel | List[DataModel],
     library: Library,
-    session: Session,
+    session: Session | AsyncSession,
     models: Library,
+    deduplicate: bool = False,
 ) -> List[SQLModel]:
     """
     Insert one or multiple DataModel instances into the database asynchronously.
 
+    With an 'AsyncSession', e.g. of an 'AsyncDatabaseConnector', the lookups
+    of stored rows are awaited and do not block the event loop. The rows are
+    written when the session is flushed or committed.
+
     Args:
         data (DataModel | List[DataModel]): The data model instance(s) to insert.
         library (Library): The library providing object connections.
-        session (Session): The active database session.
+        session (Session | AsyncSession): The active database session.
         models (Library): A library containing model classes.
+        deduplicate (bool): Whether subtrees with identical content are stored only once.
+            Subtrees are identified by their fingerprint.
 
     Returns:
         List[SQLModel]: A list of SQLModel instances representing the inserted data.
@@ -70,7 +87,12 @@ async def insert_nested_async(
     if not isinstance(data, list):
         data = [data]
 
-    tasks = [_to_sqlmodel(item, library, session, models) for item in data]
+    stored = {} if deduplicate else None
+    identities = await _prefetch_rows(data, session, models)
+    tasks = [
+        _to_sqlmodel(item, library, session, models, stored, identities)
+        for item in data
+    ]
 
     return await asyncio.gather(*tasks)  # type: ignore
 
@@ -80,15 +102,27 @@ async def _to_sqlmodel(
     library: Library,
     session: Session,
     models: Library,
+    stored: Optional[Dict[str, asyncio.Future]] = None,
+    identities: Optional[Identities] = None,
+    identity: Optional[asyncio.Future] = None,
 ) -> SQLModel | str | float | int | bool:
     """
     Convert a DataModel instance to a SQLModel instance.
 
+    The row is created before the nested objects are converted and its
+    relationships are assigned afterwards, such that nested references to
+    the row itself resolve through the identity map.
+
     Args:
         data (DataModel): The data model instance to convert.
         library (Library): The library providing object connections.
         session (Session): The active database session.
         models (Library): A library containing model classes.
+        stored (Optional[Dict[str, asyncio.Future]]): Rows of converted subtrees, keyed by fingerprint.
+            If None, subtrees are not deduplicated.
+        identities (Optional[Identities]): Rows of referenced objects, keyed by table and primary key.
+        identity (Optional[asyncio.Future]): The entry of the row in the identity map, if any.
+            It is resolved as soon as the row exists.
 
     Returns:
         SQLModel: A SQLModel instance representing the data, or the original data if it is a string.
@@ -96,14 +130,28 @@ async def _to_sqlmodel(
     if not isinstance(data, DataModel):
         return data
 
-    connections = library.get_object_connections(type(data).__name__)
+    if stored is not None:
+        fingerprint = data.fingerprint()
+
+        if fingerprint in stored:
+            row = await stored[fingerprint]
+
+            if identity is not None:
+                identity.set_result(row)
+
+            return row
+
+        stored[fingerprint] = asyncio.get_running_loop().create_future()
+
+    connections = library.get_object_connection_map(type(data).__name__)
     delayed_attrs: Dict[str, Any] = {}
     primitives: Dict[str, Any] = {}
 
     tasks: List[asyncio.Task] = []
 
-    for key, value in data:
-        conn = attr_connected_to(key, connections)
+    for key in type(data).__mdmodels__.fields:  # type: ignore
+        value = getattr(data, key)
+        conn = connections.get(key)
         if conn:
             tasks.append(
                 _process_connected_attr(
@@ -113,16 +161,24 @@ async def _to_sqlmodel(
                     library=library,
                     session=session,
                     models=models,
+                    stored=stored,
+                    identities=identities,
                 )  # type: ignore
             )
         else:
             primitives[key] = value
 
-    await asyncio.gather(*tasks)
-
     row = models[type(data).__name__](**primitives)
+
+    if identity is not None:
+        identity.set_result(row)
+
+    await asyncio.gather(*tasks)
     _set_delayed_attributes(row, delayed_attrs)
 
+    if stored is not None:
+        stored[fingerprint].set_result(row)
+
     return row
 
 
@@ -133,6 +189,8 @@ async def _process_connected_attr(
     library: Library,
     session: Session,
     models: Library,
+    stored: Optional[Dict[str, asyncio.Future]] = None,
+    identities: Optional[Identities] = None,
 ) -> None:
     """
     Process an attribute that is linked to another model and update delayed attributes.
@@ -144,6 +202,8 @@ async def _process_connected_attr(
         library (Library): The library providing object connections.
         session (Session): The active database session.
         models (Library): A library containing model classes.
+        stored (Optional[Dict[str, asyncio.Future]]): Rows of converted subtrees, keyed by fingerprint.
+        identities (Optional[Identities]): Rows of referenced objects, keyed by table and primary key.
     """
     if conn.is_array:
         tasks = []
@@ -151,14 +211,26 @@ async def _process_connected_attr(
 
         for item in value:
             if isinstance(item, DataModel):
-                tasks.append(_create_or_fetch_object(item, library, session, models))
+                tasks.append(
+                    _create_or_fetch_object(
+                        item, library, session, models, stored, identities
+                    )
+                )
             else:
                 delayed_attrs[conn.source_attr].append(item)  # type: ignore
 
-        delayed_attrs[conn.source_attr] = await asyncio.gather(*tasks)  # type: ignore
+        rows = await asyncio.gather(*tasks)
+
+        # Link tables cannot reference the same row twice within a collection,
+        # which happens for repeated primary keys and deduplicated subtrees
+        rows = list({id(row): row for row in rows}.values())
+
+        delayed_attrs[conn.source_attr] = rows  # type: ignore
     else:
         if isinstance(value, DataModel):
-            processed_value = await _to_sqlmodel(value, library, session, models)
+            processed_value = await _to_sqlmodel(
+                value, library, session, models, stored, identities
+            )
             delayed_attrs[conn.source_attr] = processed_value  # type: ignore
         else:
             delayed_attrs[conn.source_attr] = value  # type: ignore
@@ -167,39 +239,144 @@ async def _process_connected_attr(
 async def _create_or_fetch_object(
     value: DataModel,
     library: Library,
-    session: Session,
+    session: Session | AsyncSession,
     models: Library,
+    stored: Optional[Dict[str, asyncio.Future]] = None,
+    identities: Optional[Identities] = None,
 ) -> SQLModel:
     """
     Create or fetch an object from the database.
 
+    Objects with a primary key are looked up in the identity map, which holds
+    the rows of the session and of the database prefetched by '_prefetch_rows'.
+    Rows created for a primary key are added to the map before their nested
+    objects are converted, such that every further reference to the key,
+    including references nested within the object, resolves to the same row.
+
     Args:
         value (DataModel): The data model instance to create or fetch.
         library (Library): The library providing object connections.
-        session (Session): The active database session.
+        session (Session | AsyncSession): The active database session.
         models (Library): A library containing model classes.
+        stored (Optional[Dict[str, asyncio.Future]]): Rows of converted subtrees, keyed by fingerprint.
+        identities (Optional[Identities]): Rows of referenced objects, keyed by table and primary key.
+            If None, the object is looked up on its own.
     """
-    pk = get_primary_key(models[type(value).__name__])
+    table = models[type(value).__name__]
+    pk = get_primary_key(table)
 
     if not _pk_exists(value, pk):
-        return await _to_sqlmodel(value, library, session, models)  # type: ignore
+        return await _to_sqlmodel(value, library, session, models, stored, identities)  # type: ignore
 
-    table = models[type(value).__name__]
+    if identities is None:
+        identities = await _prefetch_rows([value], session, models, nested=False)
 
-    for instance in session:
-        if isinstance(instance, table) and getattr(instance, pk) == getattr(value, pk):
-            return instance
+    key = (table, getattr(value, pk))
 
-    result = session.get(table, getattr(value, pk))
+    if key in identities:
+        return await identities[key]
 
-    if result:
-        return result
+    identities[key] = asyncio.get_running_loop().create_future()
 
-    row = await _to_sqlmodel(value, library, session, models)  # type: ignore
+    row = await _to_sqlmodel(
+        value, library, session, models, stored, identities, identities[key]
+    )  # type: ignore
     session.add(row)
+
     return row
 
 
+async def _prefetch_rows(
+    data: List[DataModel],
+    session: Session | AsyncSession,
+    models: Library,
+    nested: bool = True,
+) -> Identities:
+    """
+    Fetch the stored rows of all objects with a primary key in the given documents.
+
+    The primary keys are collected per table first and the rows fetched with
+    one 'IN' query per table and batch. Rows that are already part of the
+    session are taken from the session instead.
+
+    Args:
+        data (List[DataModel]): The documents whose objects are looked up.
+        session (Session | AsyncSession): The active database session. Queries
+            of asynchronous sessions are awaited.
+        models (Library): A library containing model classes.
+        nested (bool): Whether only the objects nested in the documents are
+            looked up, or the documents themselves.
+
+    Returns:
+        Identities: The futures of the found rows, keyed by table and primary key.
+    """
+    keys: Dict[Type[SQLModel], set] = {}
+    objects = _nested_objects(data) if nested else iter(data)
+
+    for obj in objects:
+        table = models[type(obj).__name__]
+        pk = get_primary_key(table)
+
+        if _pk_exists(obj, pk):
+            keys.setdefault(table, set()).add(getattr(obj, pk))
+
+    sync_session = (
+        session.sync_session if isinstance(session, AsyncSession) else session
+    )
+    rows: List[SQLModel] = [
+        instance for instance in sync_session if type(instance) in keys
+    ]
+
+    with sync_session.no_autoflush:
+        for table, table_keys in keys.items():
+            column = getattr(table, get_primary_key(table))
+            table_keys = list(table_keys)
+
+            for start in range(0, len(table_keys), BATCH_SIZE):
+                batch = table_keys[start : start + BATCH_SIZE]
+                result = session.exec(select(table).where(column.in_(batch)))
+
+                if isinstance(session, AsyncSession):
+                    result = await result
+
+                rows += result.all()
+
+    loop = asyncio.get_running_loop()
+    identities: Identities = {}
+
+    for row in rows:
+        table = type(row)
+        future = identities.setdefault(
+            (table, getattr(row, get_primary_key(table))), loop.create_future()
+        )
+
+        if not future.done():
+            future.set_result(row)
+
+    return identities
+
+
+def _nested_objects(data: List[DataModel]) -> Iterator[DataModel]:
+    """
+    Iterate over all objects nested in the documents, excluding the documents.
+    """
+    stack = list(data)
+
+    while stack:
+        obj = stack.pop()
+
+        for name, meta in type(obj).__mdmodels__.fields.items():  # type: ignore
+            if not meta.is_model:
+                continue
+
+            value = getattr(obj, name)
+
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, DataModel):
+                    stack.append(item)
+                    yield item
+
+
 def _set_delayed_attributes(row: Any, delayed_attrs: Dict[str, Any]) -> None:
     """
     Assign delayed attributes to a SQLModel row.
@@ -0,0 +1,200 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+
+import operator
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from mdmodels.library import Library
+from mdmodels.sql.base import SQLBase
+from mdmodels.path import PathSegment, parse_json_path
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def json_path_to_select(
+    json_path: str,
+    root: str | type[SQLModel],
+    models: Library,
+):
+    """
+    Translate a JSON path into a SQLAlchemy select statement.
+
+    Field chains are resolved along the relationships of the SQL models, which
+    joins across the '__Link' tables of nested attributes. Filters of the form
+    '?(@.field op value)' become WHERE clauses, such that the filtering runs
+    within the database. Rows of nested tables are selected once, even if
+    they are linked from several parents.
+
+    Args:
+        json_path (str): The JSON path to translate, e.g. "$.species[?(@.name == 'X')]".
+        root (str | type[SQLModel]): The table the path starts at.
+        models (Library): The library of SQL models created by 'generate_sqlmodel'.
+
+    Returns:
+        Select: A select statement yielding the rows or column values at the path.
+
+    Raises:
+        ValueError: If a field of the path does not exist on the respective table,
+            or if the path contains array indices.
+
+    Example:
+        >>> stmt = json_path_to_select("$.species[?(@.name == 'X')]", "Dataset", models)
+        >>> species = session.exec(stmt).all()
+    """
+    if isinstance(root, str):
+        root = models[root]
+
+    entity = root
+    column = None
+    joins = []
+    conditions = []
+
+    for segment in parse_json_path(json_path):
+        if column is not None:
+            raise ValueError(
+                f"Cannot descend into column '{column.key}' in path '{json_path}'."
+            )
+
+        if segment.index is not None:
+            raise ValueError(
+                f"Array indices are not supported in SQL queries: '{json_path}'."
+            )
+        elif segment.filter is not None:
+            conditions.append(_filter_condition(entity, segment))
+        elif segment.field is not None:
+            entity, column = _resolve_field(entity, segment.field, joins)
+
+    stmt = select(column if column is not None else entity).select_from(root)
+
+    for relationship, target in joins:
+        stmt = stmt.join(relationship.of_type(target))
+
+    for condition in conditions:
+        stmt = stmt.where(condition)
+
+    if column is None and entity is not root:
+        # Rows linked from several parents are joined once per parent
+        stmt = stmt.distinct()
+
+    return stmt
+
+
+async def query_json_path_async(
+    session: AsyncSession,
+    json_path: str,
+    root: str | type[SQLModel],
+    models: Library,
+) -> list[Any]:
+    """
+    Run a JSON path query through an asynchronous session.
+
+    The statement of 'json_path_to_select' is executed with the session's
+    asynchronous driver. Rows are returned as dictionaries including their
+    nested objects, since relationships cannot be loaded lazily after the
+    query has been awaited.
+
+    Args:
+        session (AsyncSession): The active asynchronous database session.
+        json_path (str): The JSON path to query, e.g. "$.species[?(@.name == 'X')]".
+        root (str | type[SQLModel]): The table the path starts at.
+        models (Library): The library of SQL models created by 'generate_sqlmodel'.
+
+    Returns:
+        list[Any]: The rows as dictionaries, or the column values at the path.
+    """
+    stmt = json_path_to_select(json_path, root, models)
+
+    return await session.run_sync(_fetch_all, stmt)
+
+
+def _fetch_all(session: Session, stmt) -> list[Any]:
+    """
+    Execute a statement and serialize the resulting rows with their relationships.
+    """
+    return [
+        row.to_dict() if isinstance(row, SQLBase) else row
+        for row in session.execute(stmt).scalars()
+    ]
+
+
+def _resolve_field(entity: Any, field: str, joins: list) -> tuple[Any, Any]:
+    """
+    Resolve a field of the current entity to either a related table or a column.
+
+    Args:
+        entity (Any): The current table or alias.
+        field (str): The field to resolve.
+        joins (list): The joins collected so far, updated in place.
+
+    Returns:
+        tuple[Any, Any]: The new current entity and the selected column, if any.
+
+    Raises:
+        ValueError: If the field does not exist on the entity.
+    """
+    mapper = inspect(entity).mapper
+
+    if field in mapper.relationships:
+        target = aliased(mapper.relationships[field].mapper.class_)
+        joins.append((getattr(entity, field), target))
+        return target, None
+    elif field in mapper.columns:
+        return entity, getattr(entity, field)
+
+    raise ValueError(f"Field '{field}' not found in table '{mapper.class_.__name__}'.")
+
+
+def _filter_condition(entity: Any, segment: PathSegment):
+    """
+    Build the WHERE clause of a filter segment.
+
+    Args:
+        entity (Any): The table or alias the filter applies to.
+        segment (PathSegment): The filter segment.
+
+    Returns:
+        ColumnElement: The condition to apply.
+
+    Raises:
+        ValueError: If the filtered field is not a column of the entity.
+    """
+    field, op, value = segment.filter  # type: ignore
+    mapper = inspect(entity).mapper
+
+    if field not in mapper.columns:
+        raise ValueError(
+            f"Cannot filter on '{field}': not a column of table '{mapper.class_.__name__}'."
+        )
+
+    return OPERATORS[op](getattr(entity, field), value)
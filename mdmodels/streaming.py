@@ -0,0 +1,262 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import json
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Generator, Iterable, Literal, NamedTuple
+
+import jsonpath
+from jsonpath import JSONPath
+
+from .datamodel import DataModel
+
+Document = DataModel | dict | Path | str
+
+
+class QueryMatch(NamedTuple):
+    """
+    A single match of a streaming query.
+
+    Attributes:
+        document (str | int): Identifier of the document the match stems from. Files are
+            identified by their path (JSON Lines by 'path:line'), instances by their
+            position in the input iterable.
+        path (str): The normalized JSON path of the match within the document.
+        value (Any): The matched value.
+    """
+
+    document: str | int
+    path: str
+    value: Any
+
+
+def query(
+    documents: Document | Iterable[Document],
+    json_path: str,
+    model: type[DataModel] | None = None,
+    workers: int | None = None,
+    executor: Literal["thread", "process"] = "thread",
+) -> Generator[QueryMatch, None, None]:
+    """
+    Stream documents through a single compiled JSON path.
+
+    Documents are loaded, queried and released one after another, such that only
+    a single document is held in memory at a time. Supported inputs are JSON,
+    JSON Lines and XML files, dictionaries and DataModel instances. Instances
+    and XML files are queried in their JSON form, such that filters compare
+    e.g. enumerations by value on every input and executor.
+
+    Args:
+        documents (Document | Iterable[Document]): A document or an iterable of documents.
+        json_path (str): The JSON path to evaluate on each document.
+        model (type[DataModel] | None): The data model used to parse XML documents.
+        workers (int | None): Number of workers to query documents concurrently. If None,
+            documents are queried sequentially.
+        executor (str): The pool to use for concurrent queries, either 'thread' or 'process'.
+
+    Yields:
+        QueryMatch: The matches in document order.
+
+    Raises:
+        ValueError: If the executor is unknown or a model is given for a process pool.
+
+    Example:
+        >>> for match in query(paths, "$.species[?(@.mw > 50)].id", model=lib.Dataset):
+        ...     print(match.document, match.value)
+    """
+    if isinstance(documents, (DataModel, dict, Path, str)):
+        documents = [documents]
+
+    path = _compile(json_path)
+
+    if not workers:
+        for index, document in enumerate(documents):
+            yield from _query_document(document, index, path, model)
+        return
+
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    elif executor == "process":
+        if model is not None:
+            raise ValueError(
+                "Data models cannot be sent to a process pool. "
+                "Use executor='thread' to query XML documents concurrently."
+            )
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"Unknown executor '{executor}'. Use 'thread' or 'process'.")
+
+    with pool:
+        tasks = (
+            (_prepare_for_pool(document, executor), index)
+            for index, document in enumerate(documents)
+        )
+
+        for matches in _bounded_map(pool, json_path, model, tasks, workers):
+            yield from matches
+
+
+def _bounded_map(
+    pool: Executor,
+    json_path: str,
+    model: type[DataModel] | None,
+    tasks: Iterable[tuple[Document, int]],
+    window: int,
+) -> Generator[list[QueryMatch], None, None]:
+    """
+    Map documents onto the pool while keeping at most 'window' documents in flight.
+
+    Args:
+        pool (Executor): The pool to submit the queries to.
+        json_path (str): The JSON path to evaluate.
+        model (type[DataModel] | None): The data model used to parse XML documents.
+        tasks (Iterable[tuple[Document, int]]): Pairs of document and position.
+        window (int): The maximum number of pending documents.
+
+    Yields:
+        list[QueryMatch]: The matches of each document in submission order.
+    """
+    pending = deque()
+
+    for document, index in tasks:
+        pending.append(pool.submit(_collect, document, index, json_path, model))
+
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _collect(
+    document: Document,
+    index: int,
+    json_path: str,
+    model: type[DataModel] | None,
+) -> list[QueryMatch]:
+    """
+    Query a single document within a worker and collect its matches.
+    """
+    return list(_query_document(document, index, _compile(json_path), model))
+
+
+def _prepare_for_pool(document: Document, executor: str) -> Document:
+    """
+    Convert instances into plain dictionaries before they are sent to another process.
+    """
+    if executor == "process" and isinstance(document, DataModel):
+        return document.model_dump(mode="json")
+
+    return document
+
+
+@lru_cache(maxsize=128)
+def _compile(json_path: str) -> JSONPath:
+    """
+    Compile a JSON path once per process.
+    """
+    return jsonpath.compile(json_path)  # type: ignore
+
+
+def _query_document(
+    document: Document,
+    index: int,
+    path: JSONPath,
+    model: type[DataModel] | None,
+) -> Generator[QueryMatch, None, None]:
+    """
+    Evaluate a compiled path against a single document.
+
+    Args:
+        document (Document): The document to query.
+        index (int): The position of the document within the input.
+        path (JSONPath): The compiled JSON path.
+        model (type[DataModel] | None): The data model used to parse XML documents.
+
+    Yields:
+        QueryMatch: The matches within the document.
+    """
+    if isinstance(document, DataModel):
+        yield from _matches(index, path, document.model_dump(mode="json"))
+    elif isinstance(document, dict):
+        yield from _matches(index, path, document)
+    elif isinstance(document, (str, Path)):
+        yield from _query_file(Path(document), path, model)
+    else:
+        raise ValueError(f"Unsupported document type: {type(document)}")
+
+
+def _query_file(
+    file: Path,
+    path: JSONPath,
+    model: type[DataModel] | None,
+) -> Generator[QueryMatch, None, None]:
+    """
+    Query a JSON, JSON Lines or XML file.
+
+    Args:
+        file (Path): The file to query.
+        path (JSONPath): The compiled JSON path.
+        model (type[DataModel] | None): The data model used to parse XML documents.
+
+    Yields:
+        QueryMatch: The matches within the file.
+
+    Raises:
+        ValueError: If an XML file is given without a model or the format is unknown.
+    """
+    suffix = file.suffix.lower()
+
+    if suffix == ".json":
+        with open(file, "rb") as f:
+            data = json.load(f)
+
+        yield from _matches(str(file), path, data)
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(file, "rb") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                yield from _matches(f"{file}:{line_no}", path, json.loads(line))
+    elif suffix == ".xml":
+        if model is None:
+            raise ValueError(f"A data model is required to query XML file '{file}'.")
+
+        data = model.from_xml(file.read_bytes()).model_dump(mode="json")
+        yield from _matches(str(file), path, data)
+    else:
+        raise ValueError(f"Unsupported file format '{suffix}' of file '{file}'.")
+
+
+def _matches(
+    document: str | int,
+    path: JSONPath,
+    data: Any,
+) -> Generator[QueryMatch, None, None]:
+    """
+    Wrap the matches of a path within a document.
+    """
+    for match in path.finditer(data):
+        yield QueryMatch(document=document, path=match.path, value=match.obj)
@@ -0,0 +1,359 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import json
+import weakref
+from enum import Enum
+from typing import Any, Callable
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+from pydantic_xml.element.native import etree
+
+from .arrays import NUMPY_DTYPES
+from .meta import FieldMeta, candidate_models
+
+Converter = Callable[[Any], Any] | None
+
+# Construction plans per model class. A plan holds one converter per field
+# and is derived once from the field metadata, so that the hot path does not
+# need to inspect types again for every object.
+_PLANS: "weakref.WeakKeyDictionary[type, tuple]" = weakref.WeakKeyDictionary()
+
+
+def load(model: type[BaseModel], data: dict | str | bytes) -> BaseModel:
+    """
+    Load a data model instance from trusted data without validation.
+
+    Dictionaries are constructed directly, strings and bytes are parsed as
+    XML if they start with a tag and as JSON otherwise.
+
+    Args:
+        model (type[BaseModel]): The data model to load.
+        data (dict | str | bytes): The trusted data as dictionary, JSON or XML.
+
+    Returns:
+        BaseModel: The loaded instance.
+    """
+    if isinstance(data, dict):
+        return construct(model, data)
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    if data.lstrip().startswith(b"<"):
+        return construct_xml(model, etree.fromstring(data))
+
+    return construct(model, json.loads(data))
+
+
+def construct_xml(model: type[BaseModel], element: Any) -> BaseModel:
+    """
+    Build a data model instance from a trusted XML element without validation.
+
+    The element is read along the XML locations of the field metadata and
+    the resulting data is passed to 'construct'. Models with union fields
+    cannot be mapped unambiguously and are validated by pydantic-xml instead.
+
+    Args:
+        model (type[BaseModel]): The data model to construct.
+        element: The XML element of the object.
+
+    Returns:
+        BaseModel: The constructed instance.
+    """
+    if _has_union(model):
+        return _validate_element(model, element)
+
+    return construct(model, _element_data(model, element))
+
+
+def construct(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """
+    Build a data model instance from trusted data without validation.
+
+    The data is walked along the field metadata of the model. Nested objects
+    are constructed recursively, enumerations are looked up by value and all
+    other values are taken as they are. The data must already be valid, e.g.
+    because it has been validated elsewhere or was produced by this library.
+
+    Args:
+        model (type[BaseModel]): The data model to construct.
+        data (dict[str, Any]): The trusted data, as dumped by 'model_dump'.
+
+    Returns:
+        BaseModel: The constructed instance.
+    """
+    plan = _PLANS.get(model)
+
+    if plan is None:
+        plan = _PLANS[model] = _build_plan(model)
+
+    converters, defaults, plain = plan
+
+    if not plain:
+        values = {
+            name: _convert(converters.get(name), value) for name, value in data.items()
+        }
+        return model.model_construct(**values)
+
+    values = {}
+
+    for name, value in data.items():
+        if name in converters:
+            convert = converters[name]
+            values[name] = value if convert is None or value is None else convert(value)
+
+    fields_set = set(values)
+
+    for name, info in defaults:
+        if name not in values:
+            values[name] = info.get_default(
+                call_default_factory=True,
+                validated_data=values,
+            )
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+    return instance
+
+
+def _convert(convert: Converter, value: Any) -> Any:
+    """
+    Apply a converter of a plan to a value, passing through None.
+    """
+    return value if convert is None or value is None else convert(value)
+
+
+def _build_plan(model: type[BaseModel]) -> tuple:
+    """
+    Derive the construction plan of a model from its field metadata.
+
+    The plan consists of the converters per field, the fields that have
+    defaults and whether instances can be assembled directly. Models with
+    aliases, extra fields, private attributes or post-init hooks are
+    delegated to 'model_construct', which handles these cases.
+    """
+    meta = getattr(model, "__mdmodels__", None)
+    fields = meta.fields if meta is not None else {}
+    converters = {
+        name: _field_converter(fields[name]) if name in fields else None
+        for name in model.model_fields
+    }
+    defaults = tuple(
+        (name, info)
+        for name, info in model.model_fields.items()
+        if not info.is_required()
+    )
+    plain = (
+        not model.__private_attributes__
+        and not model.__pydantic_post_init__
+        and not model.__pydantic_root_model__
+        and model.model_config.get("extra") != "allow"
+        and all(
+            info.alias in (None, name) and info.validation_alias in (None, name)
+            for name, info in model.model_fields.items()
+        )
+    )
+
+    return converters, defaults, plain
+
+
+def _field_converter(field: FieldMeta) -> Converter:
+    """
+    Create the converter of a field, or None if values are taken as they are.
+    """
+    if field.is_numpy:
+        dtype = NUMPY_DTYPES[field.dtype]
+        return lambda value: np.asarray(value, dtype=dtype)
+
+    convert = _value_converter(field)
+
+    if convert is None or not field.is_array:
+        return convert
+
+    def convert_list(value: Any) -> Any:
+        if not isinstance(value, list):
+            return convert(value)
+        return [item if item is None else convert(item) for item in value]
+
+    return convert_list
+
+
+def _value_converter(field: FieldMeta) -> Converter:
+    """
+    Create the converter of a single (non-list) value of a field.
+    """
+    if field.is_model:
+
+        def convert_model(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+
+            models = candidate_models(field, value)
+
+            if len(models) > 1:
+                return _validate_union(models, value)
+
+            return construct(models[0], value)
+
+        if field.is_union:
+            return convert_model
+
+        model = field.dtype
+
+        if field.is_unit:
+            # Parsed unit definitions are interned, see 'convert_unit'
+            from .units.converter import convert_unit
+
+            return convert_unit
+
+        def convert_object(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            return construct(model, value)
+
+        return convert_object
+
+    if field.is_enum and not field.is_union:
+        enum = field.dtype
+        members = {member.value: member for member in enum}
+
+        def convert_enum(value: Any) -> Any:
+            if isinstance(value, Enum):
+                return value
+            member = members.get(value)
+            return enum(value) if member is None else member
+
+        return convert_enum
+
+    if bytes in field.dtypes:
+        return lambda value: value.encode() if isinstance(value, str) else value
+
+    return None
+
+
+def _validate_union(models: list[type[BaseModel]], value: dict[str, Any]) -> BaseModel:
+    """
+    Validate data against the first of several models that accepts it.
+
+    Models of a union that share their field names cannot be told apart by
+    the keys alone, so the values decide, just like pydantic does.
+    """
+    for model in models:
+        try:
+            return model.model_validate(value)
+        except ValidationError:
+            continue
+
+    return construct(models[0], value)
+
+
+def _element_data(model: type[BaseModel], element: Any) -> dict[str, Any]:
+    """
+    Read the values of the fields of a model from its XML element.
+    """
+    data = {}
+
+    for name, field in model.__mdmodels__.fields.items():  # type: ignore
+        if field.is_xml_attr:
+            if field.xml_tag in element.attrib:
+                data[name] = _parse_text(field, element.attrib[field.xml_tag])
+            continue
+
+        parent = element
+        if field.xml_wrapper is not None:
+            parent = element.find(field.xml_wrapper)
+
+        children = [] if parent is None else parent.findall(field.xml_tag)
+
+        if not children:
+            continue
+        elif field.is_numpy:
+            data[name] = _parse_text(field, children[0].text)
+        elif field.is_array:
+            data[name] = [_element_value(field, child) for child in children]
+        else:
+            data[name] = _element_value(field, children[0])
+
+    return data
+
+
+def _element_value(field: FieldMeta, element: Any) -> Any:
+    """
+    Read a single (non-list) value of a field from its XML element.
+    """
+    if not field.is_model:
+        return _parse_text(field, element.text)
+
+    model = field.dtype
+
+    if _has_union(model):
+        return _validate_element(model, element)
+
+    return _element_data(model, element)
+
+
+def _parse_text(field: FieldMeta, text: str | None) -> Any:
+    """
+    Convert the text of an XML attribute or element to the type of a field.
+    """
+    if text is None or field.is_union:
+        return text
+
+    dtype = field.dtype
+
+    if field.is_numpy:
+        items = text.strip("[] \n").replace(",", " ").split()
+        return np.asarray(items, dtype=NUMPY_DTYPES[dtype])
+    elif dtype is bool:
+        return text.strip().lower() in ("true", "1")
+    elif dtype in (int, float):
+        return dtype(text)
+    elif dtype is bytes:
+        return text.encode()
+
+    return text
+
+
+def _has_union(model: type[BaseModel]) -> bool:
+    """
+    Whether any field of a model accepts more than one type.
+    """
+    fields = model.__mdmodels__.fields  # type: ignore
+    return any(field.is_union for field in fields.values())
+
+
+def _validate_element(model: type[BaseModel], element: Any) -> BaseModel:
+    """
+    Validate an XML element with pydantic-xml, regardless of its tag.
+    """
+    tag = element.tag
+    element.tag = model.__xml_tag__ or model.__name__  # type: ignore
+
+    try:
+        return model.from_xml_tree(element)  # type: ignore
+    finally:
+        element.tag = tag
@@ -19,3 +19,13 @@
 #   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
+from .converter import convert_unit, parse_many
+from .unit_definition import BaseUnit, UnitDefinition, UnitType
+
+__all__ = [
+    "BaseUnit",
+    "UnitDefinition",
+    "UnitType",
+    "convert_unit",
+    "parse_many",
+]
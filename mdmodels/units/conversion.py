@@ -0,0 +1,243 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .unit_definition import UnitType
+
+if TYPE_CHECKING:
+    from .unit_definition import UnitDefinition
+
+# Base kinds the dimensions of units are expressed in
+BASE_KINDS = (
+    UnitType.METRE,
+    UnitType.GRAM,
+    UnitType.SECOND,
+    UnitType.AMPERE,
+    UnitType.KELVIN,
+    UnitType.MOLE,
+    UnitType.CANDELA,
+    UnitType.ITEM,
+)
+
+# Factors and dimensions of the derived kinds, in terms of the base kinds
+DERIVED_KINDS: dict[UnitType, tuple[float, dict[UnitType, int]]] = {
+    UnitType.KILOGRAM: (1e3, {UnitType.GRAM: 1}),
+    UnitType.LITRE: (1e-3, {UnitType.METRE: 3}),
+    UnitType.CELSIUS: (1.0, {UnitType.KELVIN: 1}),
+    UnitType.HERTZ: (1.0, {UnitType.SECOND: -1}),
+    UnitType.BECQUEREL: (1.0, {UnitType.SECOND: -1}),
+    UnitType.NEWTON: (1e3, {UnitType.GRAM: 1, UnitType.METRE: 1, UnitType.SECOND: -2}),
+    UnitType.PASCAL: (1e3, {UnitType.GRAM: 1, UnitType.METRE: -1, UnitType.SECOND: -2}),
+    UnitType.JOULE: (1e3, {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -2}),
+    UnitType.WATT: (1e3, {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -3}),
+    UnitType.COULOMB: (1.0, {UnitType.AMPERE: 1, UnitType.SECOND: 1}),
+    UnitType.VOLT: (
+        1e3,
+        {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -3, UnitType.AMPERE: -1},
+    ),
+    UnitType.FARAD: (
+        1e-3,
+        {UnitType.GRAM: -1, UnitType.METRE: -2, UnitType.SECOND: 4, UnitType.AMPERE: 2},
+    ),
+    UnitType.OHM: (
+        1e3,
+        {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -3, UnitType.AMPERE: -2},
+    ),
+    UnitType.SIEMENS: (
+        1e-3,
+        {UnitType.GRAM: -1, UnitType.METRE: -2, UnitType.SECOND: 3, UnitType.AMPERE: 2},
+    ),
+    UnitType.WEBER: (
+        1e3,
+        {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -2, UnitType.AMPERE: -1},
+    ),
+    UnitType.TESLA: (1e3, {UnitType.GRAM: 1, UnitType.SECOND: -2, UnitType.AMPERE: -1}),
+    UnitType.HENRY: (
+        1e3,
+        {UnitType.GRAM: 1, UnitType.METRE: 2, UnitType.SECOND: -2, UnitType.AMPERE: -2},
+    ),
+    UnitType.LUMEN: (1.0, {UnitType.CANDELA: 1}),
+    UnitType.LUX: (1.0, {UnitType.CANDELA: 1, UnitType.METRE: -2}),
+    UnitType.GRAY: (1.0, {UnitType.METRE: 2, UnitType.SECOND: -2}),
+    UnitType.SIEVERT: (1.0, {UnitType.METRE: 2, UnitType.SECOND: -2}),
+    UnitType.KATAL: (1.0, {UnitType.MOLE: 1, UnitType.SECOND: -1}),
+    UnitType.RADIAN: (1.0, {}),
+    UnitType.STERADIAN: (1.0, {}),
+    UnitType.DIMENSIONLESS: (1.0, {}),
+    UnitType.AVOGADRO: (6.02214076e23, {}),
+}
+
+# Offset of degrees Celsius to kelvin
+CELSIUS_OFFSET = 273.15
+
+
+def unit_key(unit: UnitDefinition) -> tuple:
+    """
+    The hashable form of the base units of a unit definition.
+
+    Args:
+        unit (UnitDefinition): The unit definition.
+
+    Returns:
+        tuple: The kind, exponent, multiplier and scale of each base unit.
+    """
+    return tuple(
+        (base.kind, base.exponent, base.multiplier, base.scale)
+        for base in unit.base_units
+    )
+
+
+def conversion(source: UnitDefinition, target: UnitDefinition) -> tuple[float, float]:
+    """
+    The factor and offset converting values from one unit to another.
+
+    A value 'x' in the source unit is 'x * factor + offset' in the target
+    unit. The offset is only non-zero for conversions from or to degrees
+    Celsius on their own; within compound units, such as 'deg_C / min',
+    Celsius denotes temperature differences and converts like kelvin.
+
+    Args:
+        source (UnitDefinition): The unit of the values.
+        target (UnitDefinition): The unit to convert to.
+
+    Returns:
+        tuple[float, float]: The factor and the offset.
+
+    Raises:
+        ValueError: If the units have different dimensions.
+    """
+    try:
+        return _conversion(unit_key(source), unit_key(target))
+    except ValueError:
+        raise ValueError(
+            f"Cannot convert '{source.name}' to '{target.name}', "
+            "the units have different dimensions."
+        ) from None
+
+
+def convert(
+    values: Any,
+    source: UnitDefinition,
+    target: UnitDefinition,
+) -> np.ndarray | float:
+    """
+    Convert values from one unit to another in a single vectorized operation.
+
+    Args:
+        values (Any): A number, a sequence of numbers or a NumPy array.
+        source (UnitDefinition): The unit of the values.
+        target (UnitDefinition): The unit to convert to.
+
+    Returns:
+        np.ndarray | float: The converted values, a float for a single number.
+    """
+    factor, offset = conversion(source, target)
+    array = np.asarray(values, dtype=np.float64)
+
+    if factor != 1.0:
+        array = array * factor
+    if offset:
+        array = array + offset
+
+    if array.ndim == 0:
+        return float(array)
+
+    return array
+
+
+@lru_cache(maxsize=4096)
+def canonical_form(key: tuple) -> tuple:
+    """
+    The canonical form of a unit, given by its key.
+
+    Args:
+        key (tuple): The key of the unit, see 'unit_key'.
+
+    Returns:
+        tuple: The sorted (kind, exponent) pairs of the dimensions, the normalized
+            multiplier in [1, 10), the scale and the offset of the unit.
+    """
+    factor, dimensions = _decompose(key)
+    scale = math.floor(math.log10(factor)) if factor > 0 else 0
+    multiplier = round(factor / 10.0**scale, 9)
+
+    if multiplier >= 10.0:
+        multiplier, scale = round(multiplier / 10.0, 9), scale + 1
+
+    return (
+        tuple(sorted((kind.value, exponent) for kind, exponent in dimensions.items())),
+        multiplier,
+        scale,
+        _offset(key),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _conversion(source: tuple, target: tuple) -> tuple[float, float]:
+    """
+    Compute the factor and offset between two units, given by their keys.
+    """
+    source_factor, source_dimensions = _decompose(source)
+    target_factor, target_dimensions = _decompose(target)
+
+    if source_dimensions != target_dimensions:
+        raise ValueError("Incompatible dimensions")
+
+    offset = (_offset(source) - _offset(target)) / target_factor
+
+    return source_factor / target_factor, offset
+
+
+def _decompose(key: tuple) -> tuple[float, dict[UnitType, int]]:
+    """
+    Express a unit in the base kinds, as a factor and dimension exponents.
+    """
+    factor = 1.0
+    dimensions: dict[UnitType, int] = {}
+
+    for kind, exponent, multiplier, scale in key:
+        kind_factor, kind_dimensions = DERIVED_KINDS.get(kind, (1.0, {kind: 1}))
+        base_factor = (multiplier or 1.0) * 10.0 ** (scale or 0.0) * kind_factor
+        factor *= base_factor**exponent
+
+        for base_kind, base_exponent in kind_dimensions.items():
+            dimensions[base_kind] = (
+                dimensions.get(base_kind, 0) + base_exponent * exponent
+            )
+
+    return factor, {kind: e for kind, e in dimensions.items() if e != 0}
+
+
+def _offset(key: tuple) -> float:
+    """
+    The offset of a unit to its base kinds, which is only non-zero for degrees Celsius.
+    """
+    if len(key) == 1 and key[0][0] is UnitType.CELSIUS and key[0][1] == 1:
+        return CELSIUS_OFFSET
+
+    return 0.0
@@ -19,67 +19,381 @@
 #   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 #   THE SOFTWARE.
 #  -----------------------------------------------------------------------------
+from __future__ import annotations
 
 import json
 import math
+from functools import lru_cache
 from json import JSONDecodeError
+from typing import TYPE_CHECKING, Any, Iterable
 
-import astropy.units as u
-from astropy.units import (
-    Unit,
-    PrefixUnit,
-    IrreducibleUnit,
-    UnitBase,
-    CompositeUnit,
-)
+import numpy as np
 
 from .mappings import UNIT_MAPPING
+from .parser import PREFIXES, parse_unit
 from .unit_definition import UnitType, UnitDefinition
 
-# Define custom units and add them to the astropy unit registry
-CUSTOM_UNITS = [
-    u.def_unit("absorbance", u.dimensionless_unscaled),
-    u.def_unit("M", u.mol / u.L, prefixes=True),
-    u.def_unit("kDa", 1e3 * u.Da),
-    u.def_unit("dimensionless", u.dimensionless_unscaled),
-]
+if TYPE_CHECKING:
+    from astropy.units import IrreducibleUnit, PrefixUnit, Unit, UnitBase
 
-u.add_enabled_units(CUSTOM_UNITS)
+
+@lru_cache(maxsize=None)
+def astropy_units():
+    """
+    Import astropy's unit module and register the custom units.
+
+    Astropy is only imported for unit strings that the fast path of
+    'parse_unit' does not cover.
+
+    Returns:
+        module: The 'astropy.units' module.
+    """
+    import astropy.units as u
+
+    # Define custom units and add them to the astropy unit registry. The
+    # prefixed variants of a unit, e.g. 'mM', are only collected in a namespace.
+    custom: dict = {}
+
+    u.def_unit("absorbance", u.dimensionless_unscaled, namespace=custom)
+    u.def_unit("M", u.mol / u.L, prefixes=True, namespace=custom)
+    u.def_unit("kDa", 1e3 * u.Da, namespace=custom)
+    u.def_unit("dimensionless", u.dimensionless_unscaled, namespace=custom)
+    u.def_unit("item", namespace=custom)
+
+    u.add_enabled_units(custom)
+
+    return u
+
+
+# The number of distinct unit strings and definitions that are kept parsed
+UNIT_CACHE_SIZE = 4096
+
+# Astropy symbols of the unit kinds, used to compose astropy units
+ASTROPY_SYMBOLS = {
+    UnitType.AMPERE: "A",
+    UnitType.AVOGADRO: "",
+    UnitType.BECQUEREL: "Bq",
+    UnitType.CANDELA: "cd",
+    UnitType.CELSIUS: "deg_C",
+    UnitType.COULOMB: "C",
+    UnitType.DIMENSIONLESS: "",
+    UnitType.FARAD: "F",
+    UnitType.GRAM: "g",
+    UnitType.GRAY: "Gy",
+    UnitType.HENRY: "H",
+    UnitType.HERTZ: "Hz",
+    UnitType.ITEM: "item",
+    UnitType.JOULE: "J",
+    UnitType.KATAL: "kat",
+    UnitType.KELVIN: "K",
+    UnitType.KILOGRAM: "kg",
+    UnitType.LITRE: "l",
+    UnitType.LUMEN: "lm",
+    UnitType.LUX: "lx",
+    UnitType.METRE: "m",
+    UnitType.MOLE: "mol",
+    UnitType.NEWTON: "N",
+    UnitType.OHM: "Ohm",
+    UnitType.PASCAL: "Pa",
+    UnitType.RADIAN: "rad",
+    UnitType.SECOND: "s",
+    UnitType.SIEMENS: "S",
+    UnitType.SIEVERT: "Sv",
+    UnitType.STERADIAN: "sr",
+    UnitType.TESLA: "T",
+    UnitType.VOLT: "V",
+    UnitType.WATT: "W",
+    UnitType.WEBER: "Wb",
+}
+
+# The number of items in a mole, the factor of the 'avogadro' kind
+AVOGADRO_NUMBER = 6.02214076e23
+
+# Prefixes by their decimal exponent, to name scaled base units like astropy
+PREFIX_SYMBOLS = {
+    exponent: prefix for prefix, exponent in PREFIXES.items() if prefix != "µ"
+}
 
 
 def convert_unit(unit: str):
     """
     Convert a unit string or dictionary to a UnitDefinition object.
 
+    Parsed units are memoized by their string and by their dictionary form,
+    such that all fields holding the same unit share one frozen instance.
+    Use 'UnitDefinition.model_copy' to obtain a mutable copy.
+
     Args:
         unit (str): The unit to convert, either as a JSON string or a dictionary.
 
     Returns:
         UnitDefinition: The converted unit definition.
     """
-    if isinstance(unit, dict):
-        return UnitDefinition(**unit)
+    if isinstance(unit, UnitDefinition):
+        return unit
+    elif isinstance(unit, dict):
+        try:
+            return _convert_unit_items(_unit_items(unit))
+        except TypeError:
+            # Unhashable values, leave the error reporting to the validation
+            return UnitDefinition(**unit)
+
+    return _convert_unit_text(unit)
+
+
+def parse_many(units: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a column of unit strings to UnitDefinition objects.
+
+    The column is factorized first, such that every distinct unit is parsed
+    once and all rows holding it refer to the same frozen instance. Pandas
+    objects are factorized by pandas, other iterables in a single pass.
+    Missing values, i.e. None and NaN, result in None without an error.
+
+    Args:
+        units (Iterable[Any]): The unit strings, e.g. a list or a pandas Series.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: An object array of the unit definitions,
+            None where parsing failed or the value is missing, and a boolean
+            mask of the rows that failed to parse.
+    """
+    if hasattr(units, "factorize"):
+        codes, uniques = units.factorize()
+    else:
+        codes, uniques = _factorize(units)
+
+    # The extra last slot is picked by the code -1 of missing values
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    failed = np.zeros(len(uniques) + 1, dtype=bool)
+
+    for index, unit in enumerate(uniques):
+        try:
+            parsed[index] = _parse_one(unit)
+        except (ValueError, KeyError, TypeError):
+            failed[index] = True
+
+    codes = np.asarray(codes, dtype=np.intp)
+
+    return parsed[codes], failed[codes]
+
+
+def _factorize(units: Iterable[Any]) -> tuple[np.ndarray, list]:
+    """
+    Map the values of a column to codes of their distinct values.
+
+    Missing values have the code -1. Dictionaries are keyed like in the memo
+    of 'convert_unit'.
+    """
+    units = list(units)
+    codes = np.empty(len(units), dtype=np.intp)
+    index: dict[Any, int] = {}
+    uniques: list = []
+
+    for row, unit in enumerate(units):
+        if unit is None or (isinstance(unit, float) and math.isnan(unit)):
+            codes[row] = -1
+            continue
+
+        try:
+            key = _unit_items(unit) if isinstance(unit, dict) else unit
+            code = index.setdefault(key, len(uniques))
+        except TypeError:
+            # Unhashable values are kept apart and fail to parse on their own
+            code = len(uniques)
+
+        if code == len(uniques):
+            uniques.append(unit)
+
+        codes[row] = code
+
+    return codes, uniques
+
+
+def _parse_one(unit: Any) -> UnitDefinition:
+    """
+    Convert a single distinct value of a unit column.
+
+    Raises:
+        TypeError: If the value is neither a unit string nor a unit definition.
+    """
+    if not isinstance(unit, (str, dict, UnitDefinition)):
+        raise TypeError(f"Expected a unit string, got '{type(unit).__name__}'")
+
+    return convert_unit(unit)
+
+
+def from_astropy(unit) -> UnitDefinition:
+    """
+    Convert an astropy unit to a UnitDefinition object.
+
+    The unit is converted through its string, such that it shares the memo
+    of 'convert_unit' and repeated conversions return the same frozen instance.
+
+    Args:
+        unit (UnitBase): The astropy unit to convert.
+
+    Returns:
+        UnitDefinition: The converted unit definition.
+    """
+    return convert_unit(_astropy_string(unit))
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def to_astropy(key: tuple):
+    """
+    Compose an astropy unit from the base units of a unit definition.
+
+    Args:
+        key (tuple): The kind, exponent, multiplier and scale of each base unit,
+            see 'conversion.unit_key'.
+
+    Returns:
+        UnitBase: The astropy unit, the product of the base units.
+    """
+    u = astropy_units()
+    unit = u.dimensionless_unscaled
+
+    for kind, exponent, multiplier, scale in key:
+        unit = unit * _astropy_base_unit(kind, multiplier, scale) ** exponent
+
+    return unit
+
+
+def _astropy_base_unit(kind: UnitType, multiplier: float | None, scale: float | None):
+    """
+    The astropy unit of a single base unit, prefixed where astropy has a prefix.
+    """
+    u = astropy_units()
+    base = u.Unit(ASTROPY_SYMBOLS[kind])
+    factor = (multiplier or 1.0) * 10.0 ** (scale or 0.0)
+
+    if kind is UnitType.AVOGADRO:
+        factor *= AVOGADRO_NUMBER
+
+    if factor == 1.0:
+        return base
+
+    scaled = u.CompositeUnit(factor, [base], [1])
+    prefix = PREFIX_SYMBOLS.get(scale) if multiplier in (None, 1.0) else None
+
+    if prefix and ASTROPY_SYMBOLS[kind]:
+        try:
+            prefixed = u.Unit(prefix + ASTROPY_SYMBOLS[kind])
+        except ValueError:
+            return scaled
+
+        if prefixed == scaled:
+            return prefixed
+
+    return scaled
+
+
+def _astropy_string(unit) -> str:
+    """
+    The string of an astropy unit that keeps the full precision of its scale.
+    """
+    scale = getattr(unit, "scale", 1.0)
+
+    if scale == 1.0:
+        return unit.to_string()
 
-    try:
-        return UnitDefinition(**json.loads(unit))
-    except JSONDecodeError:
-        return _convert_unit_string(unit)
+    powers = [
+        f"{base.to_string()}^{power}" for base, power in zip(unit.bases, unit.powers)
+    ]
+
+    return " ".join([repr(float(scale)), *powers])
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _convert_unit_text(unit: str) -> UnitDefinition:
+    """
+    Convert a unit string or its JSON representation to a frozen UnitDefinition.
+    """
+    if unit.lstrip().startswith("{"):
+        try:
+            return convert_unit(json.loads(unit))
+        except JSONDecodeError:
+            pass
+
+    return _convert_unit_string(unit).freeze()
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _convert_unit_items(items: tuple) -> UnitDefinition:
+    """
+    Validate the canonical form of a unit dictionary to a frozen UnitDefinition.
+    """
+    unit = dict(items)
+
+    if "base_units" in unit:
+        unit["base_units"] = [dict(base_unit) for base_unit in unit["base_units"]]
+
+    return UnitDefinition(**unit).freeze()
+
+
+def _unit_items(unit: dict) -> tuple:
+    """
+    Turn a unit dictionary into a hashable key.
+
+    The key follows the order of the dictionary, which is the same for all
+    dumped unit definitions.
+
+    Raises:
+        TypeError: If the dictionary contains unhashable values.
+    """
+    base_units = unit.get("base_units")
+
+    if isinstance(base_units, list):
+        unit = {
+            **unit,
+            "base_units": tuple(
+                tuple(base.items()) if isinstance(base, dict) else base
+                for base in base_units
+            ),
+        }
+
+    key = tuple(unit.items())
+    hash(key)
+
+    return key
 
 
 def _convert_unit_string(unit_string: str):
     """
     Convert a unit string to a UnitDefinition object.
 
+    Common units are parsed by 'parse_unit', all others by astropy.
+
     Args:
         unit_string (str): The unit string to convert.
 
     Returns:
         UnitDefinition: The converted unit definition.
     """
-    unit = Unit(unit_string)
+    unit_def = parse_unit(unit_string)
+
+    if unit_def is None:
+        unit_def = _convert_astropy_unit(unit_string)
+
+    return unit_def
+
+
+def _convert_astropy_unit(unit_string: str):
+    """
+    Convert a unit string to a UnitDefinition object using astropy.
+
+    Args:
+        unit_string (str): The unit string to convert.
+
+    Returns:
+        UnitDefinition: The converted unit definition.
+    """
+    u = astropy_units()
+    unit = u.Unit(unit_string)
     unit_def = UnitDefinition(id=unit.to_string(), name=unit.to_string())
 
-    if isinstance(unit, CompositeUnit):
+    if isinstance(unit, u.CompositeUnit):
         _process_composite_unit(unit, unit_def)
     elif len(unit.decompose().bases) > 1:
         _process_composite_unit(unit.decompose(), unit_def)
@@ -110,7 +424,7 @@ def _process_composite_unit(unit, unit_def):
 
     for base, exponent in zip(bases, unit.powers):
         if len(base.decompose().bases) > 1:
-            _process_composite_unit(base.decompose(), unit_def)
+            _process_composite_unit((base**exponent).decompose(), unit_def)
         else:
             _process_base_unit(unit_def, base, exponent)
 
@@ -151,6 +465,8 @@ def _process_base_unit(
         base (Unit | PrefixUnit | IrreducibleUnit | UnitBase): The base unit to process.
         exponent (int): The exponent of the unit.
     """
+    u = astropy_units()
+
     if base.is_equivalent(u.liter):
         scale = base.to(u.liter)
         unit_def.add_to_base_units(
@@ -175,21 +491,22 @@ def _process_base_unit(
             scale=int(math.log10(scale)),
             multiplier=1.0,
         )
-    elif isinstance(base, PrefixUnit):
-        base = base.decompose()
+    elif isinstance(base, u.PrefixUnit):
+        # E.g. 1000 Hz for kHz, which keeps the kind of the unit
+        base = base.represents
         unit_def.add_to_base_units(
             kind=UNIT_MAPPING[base.bases[0].to_string()],
             exponent=exponent,
             scale=int(math.log10(base.scale)),
             multiplier=1.0,
         )
-    elif isinstance(base, Unit):
+    elif isinstance(base, u.Unit):
         if base.is_equivalent(u.second):
             base = base.decompose()
             unit_def.add_to_base_units(
                 kind=UNIT_MAPPING[base.bases[0].to_string()],
                 exponent=exponent,
-                scale=1,
+                scale=0,
                 multiplier=base.scale,
             )
         else:
@@ -199,7 +516,7 @@ def _process_base_unit(
                 scale=0.0,
                 multiplier=1.0,
             )
-    elif isinstance(base, IrreducibleUnit):
+    elif isinstance(base, u.IrreducibleUnit):
         unit_def.add_to_base_units(
             kind=UNIT_MAPPING[base.bases[0].to_string()],
             exponent=exponent,
@@ -0,0 +1,209 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Mapping
+
+import numpy as np
+
+from .conversion import _decompose, conversion, unit_key
+from .converter import convert_unit
+from .unit_definition import UnitDefinition, UnitType
+
+# Symbols of the SI base units per base kind
+SI_SYMBOLS = {
+    UnitType.METRE: "m",
+    UnitType.GRAM: "kg",
+    UnitType.SECOND: "s",
+    UnitType.AMPERE: "A",
+    UnitType.KELVIN: "K",
+    UnitType.MOLE: "mol",
+    UnitType.CANDELA: "cd",
+}
+
+
+def normalize_units(
+    document: Any,
+    target: str | Mapping[str | UnitDefinition, str | UnitDefinition] = "si",
+):
+    """
+    Express the numeric values of a document in canonical units.
+
+    Unit fields are found through the field metadata of the data models. A
+    unit field named '<name>_unit' applies to the float field '<name>' next
+    to it. Other unit fields and lists of units are left as they are, since
+    they cannot be related to values.
+
+    The document is traversed once. Values sharing a source and target unit
+    are converted together in one vectorized operation, and the unit fields
+    are set to the shared instances of the target units. All conversions are
+    computed before the document is changed, such that an invalid target
+    leaves the document untouched.
+
+    Args:
+        document (DataModel): The document to normalize in place.
+        target (str | Mapping, optional): 'si' to convert to SI base units, or a
+            mapping of source units to target units. Units missing in the mapping
+            are kept. Defaults to 'si'.
+
+    Returns:
+        DataModel: The normalized document.
+
+    Raises:
+        ValueError: If a target has a different dimension than its source.
+    """
+    resolve = _si_unit if target == "si" else _mapping_resolver(target)
+    groups: dict[tuple, list[tuple[Any, str, Any]]] = {}
+
+    stack = [document]
+
+    while stack:
+        obj = stack.pop()
+        fields = type(obj).__mdmodels__.fields  # type: ignore
+
+        for unit_field, value_fields in _unit_groups(fields):
+            source = getattr(obj, unit_field)
+
+            if source is None or (unit := resolve(source)) is None:
+                continue
+
+            group = groups.setdefault((unit_key(source), unit_key(unit)), [])
+            group.append((obj, unit_field, (source, unit)))
+
+            for value_field in value_fields:
+                if (values := getattr(obj, value_field)) is not None:
+                    group.append((obj, value_field, values))
+
+        for field in fields.values():
+            if field.is_model and not field.is_unit:
+                value = getattr(obj, field.name)
+                if isinstance(value, list):
+                    stack.extend(
+                        item for item in value if hasattr(item, "__mdmodels__")
+                    )
+                elif hasattr(value, "__mdmodels__"):
+                    stack.append(value)
+
+    updates = [update for group in groups.values() for update in _convert_group(group)]
+
+    for owner, name, value in updates:
+        setattr(owner, name, value)
+
+    return document
+
+
+def _unit_groups(fields: dict) -> list[tuple[str, list[str]]]:
+    """
+    Relate the unit fields of a model to the float fields they apply to.
+    """
+    units = [
+        name for name, field in fields.items() if field.is_unit and not field.is_array
+    ]
+    floats = [
+        name
+        for name, field in fields.items()
+        if not field.is_union and not field.is_model and field.dtype is float
+    ]
+
+    return [
+        (unit, [unit.removesuffix("_unit")])
+        for unit in units
+        if unit.endswith("_unit") and unit.removesuffix("_unit") in floats
+    ]
+
+
+def _convert_group(group: list[tuple[Any, str, Any]]) -> list[tuple[Any, str, Any]]:
+    """
+    Convert all values of a group of equal units at once.
+
+    The group holds (object, field, value) entries, where the values of
+    unit fields are (source, target) pairs. The document is not changed;
+    the converted values and target units are returned as (object, field,
+    value) updates.
+
+    Raises:
+        ValueError: If the target has a different dimension than the source.
+    """
+    units = [entry for entry in group if isinstance(entry[2], tuple)]
+    values = [entry for entry in group if not isinstance(entry[2], tuple)]
+    source, target = units[0][2]
+    factor, offset = conversion(source, target)
+    updates = []
+
+    if values and (factor != 1.0 or offset != 0.0):
+        arrays = [np.asarray(value, dtype=np.float64).ravel() for *_, value in values]
+        converted = np.concatenate(arrays) * factor + offset
+        parts = np.split(converted, np.cumsum([len(a) for a in arrays])[:-1])
+
+        for (owner, name, value), part in zip(values, parts):
+            if isinstance(value, np.ndarray):
+                updates.append((owner, name, part))
+            elif isinstance(value, list):
+                updates.append((owner, name, part.tolist()))
+            else:
+                updates.append((owner, name, float(part[0])))
+
+    updates.extend((owner, name, target) for owner, name, _ in units)
+
+    return updates
+
+
+def _si_unit(unit: UnitDefinition) -> UnitDefinition | None:
+    """
+    The SI unit with the dimensions of a unit, or None if there is none.
+    """
+    return _si_unit_of(unit_key(unit))
+
+
+@lru_cache(maxsize=1024)
+def _si_unit_of(key: tuple) -> UnitDefinition | None:
+    """
+    The SI unit with the dimensions of a unit, given by its key.
+    """
+    _, dimensions = _decompose(key)
+
+    if not dimensions:
+        return convert_unit("dimensionless")
+    elif any(kind not in SI_SYMBOLS for kind in dimensions):
+        return None
+
+    unit = convert_unit(
+        " ".join(
+            f"{SI_SYMBOLS[kind]}^{exponent}" for kind, exponent in dimensions.items()
+        )
+    )
+
+    # Parse the canonical name again to share the instance with e.g. 's'
+    return convert_unit(unit.name)
+
+
+def _mapping_resolver(mapping: Mapping[str | UnitDefinition, str | UnitDefinition]):
+    """
+    Create a function looking up the target unit of a unit in a mapping.
+    """
+    targets = {
+        unit_key(convert_unit(source)): convert_unit(target)
+        for source, target in mapping.items()
+    }
+
+    return lambda unit: targets.get(unit_key(unit))
@@ -0,0 +1,360 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+import re
+from typing import NamedTuple
+
+from .unit_definition import UnitDefinition, UnitType
+
+# SI prefixes and their decimal exponents, as named by astropy
+PREFIXES = {
+    "Y": 24,
+    "Z": 21,
+    "E": 18,
+    "P": 15,
+    "T": 12,
+    "G": 9,
+    "M": 6,
+    "k": 3,
+    "h": 2,
+    "da": 1,
+    "d": -1,
+    "c": -2,
+    "m": -3,
+    "u": -6,
+    "µ": -6,
+    "n": -9,
+    "p": -12,
+    "f": -15,
+    "a": -18,
+    "z": -21,
+    "y": -24,
+}
+
+# Aliases of prefixes in the names of the parsed units
+PREFIX_NAMES = {"µ": "u"}
+
+
+class Symbol(NamedTuple):
+    """
+    A unit symbol known to the fast path.
+
+    Attributes:
+        name (str): The name astropy uses for the unit.
+        kind (UnitType): The kind of the resulting base unit.
+        prefixable (bool): Whether the unit accepts SI prefixes.
+        scale (int): The scale of the base unit without a prefix.
+        multiplier (float): The multiplier of the base unit.
+        per (UnitType | None): The kind the unit is divided by, e.g. litre for molar.
+    """
+
+    name: str
+    kind: UnitType
+    prefixable: bool = True
+    scale: int = 0
+    multiplier: float = 1.0
+    per: UnitType | None = None
+
+
+SYMBOLS = {
+    "l": Symbol("l", UnitType.LITRE),
+    "L": Symbol("l", UnitType.LITRE),
+    "m": Symbol("m", UnitType.METRE),
+    "g": Symbol("g", UnitType.GRAM),
+    "mol": Symbol("mol", UnitType.MOLE),
+    "s": Symbol("s", UnitType.SECOND),
+    "K": Symbol("K", UnitType.KELVIN),
+    "A": Symbol("A", UnitType.AMPERE),
+    "cd": Symbol("cd", UnitType.CANDELA),
+    "min": Symbol("min", UnitType.SECOND, False, multiplier=60.0),
+    "h": Symbol("h", UnitType.SECOND, False, multiplier=3600.0),
+    "hr": Symbol("h", UnitType.SECOND, False, multiplier=3600.0),
+    "d": Symbol("d", UnitType.SECOND, False, multiplier=86400.0),
+    "day": Symbol("d", UnitType.SECOND, False, multiplier=86400.0),
+    "Hz": Symbol("Hz", UnitType.HERTZ, False),
+    "M": Symbol("M", UnitType.MOLE, per=UnitType.LITRE),
+    "Pa": Symbol("Pa", UnitType.PASCAL),
+    "J": Symbol("J", UnitType.JOULE),
+    "V": Symbol("V", UnitType.VOLT),
+    "N": Symbol("N", UnitType.NEWTON),
+    "W": Symbol("W", UnitType.WATT),
+    "Bq": Symbol("Bq", UnitType.BECQUEREL),
+    "kat": Symbol("kat", UnitType.KATAL),
+    "deg_C": Symbol("deg_C", UnitType.CELSIUS, False),
+    "°C": Symbol("deg_C", UnitType.CELSIUS, False),
+}
+
+TOKEN_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<open>\()|(?P<close>\))|(?P<power>\*\*|\^)|(?P<div>/)|(?P<mul>\*|\.)"
+    r"|(?P<number>[+-]?\d+)"
+    r"|(?P<unit>[A-Za-zµ°_]+)(?P<exponent>[+-]?\d+)?"
+    r")"
+)
+
+
+# Tokens that continue a product of units
+UNIT_START = ("mul", "open", "unit")
+
+
+class Unsupported(Exception):
+    """
+    Raised for unit strings outside of the grammar of the fast path.
+    """
+
+
+class _Parser:
+    """
+    A recursive descent parser following astropy's generic unit grammar.
+
+    Division binds weaker than multiplication, such that 'a / b c' is read
+    as 'a / (b c)' and 'a / b / c' as '(a / b) / c'. Parentheses group
+    products only and a leading '1' must be followed by a single divisor.
+    """
+
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def parse(self) -> dict[str, int]:
+        if self.peek() == ("number", "1", None):
+            self.position += 1
+            self.take("div")
+            factors = _power(self.unit_expression(), -1)
+        else:
+            factors = self.division()
+
+        if self.position != len(self.tokens):
+            raise Unsupported
+
+        return factors
+
+    def peek(self) -> tuple[str, str, str | None] | None:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def take(self, kind: str) -> tuple[str, str, str | None]:
+        token = self.peek()
+
+        if token is None or token[0] != kind:
+            raise Unsupported
+
+        self.position += 1
+        return token
+
+    def division(self) -> dict[str, int]:
+        factors = self.product()
+
+        while (token := self.peek()) is not None and token[0] == "div":
+            self.position += 1
+            _combine(factors, self.product(), -1)
+
+        return factors
+
+    def product(self) -> dict[str, int]:
+        factors = self.unit_expression()
+
+        while (token := self.peek()) is not None and token[0] in UNIT_START:
+            if token[0] == "mul":
+                self.position += 1
+            elif token[0] == "open":
+                # Astropy reads 'unit (...)' as a function call
+                raise Unsupported
+
+            _combine(factors, self.unit_expression(), 1)
+
+        return factors
+
+    def unit_expression(self) -> dict[str, int]:
+        token = self.peek()
+
+        if token is not None and token[0] == "open":
+            self.position += 1
+            factors = self.product()
+            self.take("close")
+            return factors
+
+        _, unit, exponent = self.take("unit")
+
+        if exponent is not None:
+            return {unit: int(exponent)}
+        elif (token := self.peek()) is not None and token[0] == "power":
+            self.position += 1
+            return {unit: self.exponent()}
+
+        return {unit: 1}
+
+    def exponent(self) -> int:
+        token = self.peek()
+
+        if token is not None and token[0] == "open":
+            self.position += 1
+            exponent = int(self.take("number")[1])
+            self.take("close")
+            return exponent
+
+        return int(self.take("number")[1])
+
+
+def parse_unit(unit_string: str) -> UnitDefinition | None:
+    """
+    Parse a common unit string without astropy.
+
+    Covers SI prefixes on the units in 'SYMBOLS', integer exponents and
+    products and quotients written with '/', '*', '.' or spaces. The result
+    matches what the astropy path of 'convert_unit' produces for the same
+    string, including the name of the unit.
+
+    Args:
+        unit_string (str): The unit string to parse.
+
+    Returns:
+        UnitDefinition | None: The unit definition, or None if the string is not covered.
+    """
+    try:
+        powers = _Parser(unit_string).parse()
+        resolved = [(_resolve(unit), power) for unit, power in powers.items()]
+    except (Unsupported, ValueError):
+        return None
+
+    kinds = {kind for (_, kind, *_), _ in resolved}
+    units = [(unit, power) for unit, power in resolved if power]
+
+    if not units:
+        return None
+
+    names: dict[str, int] = {}
+    for (name, *_), power in units:
+        names[name] = names.get(name, 0) + power
+
+    if len(names) != len(units) or {UnitType.HERTZ, UnitType.SECOND} <= kinds:
+        # Units that astropy merges, e.g. different spellings of the
+        # same unit or hertz and seconds, are left to astropy
+        return None
+
+    units.sort(key=lambda item: (-item[1], item[0][0]))
+    name = _format(units)
+    unit_def = UnitDefinition(id=name, name=name)
+
+    for (_, kind, scale, multiplier, per), power in units:
+        unit_def.add_to_base_units(
+            kind=kind,
+            exponent=power,
+            scale=scale,
+            multiplier=multiplier,
+        )
+
+        if per is not None:
+            unit_def.add_to_base_units(
+                kind=per, exponent=-power, scale=0.0, multiplier=1.0
+            )
+
+    return unit_def
+
+
+def _tokenize(text: str) -> list[tuple[str, str, str | None]]:
+    """
+    Split a unit string into (kind, text, exponent) tokens.
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+
+        if match is None or match.end() == position:
+            raise Unsupported
+
+        kind = match.lastgroup if match.lastgroup != "exponent" else "unit"
+        tokens.append((kind, match.group(kind), match.group("exponent")))
+        position = match.end()
+
+    return tokens
+
+
+def _resolve(unit: str) -> tuple[str, UnitType, float, float, UnitType | None]:
+    """
+    Resolve a (prefixed) unit symbol to its name, kind, scale, multiplier and divisor.
+    """
+    if unit in SYMBOLS:
+        symbol = SYMBOLS[unit]
+        return (
+            symbol.name,
+            symbol.kind,
+            float(symbol.scale),
+            symbol.multiplier,
+            symbol.per,
+        )
+
+    for prefix in sorted(PREFIXES, key=len, reverse=True):
+        symbol = SYMBOLS.get(unit[len(prefix) :])
+
+        if unit.startswith(prefix) and symbol is not None and symbol.prefixable:
+            name = PREFIX_NAMES.get(prefix, prefix) + symbol.name
+            return (
+                name,
+                symbol.kind,
+                float(PREFIXES[prefix]),
+                symbol.multiplier,
+                symbol.per,
+            )
+
+    raise Unsupported
+
+
+def _combine(factors: dict[str, int], other: dict[str, int], sign: int):
+    """
+    Multiply (sign 1) or divide (sign -1) the factors by other factors.
+    """
+    for unit, power in other.items():
+        factors[unit] = factors.get(unit, 0) + sign * power
+
+
+def _power(factors: dict[str, int], exponent: int) -> dict[str, int]:
+    """
+    Raise the factors to a power.
+    """
+    return {unit: power * exponent for unit, power in factors.items()}
+
+
+def _format(units: list[tuple[tuple, int]]) -> str:
+    """
+    Format sorted units the way astropy's generic format does.
+    """
+    numerator = [_format_power(name, power) for (name, *_), power in units if power > 0]
+    denominator = [
+        _format_power(name, -power) for (name, *_), power in units if power < 0
+    ]
+
+    text = " ".join(numerator) or "1"
+
+    if len(denominator) == 1:
+        text += f" / {denominator[0]}"
+    elif denominator:
+        text += f" / ({' '.join(denominator)})"
+
+    return text
+
+
+def _format_power(name: str, power: int) -> str:
+    return name if power == 1 else f"{name}{power}"
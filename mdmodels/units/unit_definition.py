@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
-from xml.dom import minidom
+from typing import Any, Optional
 
-from astropy.units import Unit
+from pydantic import PrivateAttr
 from pydantic_xml import attr, element
 
 from mdmodels.datamodel import DataModel
@@ -28,6 +27,199 @@ class UnitDefinition(DataModel):
         default_factory=list, tag="base_units", json_schema_extra=dict()
     )
 
+    _frozen: bool = PrivateAttr(False)
+    _astropy: Any = PrivateAttr(None)
+
+    def __eq__(self, other):
+        # Units are equal if they describe the same quantity, regardless of
+        # their names and of how their base units are written down
+        if not isinstance(other, UnitDefinition):
+            return NotImplemented
+
+        return self.canonical == other.canonical
+
+    def __hash__(self):
+        return hash(self.canonical)
+
+    def __setattr__(self, name, value):
+        _check_mutable(self, name)
+        super().__setattr__(name, value)
+
+    @property
+    def canonical(self) -> tuple:
+        """
+        The canonical form of the unit definition.
+
+        The base units are decomposed into the SI base kinds and sorted, their
+        exponents merged and their multipliers and scales folded into a single
+        normalized multiplier and scale. "mmol / l" and "mol / m3" have the same
+        canonical form, while degrees Celsius and kelvin differ by their offset.
+
+        Returns:
+            tuple: The dimensions as (kind, exponent) pairs, the multiplier, the scale
+                and the offset.
+        """
+        from .conversion import canonical_form, unit_key
+
+        return canonical_form(unit_key(self))
+
+    def is_equivalent(self, other: UnitDefinition | str) -> bool:
+        """
+        Whether values in this unit can be converted to another unit.
+
+        Args:
+            other (UnitDefinition | str): The unit to compare with.
+
+        Returns:
+            bool: True if both units have the same dimensions.
+        """
+        return self.canonical[0] == _as_unit(other).canonical[0]
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether the unit definition is shared and must not be modified.
+
+        Parsed unit definitions are interned, i.e. every field holding the same
+        unit refers to the same frozen instance. Use 'model_copy' to obtain a
+        mutable copy.
+        """
+        return self._frozen
+
+    def freeze(self) -> UnitDefinition:
+        """
+        Make the unit definition and its base units immutable.
+
+        Returns:
+            UnitDefinition: The frozen unit definition.
+        """
+        for base_unit in self.base_units:
+            base_unit._frozen = True
+
+        self.__dict__["base_units"] = FrozenList(self.base_units)
+        self._frozen = True
+
+        return self
+
+    def model_copy(self, *, update=None, deep: bool = False) -> UnitDefinition:
+        """
+        Create a mutable copy of the unit definition.
+
+        The base units are always copied, such that modifying the copy never
+        affects a shared unit definition.
+
+        Args:
+            update (dict, optional): Values to change in the copy. Defaults to None.
+            deep (bool, optional): Unused, copies are always deep. Defaults to False.
+
+        Returns:
+            UnitDefinition: The mutable copy.
+        """
+        copy = super().model_copy(deep=True)
+        copy._frozen = False
+        copy._astropy = None
+        copy.__dict__["base_units"] = [
+            base_unit.model_copy() for base_unit in self.base_units
+        ]
+
+        for name, value in (update or {}).items():
+            setattr(copy, name, value)
+
+        return copy
+
+    def conversion_factor(self, other: UnitDefinition | str) -> float:
+        """
+        The factor converting values in this unit to another unit.
+
+        The dimensions of both units are derived from the kinds and exponents
+        of their base units and must match. Factors are cached per pair of units.
+
+        Args:
+            other (UnitDefinition | str): The unit to convert to.
+
+        Returns:
+            float: The factor to multiply values with.
+
+        Raises:
+            ValueError: If the units have different dimensions or the conversion
+                needs an offset, e.g. from degrees Celsius to kelvin. Use 'convert'
+                for such conversions.
+        """
+        from .conversion import conversion
+
+        factor, offset = conversion(self, _as_unit(other))
+
+        if offset:
+            raise ValueError(
+                f"Converting '{self.name}' to '{_as_unit(other).name}' needs an offset, "
+                "use 'convert' instead."
+            )
+
+        return factor
+
+    def convert(self, values, to: UnitDefinition | str):
+        """
+        Convert values in this unit to another unit.
+
+        The values are converted in one vectorized operation. Conversions from
+        or to degrees Celsius apply the offset to kelvin.
+
+        Args:
+            values: A number, a sequence of numbers or a NumPy array.
+            to (UnitDefinition | str): The unit to convert to.
+
+        Returns:
+            np.ndarray | float: The converted values, a float for a single number.
+
+        Raises:
+            ValueError: If the units have different dimensions.
+        """
+        from .conversion import convert
+
+        return convert(values, self, _as_unit(to))
+
+    def to_astropy(self):
+        """
+        Convert the unit definition to an astropy unit.
+
+        The astropy unit is composed from the kind, exponent, scale and multiplier
+        of the base units, without parsing the name. It is cached on shared unit
+        definitions, mutable ones reuse the unit of equal base units.
+
+        Returns:
+            UnitBase: The astropy unit representation of the unit definition.
+        """
+        if self._astropy is not None:
+            return self._astropy
+
+        from .conversion import unit_key
+        from .converter import to_astropy
+
+        unit = to_astropy(unit_key(self))
+
+        if self._frozen:
+            self._astropy = unit
+
+        return unit
+
+    @classmethod
+    def from_astropy(cls, unit) -> UnitDefinition:
+        """
+        Convert an astropy unit to a unit definition.
+
+        Conversions share the memo of 'convert_unit', hence converting the same
+        astropy unit again returns the same frozen unit definition.
+
+        Args:
+            unit (UnitBase): The astropy unit to convert.
+
+        Returns:
+            UnitDefinition: The converted unit definition.
+        """
+        from .converter import from_astropy
+
+        return from_astropy(unit)
+
     def add_to_base_units(
         self,
         kind: UnitType,
@@ -55,28 +247,11 @@ class UnitDefinition(DataModel):
             "scale": scale,
         }
 
+        _check_mutable(self, "base_units")
         self.base_units.append(BaseUnit(**params))
 
         return self.base_units[-1]
 
-    def xml(self, encoding: str = "unicode") -> str | bytes:
-        """
-        Converts the object to an XML string.
-
-        Args:
-            encoding (str, optional): The encoding to use. If set to "bytes", will return a bytes string.
-                                      Defaults to "unicode".
-
-        Returns:
-            str | bytes: The XML representation of the object.
-        """
-        if encoding == "bytes":
-            return self.to_xml()
-
-        raw_xml = self.to_xml(encoding=None)
-        parsed_xml = minidom.parseString(raw_xml)
-        return parsed_xml.toprettyxml(indent="  ")
-
 
 class BaseUnit(DataModel):
     """
@@ -99,32 +274,42 @@ class BaseUnit(DataModel):
 
     scale: Optional[float] = attr(default=None, tag="scale", json_schema_extra=dict())
 
-    def xml(self, encoding: str = "unicode") -> str | bytes:
+    _frozen: bool = PrivateAttr(False)
+
+    def __eq__(self, other):
+        # Shared and mutable copies of the same unit are equal
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __setattr__(self, name, value):
+        _check_mutable(self, name)
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update=None, deep: bool = False) -> BaseUnit:
         """
-        Converts the object to an XML string.
+        Create a mutable copy of the base unit.
 
         Args:
-            encoding (str, optional): The encoding to use. If set to "bytes", will return a bytes string.
-                                      Defaults to "unicode".
+            update (dict, optional): Values to change in the copy. Defaults to None.
+            deep (bool, optional): Whether to copy deeply. Defaults to False.
 
         Returns:
-            str | bytes: The XML representation of the object.
+            BaseUnit: The mutable copy.
         """
-        if encoding == "bytes":
-            return self.to_xml()
+        copy = super().model_copy(update=update, deep=deep)
+        copy._frozen = False
 
-        raw_xml = self.to_xml(encoding=None)
-        parsed_xml = minidom.parseString(raw_xml)
-        return parsed_xml.toprettyxml(indent="  ")
+        return copy
 
     def to_astropy(self):
         """
         Converts the base unit to an astropy unit.
 
         Returns:
-            Unit: The astropy unit representation of the base unit.
+            UnitBase: The astropy unit representation of the base unit.
         """
-        return Unit(self.name)
+        from .converter import to_astropy
+
+        return to_astropy(((self.kind, self.exponent, self.multiplier, self.scale),))
 
 
 class UnitType(Enum):
@@ -166,3 +351,44 @@ class UnitType(Enum):
     VOLT = "volt"
     WATT = "watt"
     WEBER = "weber"
+
+
+class FrozenList(list):
+    """
+    A list that refuses modifications, used for the base units of shared unit definitions.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(_FROZEN_MESSAGE)
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (list(self),)
+
+
+_FROZEN_MESSAGE = (
+    "Parsed unit definitions are shared and cannot be modified. "
+    "Use 'model_copy()' to obtain a mutable copy."
+)
+
+
+def _as_unit(unit: UnitDefinition | str) -> UnitDefinition:
+    """
+    Convert a unit string to a unit definition, if necessary.
+    """
+    if isinstance(unit, UnitDefinition):
+        return unit
+
+    from .converter import convert_unit
+
+    return convert_unit(unit)
+
+
+def _check_mutable(unit: UnitDefinition | BaseUnit, name: str):
+    """
+    Raise if a public attribute of a shared unit definition is modified.
+    """
+    if not name.startswith("_") and unit._frozen:
+        raise TypeError(_FROZEN_MESSAGE)
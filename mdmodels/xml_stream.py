@@ -0,0 +1,302 @@
+#  -----------------------------------------------------------------------------
+#   Copyright (c) 2024 Jan Range
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a copy
+#   of this software and associated documentation files (the "Software"), to deal
+#   in the Software without restriction, including without limitation the rights
+#   to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#   copies of the Software, and to permit persons to whom the Software is
+#   furnished to do so, subject to the following conditions:
+#  #
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#  #
+#   THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#   THE SOFTWARE.
+#  -----------------------------------------------------------------------------
+from pathlib import Path
+from typing import IO, Any, Generator, Iterable
+
+from pydantic_xml.element.native import etree
+
+from .datamodel import DataModel
+from .meta import FieldMeta, field_adapter
+
+
+class XMLItemReader:
+    """
+    Streams the repeated child elements of a large XML document.
+
+    The document is parsed incrementally and every child element found at the
+    item path is validated into its data model and yielded. Processed elements
+    are detached from the parsed tree, so memory use does not grow with the
+    number of children.
+
+    Scalar attributes and elements of the root are collected while parsing and
+    are available in 'attributes'. Root attributes are known as soon as the
+    first item is yielded, root elements once they have been passed.
+
+    Attributes:
+        model (type[DataModel]): The data model of the root element.
+        field (FieldMeta): The list field whose items are streamed.
+        attributes (dict[str, Any]): The validated scalar values of the root, keyed by field name.
+    """
+
+    def __init__(
+        self,
+        model: type[DataModel],
+        source: str | Path | IO[bytes],
+        item_path: str | None = None,
+    ):
+        self.model = model
+        self.field = _resolve_item_field(model, item_path)
+        self.attributes: dict[str, Any] = {}
+
+        if isinstance(source, Path):
+            source = str(source)
+
+        self._source = source
+
+    def __iter__(self) -> Generator[DataModel, None, None]:
+        item_model = self.field.dtype
+        item_tag = item_model.__xml_tag__ or item_model.__name__
+        item_parts = _item_parts(self.field)
+        scalars = {
+            field.xml_tag: field
+            for field in self.model.__mdmodels__.fields.values()  # type: ignore
+            if not field.is_model and not field.is_array and field.xml_wrapper is None
+        }
+
+        stack: list[Any] = []
+        tags: list[str] = []
+        inside = 0
+
+        for event, elem in etree.iterparse(self._source, events=("start", "end")):
+            if event == "start":
+                if not stack:
+                    self._read_attributes(elem.attrib, scalars)
+                else:
+                    tags.append(elem.tag)
+                    if inside or tags == item_parts:
+                        inside += 1
+
+                stack.append(elem)
+                continue
+
+            stack.pop()
+
+            if not stack:
+                break
+
+            if inside > 1:
+                inside -= 1
+                tags.pop()
+                continue
+
+            if inside == 1:
+                elem.tag = item_tag
+                yield item_model.from_xml_tree(elem)
+                inside = 0
+            elif (
+                len(tags) == 1
+                and elem.tag in scalars
+                and not scalars[elem.tag].is_xml_attr
+            ):
+                field = scalars[elem.tag]
+                self.attributes[field.name] = _validate(self.model, field, elem.text)
+            elif tags == item_parts[: len(tags)]:
+                tags.pop()
+                continue
+
+            stack[-1].remove(elem)
+            tags.pop()
+
+    def _read_attributes(self, attrib: dict[str, str], scalars: dict[str, FieldMeta]):
+        """
+        Validate the attributes of the root element.
+        """
+        for tag, field in scalars.items():
+            if field.is_xml_attr and tag in attrib:
+                self.attributes[field.name] = _validate(self.model, field, attrib[tag])
+
+
+class XMLStreamWriter:
+    """
+    Incrementally writes an XML document with a very large list of children.
+
+    The root element is serialized from the given root values, and the items
+    of the list field are serialized one at a time straight into the file.
+    The output is byte-identical to 'to_xml' of the equivalent document, while
+    memory use is bounded by a single child.
+
+    Example:
+        >>> with Experiment.xml_writer("out.xml", values={"name": "A"}) as writer:
+        ...     writer.write_all(measurements)
+
+    Attributes:
+        model (type[DataModel]): The data model of the root element.
+        field (FieldMeta): The list field whose items are streamed.
+    """
+
+    _MARKER = "__mdmodels_stream_item__"
+
+    def __init__(
+        self,
+        model: type[DataModel],
+        target: str | Path | IO[bytes],
+        field: str | None = None,
+        values: dict[str, Any] | None = None,
+        skip_empty: bool = False,
+    ):
+        self.model = model
+        self.field = _resolve_item_field(model, field)
+        self._values = dict(values or {})
+        self._skip_empty = skip_empty
+        self._suffix: bytes | None = None
+        self._closed = False
+
+        if self.field.name in self._values:
+            raise ValueError(
+                f"Field '{self.field.name}' is streamed and cannot be passed as a root value."
+            )
+
+        if isinstance(target, (str, Path)):
+            self._fp = open(target, "wb")
+            self._owns_fp = True
+        else:
+            self._fp = target
+            self._owns_fp = False
+
+    def __enter__(self) -> "XMLStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._owns_fp:
+            self._fp.close()
+
+    def write(self, item: DataModel | dict) -> None:
+        """
+        Serialize a single item of the list field into the document.
+
+        Args:
+            item (DataModel | dict): The item to write. Dictionaries are validated first.
+
+        Raises:
+            ValueError: If the writer has already been closed.
+        """
+        if self._closed:
+            raise ValueError("Cannot write to a closed XML writer.")
+
+        item_model = self.field.dtype
+
+        if not isinstance(item, item_model):
+            item = item_model.model_validate(item)
+
+        if self._suffix is None:
+            self._write_root(item)
+
+        element = item.to_xml_tree(skip_empty=self._skip_empty)
+        element.tag = self.field.xml_tag
+        self._fp.write(etree.tostring(element))
+
+    def write_all(self, items: Iterable[DataModel | dict]) -> None:
+        """
+        Serialize all items of an iterable, e.g. a generator, into the document.
+
+        Args:
+            items (Iterable[DataModel | dict]): The items to write.
+        """
+        for item in items:
+            self.write(item)
+
+    def close(self) -> None:
+        """
+        Finish the document and close the file if it was opened by the writer.
+        """
+        if self._closed:
+            return
+
+        if self._suffix is None:
+            root = self.model(**self._values)
+            self._fp.write(root.to_xml(skip_empty=self._skip_empty))
+        else:
+            self._fp.write(self._suffix)
+
+        self._closed = True
+
+        if self._owns_fp:
+            self._fp.close()
+
+    def _write_root(self, item: DataModel) -> None:
+        """
+        Write everything of the root element that precedes the items.
+
+        The root is serialized with the first item in place, which is then
+        swapped for a marker element to split the output into the parts
+        before and after the items.
+        """
+        root = self.model(**self._values, **{self.field.name: [item]})
+        tree = root.to_xml_tree(skip_empty=self._skip_empty)
+
+        parts = _item_parts(self.field)
+        parent = tree.find("/".join(parts[:-1])) if len(parts) > 1 else tree
+        index = [child.tag for child in parent].index(parts[-1])
+        parent[index] = etree.Element(self._MARKER)
+
+        marker = etree.tostring(etree.Element(self._MARKER))
+        prefix, self._suffix = etree.tostring(tree).split(marker)
+
+        self._fp.write(prefix)
+
+
+def _resolve_item_field(model: type[DataModel], item_path: str | None) -> FieldMeta:
+    """
+    Find the list field addressed by a field name or an XML path of the item element.
+
+    Without a path, the model must have exactly one list of data models.
+    """
+    candidates = [
+        field
+        for field in model.__mdmodels__.fields.values()  # type: ignore
+        if field.is_array and field.is_model and not field.is_union
+    ]
+
+    if item_path is None:
+        if len(candidates) != 1:
+            raise ValueError(
+                f"Model '{model.__name__}' has {len(candidates)} lists of objects. "
+                "Please specify the item path."
+            )
+        return candidates[0]
+
+    item_path = item_path.strip("/")
+
+    for field in candidates:
+        if item_path in (field.name, "/".join(_item_parts(field))):
+            return field
+
+    raise ValueError(
+        f"Item path '{item_path}' does not address a list of objects in '{model.__name__}'."
+    )
+
+
+def _item_parts(field: FieldMeta) -> list[str]:
+    """
+    Split the XML path of the items of a list field into element tags.
+    """
+    parts = field.xml_wrapper.split("/") if field.xml_wrapper else []
+    return parts + [field.xml_tag]
+
+
+def _validate(model: type[DataModel], field: FieldMeta, value: str | None) -> Any:
+    """
+    Validate the raw XML value of a scalar field.
+    """
+    return field_adapter(model, field.name).validate_python(value)
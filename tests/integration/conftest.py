@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+
+from mdmodels import sql
+from mdmodels.datamodel import DataModel
+
+
+@pytest.fixture(scope="session")
+def nested_library():
+    """
+    Library of the nested database fixture model.
+    """
+    return DataModel.from_markdown("./tests/fixtures/model_database_nested.md")
+
+
+@pytest.fixture(scope="session")
+def nested_sql_models(nested_library):
+    """
+    SQL models of the nested database fixture model.
+
+    SQLModel registers tables in a global metadata object, hence the models
+    are generated once per test session.
+    """
+    return sql.generate_sqlmodel(data_model=nested_library)
+
+
+@pytest.fixture(scope="session")
+def recursive_library():
+    """
+    Library of a data model whose objects nest objects of their own type.
+    """
+    return DataModel.from_markdown("./tests/fixtures/model_database_recursive.md")
+
+
+@pytest.fixture(scope="session")
+def recursive_sql_models(recursive_library):
+    """
+    SQL models of the recursive database fixture model.
+    """
+    return sql.generate_sqlmodel(data_model=recursive_library)
+
+
+@pytest.fixture
+def nested_dataset(nested_library):
+    """
+    A dataset with three species and two reactions.
+    """
+    lib = nested_library
+    return lib.Dataset(
+        name="dataset",
+        description="A nested dataset",
+        species=[
+            lib.Species(id="s1", name="Glucose", mw=180.16),
+            lib.Species(id="s2", name="Water", mw=18.02),
+            lib.Species(id="s3", name="ATP", mw=507.18),
+        ],
+        reactions=[
+            lib.Reaction(id="r1", rate=0.5),
+            lib.Reaction(id="r2", rate=2.0),
+        ],
+    )
+
+
+@pytest.fixture
+def count_statements():
+    """
+    Count the statements an engine executes, by their leading keyword.
+
+    Returns a function that starts counting on an engine and returns the
+    counter, e.g. 'counter["SELECT"]'. Batched 'executemany' calls count once.
+    """
+    listeners = []
+
+    def attach(engine) -> Counter:
+        counter = Counter()
+
+        def count(connection, cursor, statement, parameters, context, executemany):
+            counter[statement.split(None, 1)[0].upper()] += 1
+
+        event.listen(engine, "before_cursor_execute", count)
+        listeners.append((engine, count))
+
+        return counter
+
+    yield attach
+
+    for engine, count in listeners:
+        event.remove(engine, "before_cursor_execute", count)
@@ -0,0 +1,150 @@
+import pytest
+
+from mdmodels.datamodel import DataModel
+
+pa = pytest.importorskip("pyarrow")
+
+
+class TestArrow:
+    def test_schema(self):
+        """
+        Test that the Arrow schema mirrors the type graph of a data model.
+
+        This test verifies that primitive fields, lists, nested objects and
+        enumerations are mapped to the corresponding Arrow types.
+        """
+        # Arrange
+        from mdmodels.arrow import arrow_schema
+
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+
+        # Act
+        schema = arrow_schema(lib.Test)
+
+        # Assert
+        assert schema.field("name").type == pa.string()
+        assert schema.field("to_reference").type == pa.list_(pa.string())
+        assert pa.types.is_struct(schema.field("single_object").type)
+        assert pa.types.is_list(schema.field("nested_array").type)
+        assert pa.types.is_struct(schema.field("nested_array").type.value_type)
+        assert pa.types.is_dictionary(schema.field("ontology").type)
+
+    def test_to_arrow(self):
+        """
+        Test converting documents into an Arrow table.
+
+        This test verifies that every document becomes a row and that missing
+        enumeration values are stored as nulls.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        documents = self._create_documents(lib)
+
+        # Act
+        table = lib.to_arrow(documents, root="Test")
+
+        # Assert
+        assert table.num_rows == len(documents)
+        assert table.column("ontology").to_pylist() == [
+            None,
+            lib.Ontology.GO.value,
+            None,
+            lib.Ontology.GO.value,
+            None,
+        ]
+
+    def test_parquet_roundtrip(self, tmp_path):
+        """
+        Test that documents survive a Parquet roundtrip written in row groups.
+
+        This test writes two documents per row group and reads them back in
+        batches of the same size.
+        """
+        # Arrange
+        import pyarrow.parquet as pq
+
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        documents = self._create_documents(lib)
+        path = tmp_path / "tests.parquet"
+
+        # Act
+        written = lib.to_parquet(path, iter(documents), root="Test", row_group_size=2)
+        restored = list(lib.from_parquet(path, root="Test", batch_size=2))
+
+        # Assert
+        assert written == len(documents)
+        assert pq.ParquetFile(path).num_row_groups == 3
+        assert restored == documents
+
+    def test_union_roundtrip(self, tmp_path):
+        """
+        Test that fields with multiple types are stored and restored.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_multiple_types.md")
+        document = lib.Test(
+            primitive_types=1,
+            complex_types=lib.SecondType(value=2),
+            array_primitive_types=["a", 1.5, True],
+            array_complex_types=[lib.FirstType(value="x")],
+        )
+        path = tmp_path / "unions.parquet"
+
+        # Act
+        lib.to_parquet(path, [document], root="Test")
+
+        # Assert
+        assert list(lib.from_parquet(path, root="Test")) == [document]
+
+    def test_units_roundtrip(self, tmp_path):
+        """
+        Test that unit definitions are stored as nested structs and restored.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        document = lib.UnitExample(single_unit="mmol / l", multiple_units=["s"])
+        path = tmp_path / "units.parquet"
+
+        # Act
+        lib.to_parquet(path, [document], root="UnitExample")
+
+        # Assert
+        assert list(lib.from_parquet(path, root="UnitExample")) == [document]
+
+    def test_recursive_model(self):
+        """
+        Test that recursive data models are rejected, since Arrow schemas
+        cannot describe types of unbounded depth.
+        """
+        from mdmodels.arrow import arrow_schema
+
+        lib = DataModel.from_markdown("./tests/fixtures/model_recursion.md")
+
+        with pytest.raises(ValueError):
+            arrow_schema(lib.Recursive)
+
+    def test_unknown_root(self):
+        """
+        Test that an unknown root object is rejected.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+
+        with pytest.raises(ValueError):
+            lib.to_arrow(self._create_documents(lib), root="Unknown")
+
+    @staticmethod
+    def _create_documents(lib):
+        """
+        Helper method to create five documents with nested objects and lists.
+        """
+        return [
+            lib.Test(
+                name=f"Test {i}",
+                number=float(i),
+                to_reference=["abc"],
+                single_object=lib.Nested(reference="abc", names=["a", "b"], number=i),
+                nested_array=[lib.Nested(reference="abc", number=j) for j in range(i)],
+                ontology=lib.Ontology.GO if i % 2 else None,
+            )
+            for i in range(5)
+        ]
@@ -0,0 +1,220 @@
+import asyncio
+
+import pytest
+from sqlmodel import func
+
+from mdmodels import sql
+
+
+class TestAsyncDatabase:
+    """
+    Integration tests for inserting and querying documents through async sessions.
+    """
+
+    def test_insert_and_query(self, nested_library, nested_dataset, nested_sql_models):
+        """
+        Test that async inserts store the same rows as sync inserts and that
+        JSON path queries return them with their nested objects.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        sync_db = sql.DatabaseConnector(database="")
+        sync_db.create_tables(models)
+
+        with sync_db as session:
+            session.add_all(sql.insert_nested(nested_dataset, lib, session, models))
+
+        with sync_db as session:
+            expected = session.exec(sql.select(models.Dataset)).one().to_dict()
+
+        async def run():
+            db = sql.AsyncDatabaseConnector(database="")
+            await db.create_tables(models)
+
+            async with db as session:
+                rows = await sql.insert_nested_async(
+                    nested_dataset, lib, session, models
+                )
+                session.add_all(rows)
+
+            async with db as session:
+                datasets = await sql.query_json_path_async(
+                    session, "$", "Dataset", models
+                )
+                names = await sql.query_json_path_async(
+                    session, "$.species[?(@.mw > 100)].name", "Dataset", models
+                )
+
+            await db.dispose()
+            return datasets, names
+
+        # Act
+        datasets, names = asyncio.run(run())
+
+        # Assert
+        assert datasets == [expected]
+        assert sorted(names) == ["ATP", "Glucose"]
+
+    def test_referenced_rows_are_reused(self, nested_library, nested_sql_models):
+        """
+        Test that stored objects with a primary key are looked up, not inserted again.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        glucose = lib.Species(id="s1", name="Glucose", mw=180.16)
+
+        async def run():
+            db = sql.AsyncDatabaseConnector(database="")
+            await db.create_tables(models)
+
+            for name in ("first", "second"):
+                async with db as session:
+                    dataset = lib.Dataset(name=name, species=[glucose, glucose])
+                    rows = await sql.insert_nested_async(dataset, lib, session, models)
+                    session.add_all(rows)
+
+            async with db as session:
+                result = await session.exec(
+                    sql.select(func.count()).select_from(models.Species)
+                )
+                count = result.one()
+
+            await db.dispose()
+            return count
+
+        # Act
+        count = asyncio.run(run())
+
+        # Assert
+        assert count == 1
+
+    def test_insert_bulk_async(self, nested_library, nested_sql_models):
+        """
+        Test that bulk inserts run through async sessions.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        datasets = [
+            lib.Dataset(
+                name=f"dataset {index}",
+                measurements=[lib.Measurement(time=0.0, value=float(index))],
+            )
+            for index in range(3)
+        ]
+
+        async def run():
+            db = sql.AsyncDatabaseConnector(database="")
+            await db.create_tables(models)
+
+            async with db as session:
+                keys = await sql.insert_bulk_async(datasets, session, models)
+
+            async with db as session:
+                values = await sql.query_json_path_async(
+                    session, "$.measurements.value", "Dataset", models
+                )
+
+            await db.dispose()
+            return keys, values
+
+        # Act
+        keys, values = asyncio.run(run())
+
+        # Assert
+        assert keys == ["dataset 0", "dataset 1", "dataset 2"]
+        assert sorted(values) == [0.0, 1.0, 2.0]
+
+    def test_rollback_on_error(self, nested_library, nested_sql_models):
+        """
+        Test that sessions are rolled back if the block raises.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+
+        async def run():
+            db = sql.AsyncDatabaseConnector(database="")
+            await db.create_tables(models)
+
+            with pytest.raises(RuntimeError):
+                async with db as session:
+                    dataset = lib.Dataset(name="dataset")
+                    rows = await sql.insert_nested_async(dataset, lib, session, models)
+                    session.add_all(rows)
+                    raise RuntimeError("Abort")
+
+            async with db as session:
+                datasets = await sql.query_json_path_async(
+                    session, "$", "Dataset", models
+                )
+
+            await db.dispose()
+            return datasets
+
+        # Act
+        datasets = asyncio.run(run())
+
+        # Assert
+        assert datasets == []
+
+    def test_event_loop_is_not_blocked(self, nested_library, nested_sql_models):
+        """
+        Test that other tasks proceed while the database I/O is awaited.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        dataset = lib.Dataset(
+            name="dataset",
+            species=[
+                lib.Species(id=f"s{index}", name="Species", mw=1.0)
+                for index in range(100)
+            ],
+        )
+
+        async def run():
+            ticks = 0
+
+            async def heartbeat():
+                nonlocal ticks
+
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            db = sql.AsyncDatabaseConnector(database="")
+            await db.create_tables(models)
+            task = asyncio.create_task(heartbeat())
+            await asyncio.sleep(0)
+            before = ticks
+
+            async with db as session:
+                rows = await sql.insert_nested_async(dataset, lib, session, models)
+                session.add_all(rows)
+
+            task.cancel()
+            await db.dispose()
+            return ticks - before
+
+        # Act
+        ticks = asyncio.run(run())
+
+        # Assert
+        assert ticks > 1
+
+    def test_async_driver(self):
+        """
+        Test that the asynchronous driver of the database type is selected.
+        """
+        # Act
+        default = sql.AsyncDatabaseConnector(database="")
+        explicit = sql.AsyncDatabaseConnector(database="", driver="aiosqlite")
+
+        # Assert
+        assert default.db_config["drivername"] == "sqlite+aiosqlite"
+        assert explicit.db_config["drivername"] == "sqlite+aiosqlite"
+        assert sql.DatabaseConnector(database="").db_config["drivername"] == "sqlite"
+        assert sql.connector.DatabaseType.POSTGRESQL.async_driver == "asyncpg"
@@ -0,0 +1,356 @@
+import asyncio
+import math
+
+import pytest
+from sqlmodel import SQLModel, func
+
+from mdmodels import sql
+from mdmodels.sql.insert import BATCH_SIZE
+
+
+class TestDatabaseInsert:
+    """
+    Integration tests for inserting nested documents into the database.
+    """
+
+    def test_insert_deduplicate(self, nested_library, nested_sql_models):
+        """
+        Test that identical subtrees are stored once when deduplicating,
+        both within a collection and across documents.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        datasets = [
+            lib.Dataset(
+                name="deduplicated",
+                measurements=[
+                    lib.Measurement(time=0.0, value=1.0),
+                    lib.Measurement(time=0.0, value=1.0),
+                    lib.Measurement(time=1.0, value=2.0),
+                ],
+            ),
+            lib.Dataset(
+                name="other",
+                measurements=[lib.Measurement(time=1.0, value=2.0)],
+            ),
+        ]
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            session.add_all(
+                sql.insert_nested(datasets, lib, session, models, deduplicate=True)
+            )
+
+        # Assert
+        with db as session:
+            count = session.exec(
+                sql.select(func.count()).select_from(models.Measurement)
+            ).one()
+
+        assert count == 2
+
+    def test_referenced_rows_are_reused(self, nested_library, nested_sql_models):
+        """
+        Test that objects with a primary key resolve to one row, whether they are
+        referenced repeatedly, pending in the session or stored in the database.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        glucose = lib.Species(id="s1", name="Glucose", mw=180.16)
+        water = lib.Species(id="s2", name="Water", mw=18.02)
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            session.add_all(
+                sql.insert_nested(
+                    lib.Dataset(name="first", species=[glucose]), lib, session, models
+                )
+            )
+
+        with db as session:
+            pending = sql.insert_nested(
+                lib.Dataset(name="second", species=[glucose, water, water]),
+                lib,
+                session,
+                models,
+            )
+            session.add_all(pending)
+            rows = sql.insert_nested(
+                lib.Dataset(name="third", species=[water, glucose]),
+                lib,
+                session,
+                models,
+            )
+            session.add_all(rows)
+
+            # Assert
+            assert rows[0].species[0] is pending[0].species[1]
+            assert rows[0].species[1] is pending[0].species[0]
+
+        with db as session:
+            count = session.exec(
+                sql.select(func.count()).select_from(models.Species)
+            ).one()
+
+        assert count == 2
+
+    def test_nested_reference_to_ancestor(
+        self, recursive_library, recursive_sql_models
+    ):
+        """
+        Test that an object nesting an object with its own primary key resolves
+        the nested reference to its own row, instead of waiting for the row.
+        """
+        # Arrange
+        lib = recursive_library
+        models = recursive_sql_models
+        node = lib.Node(
+            id="root",
+            children=[lib.Node(id="parent", children=[lib.Node(id="parent")])],
+        )
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            (root,) = asyncio.run(
+                asyncio.wait_for(
+                    sql.insert_nested_async(node, lib, session, models), timeout=5
+                )
+            )
+
+            # Link tables of objects nesting their own type have a single column
+            session.rollback()
+
+        # Assert
+        parent = root.children[0]
+        assert parent.id == "parent"
+        assert parent.children == [parent]
+
+    def test_referenced_rows_are_fetched_in_batches(
+        self, nested_library, nested_sql_models, count_statements
+    ):
+        """
+        Test that referenced rows are looked up with one query per table and
+        batch, however many objects reference them.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+
+        for count in (500, 2500):
+            dataset = lib.Dataset(
+                name="dataset",
+                species=[
+                    lib.Species(id=f"s{index}", name="Species", mw=1.0)
+                    for index in range(count)
+                ],
+            )
+            db = sql.DatabaseConnector(database="")
+            db.create_tables(models)
+
+            # Act
+            with db as session:
+                statements = count_statements(session.get_bind())
+                session.add_all(sql.insert_nested(dataset, lib, session, models))
+
+            selects = statements["SELECT"]
+
+            # Assert
+            with db as session:
+                rows = session.exec(
+                    sql.select(func.count()).select_from(models.Species)
+                ).one()
+
+            assert rows == count
+            assert selects <= math.ceil(count / BATCH_SIZE)
+
+
+class TestBulkInsert:
+    """
+    Integration tests for inserting documents with batched inserts per table.
+    """
+
+    def test_insert_bulk(self, nested_library, nested_dataset, nested_sql_models):
+        """
+        Test that bulk inserts store the same rows as inserting ORM instances.
+        """
+        # Arrange
+        models = nested_sql_models
+        orm_db = sql.DatabaseConnector(database="")
+        bulk_db = sql.DatabaseConnector(database="")
+        orm_db.create_tables(models)
+        bulk_db.create_tables(models)
+
+        # Act
+        with orm_db as session:
+            session.add_all(
+                sql.insert_nested(nested_dataset, nested_library, session, models)
+            )
+        with bulk_db as session:
+            keys = sql.insert_bulk(nested_dataset, session, models)
+
+        # Assert
+        assert keys == ["dataset"]
+
+        with orm_db as orm_session, bulk_db as bulk_session:
+            expected = orm_session.exec(sql.select(models.Dataset)).one().to_dict()
+            result = bulk_session.exec(sql.select(models.Dataset)).one().to_dict()
+
+        assert result == expected
+
+    def test_existing_rows_are_linked(self, nested_library, nested_sql_models):
+        """
+        Test that nested objects with a stored primary key are linked, not inserted,
+        and that generated keys continue after the stored rows.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        glucose = lib.Species(id="s1", name="Glucose", mw=180.16)
+        datasets = [
+            lib.Dataset(
+                name=f"dataset {index}",
+                species=[glucose, glucose],
+                measurements=[lib.Measurement(time=0.0, value=float(index))],
+            )
+            for index in range(3)
+        ]
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            sql.insert_bulk(datasets[0], session, models)
+        with db as session:
+            sql.insert_bulk(datasets[1:], session, models, batch_size=1)
+
+        # Assert
+        with db as session:
+            species = session.exec(sql.select(models.Species)).all()
+            measurements = session.exec(sql.select(models.Measurement)).all()
+            dataset = session.exec(
+                sql.select(models.Dataset).where(models.Dataset.name == "dataset 2")
+            ).one()
+
+            assert len(species) == 1
+            assert sorted(m.id for m in measurements) == [1, 2, 3]
+            assert [s.id for s in dataset.species] == ["s1"]
+            assert dataset.measurements[0].value == 2.0
+
+    def test_insert_bulk_deduplicate(self, nested_library, nested_sql_models):
+        """
+        Test that identical subtrees are stored once when deduplicating.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        dataset = lib.Dataset(
+            name="deduplicated",
+            measurements=[
+                lib.Measurement(time=0.0, value=1.0),
+                lib.Measurement(time=0.0, value=1.0),
+                lib.Measurement(time=1.0, value=2.0),
+            ],
+        )
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            sql.insert_bulk(dataset, session, models, deduplicate=True)
+
+        # Assert
+        with db as session:
+            count = session.exec(
+                sql.select(func.count()).select_from(models.Measurement)
+            ).one()
+
+        assert count == 2
+
+    def test_invalid_batch_size(self, nested_dataset, nested_sql_models):
+        """
+        Test that non-positive batch sizes are rejected.
+        """
+        db = sql.DatabaseConnector(database="")
+
+        with db as session, pytest.raises(ValueError):
+            sql.insert_bulk(nested_dataset, session, nested_sql_models, batch_size=0)
+
+    def test_insert_bulk_self_referencing(
+        self, recursive_library, recursive_sql_models
+    ):
+        """
+        Test that objects nested in objects of their own type are rejected
+        with a clear error, since their link table has a single column.
+        """
+        # Arrange
+        lib = recursive_library
+        models = recursive_sql_models
+        node = lib.Node(id="root", children=[lib.Node(id="child")])
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act & Assert
+        with db as session, pytest.raises(ValueError, match="own type"):
+            sql.insert_bulk(node, session, models)
+
+    def test_insert_bulk_statements(
+        self, nested_library, nested_sql_models, count_statements
+    ):
+        """
+        Test that bulk inserts write each table with one statement per batch.
+        """
+        # Arrange
+        lib = nested_library
+        models = nested_sql_models
+        datasets = [
+            lib.Dataset(
+                name=f"dataset {index}",
+                species=[
+                    lib.Species(id=f"s{number}", name="Species", mw=1.0)
+                    for number in range(10)
+                ],
+                measurements=[
+                    lib.Measurement(time=float(number), value=1.0)
+                    for number in range(100)
+                ],
+            )
+            for index in range(50)
+        ]
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(models)
+
+        # Act
+        with db as session:
+            statements = count_statements(session.get_bind())
+            sql.insert_bulk(datasets, session, models, batch_size=1000)
+
+        # Assert
+        with db as session:
+            rows = {
+                table.name: session.exec(
+                    sql.select(func.count()).select_from(table)
+                ).one()
+                for table in SQLModel.metadata.sorted_tables
+            }
+
+        assert rows[models.Dataset.__tablename__] == 50
+        assert rows[models.Species.__tablename__] == 10
+        assert rows[models.Measurement.__tablename__] == 5000
+        assert statements["INSERT"] == sum(
+            math.ceil(count / 1000) for count in rows.values()
+        )
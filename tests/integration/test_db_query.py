@@ -0,0 +1,97 @@
+import pytest
+
+from mdmodels import sql
+
+
+class TestDatabaseQuery:
+    """
+    Integration tests for translating JSON paths into SQL select statements.
+    """
+
+    def test_json_path_to_select(
+        self, nested_sql_models, nested_library, nested_dataset
+    ):
+        """
+        Test that JSON paths with wildcards, filters and column selections
+        are answered by the database.
+        """
+        # Arrange
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(nested_sql_models)
+
+        with db as session:
+            session.add_all(
+                sql.insert_nested(
+                    nested_dataset, nested_library, session, nested_sql_models
+                )
+            )
+
+        # Act
+        with db as session:
+            heavy = session.exec(
+                sql.json_path_to_select(
+                    "$.species[?(@.mw > 100)].name", "Dataset", nested_sql_models
+                )
+            ).all()
+            water = [
+                species.id
+                for species in session.exec(
+                    sql.json_path_to_select(
+                        "$.species[?(@.name == 'Water')]", "Dataset", nested_sql_models
+                    )
+                ).all()
+            ]
+            rates = session.exec(
+                sql.json_path_to_select(
+                    "$.reactions[*].rate", "Dataset", nested_sql_models
+                )
+            ).all()
+
+        # Assert
+        assert sorted(heavy) == ["ATP", "Glucose"]
+        assert water == ["s2"]
+        assert sorted(rates) == [0.5, 2.0]
+
+    def test_json_path_to_select_shared_children(
+        self, nested_sql_models, nested_library
+    ):
+        """
+        Test that nested rows linked from several parents are selected once.
+        """
+        # Arrange
+        lib = nested_library
+        species = [
+            lib.Species(id="s1", name="Glucose", mw=180.16),
+            lib.Species(id="s2", name="ATP", mw=507.18),
+        ]
+        datasets = [lib.Dataset(name=f"dataset {i}", species=species) for i in range(2)]
+
+        db = sql.DatabaseConnector(database="")
+        db.create_tables(nested_sql_models)
+
+        with db as session:
+            sql.insert_bulk(datasets, session, nested_sql_models)
+
+        # Act
+        with db as session:
+            heavy = [
+                row.id
+                for row in session.exec(
+                    sql.json_path_to_select(
+                        "$.species[?(@.mw > 100)]", "Dataset", nested_sql_models
+                    )
+                ).all()
+            ]
+
+        # Assert
+        assert sorted(heavy) == ["s1", "s2"]
+
+    def test_json_path_to_select_unsupported(self, nested_sql_models):
+        """
+        Test that unknown fields and array indices are rejected.
+        """
+        with pytest.raises(ValueError):
+            sql.json_path_to_select("$.unknown", "Dataset", nested_sql_models)
+
+        with pytest.raises(ValueError, match="Array indices"):
+            sql.json_path_to_select("$.species[0].name", "Dataset", nested_sql_models)
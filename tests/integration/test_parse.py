@@ -207,3 +207,36 @@ class TestParse:
 
         obj2 = dm.WrappedXML.from_xml(obj.xml())
         assert obj2 == obj, "The objects are not equal"
+
+    def test_write_xml(self, tmp_path):
+        """
+        Test that write_xml streams the same indented XML that xml() returns.
+
+        This test writes a WrappedXML object to a path and to a binary file object
+        and checks that both round-trip to an equal object with indented output.
+
+        Raises:
+            AssertionError: If the written XML differs from the xml() output
+            or if the reconstructed object does not equal the original object.
+        """
+        dm = DataModel.from_markdown("./tests/fixtures/model_wrapped_xml.md")
+        obj = dm.WrappedXML(
+            list_of_some_xml=[
+                dm.Some(some_field="some_field_1", some_element="some_element_1"),
+            ],
+            single_xml=dm.Some(
+                some_field="some_field_3", some_element="some_element_3"
+            ),
+        )
+
+        path = tmp_path / "wrapped.xml"
+        obj.write_xml(path)
+
+        with open(tmp_path / "wrapped_fileobj.xml", "wb") as f:
+            obj.write_xml(f)
+
+        expected = obj.xml().split("\n", 1)[1]
+        for written in (path, tmp_path / "wrapped_fileobj.xml"):
+            content = written.read_text(encoding="utf-8")
+            assert content.split("\n", 1)[1].rstrip() == expected.rstrip()
+            assert dm.WrappedXML.from_xml(content.encode()) == obj
@@ -0,0 +1,209 @@
+import numpy as np
+import pytest
+
+from mdmodels.datamodel import DataModel
+
+
+class TestNumericArrays:
+    def test_fields_are_arrays(self):
+        """
+        Test that arrays of floats and integers are validated into NumPy arrays.
+
+        This test verifies the dtypes of the arrays and that missing arrays
+        default to empty ones.
+        """
+        # Arrange
+        lib = self._load_library()
+
+        # Act
+        document = lib.TimeCourse(name="TC", time=[0, 0.5, 1], counts=[1, 2, 3])
+
+        # Assert
+        assert document.time.dtype == np.float64
+        assert document.counts.dtype == np.int64
+        assert document.time.tolist() == [0.0, 0.5, 1.0]
+        assert lib.TimeCourse(name="TC").time.shape == (0,)
+
+    def test_field_metadata(self):
+        """
+        Test that NumPy-backed fields are still described as arrays of their
+        element type.
+        """
+        # Arrange
+        lib = self._load_library()
+
+        # Act
+        field = lib.TimeCourse.__mdmodels__.fields["time"]
+
+        # Assert
+        assert field.is_array and field.is_numpy
+        assert field.dtype is float
+
+    def test_zero_copy(self):
+        """
+        Test that matching arrays and buffers are not copied.
+
+        Arrays of the right dtype are taken as they are, and buffers are
+        viewed as arrays without copying their data.
+        """
+        # Arrange
+        lib = self._load_library()
+        values = np.arange(5, dtype=np.float64)
+
+        # Act
+        from_array = lib.Replicate(id="r", values=values)
+        from_buffer = lib.Replicate(id="r", values=values.tobytes())
+
+        # Assert
+        assert from_array.values is values
+        assert np.shares_memory(from_buffer.values, np.frombuffer(from_buffer.values))
+        assert from_buffer.values.tolist() == values.tolist()
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("counts", [1.5, 2]),
+            ("time", ["a", "b"]),
+            ("time", [[1.0, 2.0], [3.0, 4.0]]),
+        ],
+    )
+    def test_invalid_values(self, field, value):
+        """
+        Test that lossy, non-numeric or multi-dimensional values are rejected.
+        """
+        lib = self._load_library()
+
+        with pytest.raises(ValueError):
+            lib.TimeCourse(name="TC", **{field: value})
+
+    def test_json_roundtrip(self):
+        """
+        Test that arrays are serialized as JSON lists and validated back.
+        """
+        # Arrange
+        lib = self._load_library()
+        document = lib.TimeCourse(
+            name="TC",
+            time=np.linspace(0, 1, 11),
+            replicates=[lib.Replicate(id="r", values=[1, 2])],
+        )
+
+        # Act
+        dumped = document.model_dump_json()
+
+        # Assert
+        assert '"values":[1.0,2.0]' in dumped
+        assert lib.TimeCourse.model_validate_json(dumped) == document
+
+    def test_xml_roundtrip(self):
+        """
+        Test that arrays are serialized as the text of a single element.
+        """
+        # Arrange
+        lib = self._load_library()
+        replicate = lib.Replicate(id="r", values=[1.5, 2.0])
+
+        # Act
+        restored = lib.Replicate.from_xml(replicate.to_xml())
+        parsed = lib.Replicate.from_xml(
+            b'<Replicate id="r"><values>1.5 2.0</values></Replicate>'
+        )
+
+        # Assert
+        assert restored == replicate
+        assert parsed == replicate
+
+    def test_equality(self):
+        """
+        Test that documents with arrays compare by value, including their length.
+        """
+        # Arrange
+        lib = self._load_library()
+
+        # Act
+        first = lib.Replicate(id="r", values=[1.0, 2.0])
+
+        # Assert
+        assert first == lib.Replicate(id="r", values=[1.0, 2.0])
+        assert first != lib.Replicate(id="r", values=[1.0, 3.0])
+        assert first != lib.Replicate(id="r", values=[1.0])
+
+    def test_json_schema(self):
+        """
+        Test that the JSON schema describes arrays of numbers.
+        """
+        # Arrange
+        lib = self._load_library()
+
+        # Act
+        properties = lib.TimeCourse.model_json_schema()["properties"]
+
+        # Assert
+        assert properties["time"]["items"] == {"type": "number"}
+        assert properties["counts"]["items"] == {"type": "integer"}
+
+    def test_list_compatibility(self):
+        """
+        Test that fingerprints and diffs match list-backed documents.
+
+        NumPy-backed documents must hash like their list-backed counterparts,
+        and their diffs must contain plain lists that can be applied again.
+        """
+        # Arrange
+        lib = self._load_library()
+        lists = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        arrays = lib.Replicate(id="r", values=[1.0, 2.0])
+        plain = lists.Replicate(id="r", values=[1.0, 2.0])
+        changed = lib.Replicate(id="r", values=[1.0, 3.0])
+
+        # Act
+        operations = arrays.diff(changed)
+
+        # Assert
+        assert arrays.fingerprint() == plain.fingerprint()
+        assert operations == [{"op": "replace", "path": "/values", "value": [1.0, 3.0]}]
+        assert arrays.apply_patch(operations) == changed
+
+    def test_msgpack(self):
+        """
+        Test that binary arrays are loaded as NumPy arrays, with and without
+        validation.
+        """
+        # Arrange
+        pytest.importorskip("msgpack")
+        lib = self._load_library()
+        document = lib.TimeCourse(name="TC", time=np.arange(1000) / 10)
+
+        for trusted in (False, True):
+            # Act
+            restored = lib.TimeCourse.from_msgpack(document.to_msgpack(), trusted)
+
+            # Assert
+            assert isinstance(restored.time, np.ndarray)
+            assert restored == document
+
+    def test_jsonl_workers(self, tmp_path):
+        """
+        Test that worker processes rebuild the NumPy-backed data model.
+        """
+        # Arrange
+        lib = self._load_library()
+        documents = [lib.TimeCourse(name=f"TC{i}", counts=[i, i]) for i in range(4)]
+        lib.TimeCourse.write_jsonl(tmp_path / "tc.jsonl", documents)
+
+        # Act
+        restored = list(lib.TimeCourse.read_jsonl(tmp_path / "tc.jsonl", workers=2))
+
+        # Assert
+        assert restored == documents
+        assert isinstance(restored[0].counts, np.ndarray)
+
+    @staticmethod
+    def _load_library():
+        """
+        Helper method to load the time course model with NumPy-backed arrays.
+        """
+        return DataModel.from_markdown(
+            "./tests/fixtures/model_timecourse.md",
+            numpy_arrays=True,
+        )
@@ -133,3 +133,24 @@ class TestDataModel:
 
         for search, expect in zip(to_search, to_expect):
             assert obj.find(search) == [expect], f"Search: {search}, Expect: {expect}"
+
+    def test_field_metadata(self):
+        """
+        Test the precomputed field metadata table of a DataModel class.
+
+        This test verifies that the underlying classes, array, model and enum
+        flags as well as the XML locations are recorded for each field.
+        """
+        dm = DataModel.from_markdown(Path("./tests/fixtures/model.md"))
+        fields = dm.Test.__mdmodels__.fields
+
+        assert fields["name"].dtype is str
+        assert fields["name"].is_xml_attr
+        assert fields["to_reference"].is_array
+        assert fields["single_object"].dtype is dm.Nested
+        assert fields["single_object"].is_model
+        assert fields["single_object"].is_optional
+        assert fields["single_object"].xml_tag == "Nested"
+        assert fields["nested_array"].is_array and fields["nested_array"].is_model
+        assert fields["ontology"].is_enum
+        assert not fields["number"].is_model
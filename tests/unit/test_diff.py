@@ -0,0 +1,102 @@
+import pytest
+
+from mdmodels.datamodel import DataModel
+
+
+class TestDiff:
+    def test_diff_matches_by_primary_key(self):
+        """
+        Test that list items are matched by primary key.
+
+        Removing the first species and editing another one must not result in
+        replacements of all subsequent items.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_database_nested.md")
+        source = self._create_dataset(lib)
+        target = self._create_dataset(lib)
+        target.species.pop(0)
+        target.species[1].mw = 500.0
+        target.add_to_species(id="s4", name="ADP", mw=427.2)
+
+        # Act
+        operations = source.diff(target)
+
+        # Assert
+        assert operations == [
+            {"op": "remove", "path": "/species/0"},
+            {
+                "op": "add",
+                "path": "/species/2",
+                "value": {"id": "s4", "name": "ADP", "mw": 427.2},
+            },
+            {"op": "replace", "path": "/species/1/mw", "value": 500.0},
+        ]
+
+    def test_apply_patch(self):
+        """
+        Test that applying the diff of two documents reproduces the target.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_database_nested.md")
+        source = self._create_dataset(lib)
+        target = self._create_dataset(lib)
+        target.description = "Changed"
+        target.species.pop(1)
+        target.add_to_reactions(id="r3", rate=1.5)
+
+        # Act
+        source.apply_patch(source.diff(target))
+
+        # Assert
+        assert source == target
+        assert isinstance(source.reactions[-1], lib.Reaction)
+        assert source.diff(target) == []
+
+    def test_apply_patch_validates_values(self):
+        """
+        Test that patched values are validated against the field type.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_database_nested.md")
+        doc = self._create_dataset(lib)
+
+        with pytest.raises(ValueError):
+            doc.apply_patch([{"op": "replace", "path": "/species/0/mw", "value": "x"}])
+
+        with pytest.raises(ValueError):
+            doc.apply_patch([{"op": "replace", "path": "/unknown", "value": 1}])
+
+    def test_apply_patch_replaces_units(self):
+        """
+        Test that changed units are replaced as a whole, such that applying
+        the diff assigns shared unit definitions instead of modifying them.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        source = lib.Experiment(name="x", temperature=1.0, temperature_unit="mmol / l")
+        target = lib.Experiment(name="x", temperature=1.0, temperature_unit="mol / l")
+
+        # Act
+        operations = source.diff(target)
+        source.apply_patch(operations)
+
+        # Assert
+        assert [operation["path"] for operation in operations] == ["/temperature_unit"]
+        assert source.temperature_unit.name == "mol / l"
+        assert source.temperature_unit.frozen
+        assert source.diff(target) == []
+
+    @staticmethod
+    def _create_dataset(lib):
+        """
+        Helper method to create a dataset with three species.
+        """
+        return lib.Dataset(
+            name="dataset",
+            species=[
+                lib.Species(id="s1", name="Glucose", mw=180.16),
+                lib.Species(id="s2", name="Water", mw=18.02),
+                lib.Species(id="s3", name="ATP", mw=507.18),
+            ],
+            reactions=[lib.Reaction(id="r1", rate=0.5)],
+        )
@@ -0,0 +1,86 @@
+from mdmodels import fingerprint
+from mdmodels.datamodel import DataModel
+
+
+class TestFingerprint:
+    def test_fingerprint_is_stable(self):
+        """
+        Test that equal content results in equal fingerprints.
+
+        Documents created independently, including units given by different
+        names of the same unit, must hash to the same value.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+
+        # Act
+        first = dm.UnitExample(single_unit="mmol/l", multiple_units=["g"])
+        second = dm.UnitExample(single_unit="mmol / l", multiple_units=["g"])
+
+        # Assert
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_fingerprint_tracks_changes(self):
+        """
+        Test that modifications of nested values change the fingerprint and
+        that excluded fields are ignored.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model.md")
+        obj = dm.Test(
+            name="Test",
+            to_reference=["ref"],
+            nested_array=[dm.Nested(reference="ref", names=["a"])],
+        )
+        before = obj.fingerprint()
+
+        # Act
+        obj.nested_array[0].names.append("b")
+        after = obj.fingerprint()
+        obj.nested_array[0].names.pop()
+
+        # Assert
+        assert before != after
+        assert obj.fingerprint() == before
+        assert obj.fingerprint(exclude=["name"]) == dm.Test(
+            name="Other",
+            to_reference=["ref"],
+            nested_array=[dm.Nested(reference="ref", names=["a"])],
+        ).fingerprint(exclude=["name"])
+
+    def test_fingerprint_of_equal_units(self):
+        """
+        Test that units hash by their canonical form, such that equal units
+        written with different base units have equal fingerprints.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+
+        # Act
+        first = dm.UnitExample(single_unit="mmol / l", multiple_units=["s"])
+        second = dm.UnitExample(single_unit="mol / m3", multiple_units=["s"])
+        third = dm.UnitExample(single_unit="umol / l", multiple_units=["s"])
+
+        # Assert
+        assert first.fingerprint() == second.fingerprint()
+        assert first.fingerprint() != third.fingerprint()
+
+    def test_stale_callback_keeps_reused_entry(self):
+        """
+        Test that the callback of a collected instance does not remove the
+        cache of a new instance that reuses its id.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        obj = dm.UnitExample(single_unit="mmol / l")
+        obj.fingerprint()
+        key = id(obj)
+        stale, _ = fingerprint._CACHE[key]
+
+        # Act
+        fingerprint._CACHE[key] = (lambda: obj, {})
+        stale.__callback__(stale)
+
+        # Assert
+        assert key in fingerprint._CACHE
+        fingerprint._CACHE.pop(key)
@@ -0,0 +1,157 @@
+import gzip
+
+import pytest
+
+from mdmodels.datamodel import DataModel
+
+
+class TestJSONL:
+    def test_read_example(self):
+        """
+        Test reading the JSON Lines example shipped with the repository.
+
+        This test verifies that every line is validated into a data model
+        instance and that the reader keeps track of the records and bytes read.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+
+        # Act
+        reader = lib.Person.read_jsonl("./examples/llm/embedding/persons.jsonl")
+        persons = list(reader)
+
+        # Assert
+        assert persons[0] == lib.Person(
+            name="John Doe", age=25, hobbies=["Coding", "Gaming"]
+        )
+        assert reader.stats.records == len(persons)
+        assert reader.stats.bytes > 0
+
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+    def test_roundtrip(self, tmp_path, suffix):
+        """
+        Test that written records are read back unchanged.
+
+        This test writes plain and gzip compressed files with a small buffer,
+        such that the records are flushed in several chunks.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+        persons = self._create_persons(lib)
+        path = tmp_path / f"persons{suffix}"
+
+        # Act
+        stats = lib.Person.write_jsonl(path, iter(persons), buffer_size=64)
+
+        # Assert
+        assert stats.records == len(persons)
+        assert list(lib.Person.read_jsonl(path)) == persons
+
+    def test_gzip_is_compressed(self, tmp_path):
+        """
+        Test that files ending in '.gz' are gzip compressed.
+
+        This test reads the written file with the gzip module of the standard
+        library and checks that it holds one line per record.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+        persons = self._create_persons(lib)
+        path = tmp_path / "persons.jsonl.gz"
+
+        # Act
+        lib.Person.write_jsonl(path, persons)
+
+        # Assert
+        with gzip.open(path, "rt") as f:
+            assert len(f.readlines()) == len(persons)
+
+    def test_zstd_roundtrip(self, tmp_path):
+        """
+        Test that zstandard compressed files can be written and read.
+
+        This test is skipped if the optional 'zstandard' package is missing.
+        """
+        # Arrange
+        pytest.importorskip("zstandard")
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+        persons = self._create_persons(lib)
+        path = tmp_path / "persons.jsonl.zst"
+
+        # Act
+        lib.Person.write_jsonl(path, persons)
+
+        # Assert
+        assert list(lib.Person.read_jsonl(path)) == persons
+
+    def test_write_validates_dicts(self, tmp_path):
+        """
+        Test that dictionaries are validated before being written.
+        """
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+
+        with pytest.raises(ValueError):
+            lib.Person.write_jsonl(tmp_path / "invalid.jsonl", [{"age": "old"}])
+
+    def test_parallel_read_preserves_order(self, tmp_path):
+        """
+        Test that records validated in worker processes keep the file order.
+
+        This test uses batches smaller than the number of records, such that
+        the batches are validated by several workers.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+        persons = self._create_persons(lib)
+        path = tmp_path / "persons.jsonl"
+        lib.Person.write_jsonl(path, persons)
+
+        # Act
+        reader = lib.Person.read_jsonl(path, workers=2, batch_size=4)
+
+        # Assert
+        assert list(reader) == persons
+        assert reader.stats.records == len(persons)
+
+    def test_parallel_read_nested(self, tmp_path):
+        """
+        Test parallel validation of nested objects and units.
+
+        This test verifies that units, which are validated from nested
+        dictionaries, survive the transfer between processes.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        records = [
+            lib.UnitExample(single_unit="mmol / l", multiple_units=["s", "1 / s"])
+            for _ in range(5)
+        ]
+        path = tmp_path / "units.jsonl"
+        lib.UnitExample.write_jsonl(path, records)
+
+        # Act
+        restored = list(lib.UnitExample.read_jsonl(path, workers=2, batch_size=2))
+
+        # Assert
+        assert restored == records
+
+    def test_parallel_read_invalid(self, tmp_path):
+        """
+        Test that validation errors of worker processes are raised.
+        """
+        lib = DataModel.from_markdown("./examples/llm/embedding/model.md")
+        path = tmp_path / "invalid.jsonl"
+        path.write_text('{"name": "A", "age": 1}\n{"name": "B", "age": "old"}\n')
+
+        with pytest.raises(ValueError):
+            list(lib.Person.read_jsonl(path, workers=1))
+
+    @staticmethod
+    def _create_persons(lib):
+        """
+        Helper method to create 25 persons with varying numbers of hobbies.
+        """
+        return [
+            lib.Person(name=f"Person {i}", age=20 + i, hobbies=["Coding"] * (i % 3))
+            for i in range(25)
+        ]
@@ -0,0 +1,156 @@
+import pytest
+from pydantic import ValidationError
+
+from mdmodels.datamodel import DataModel
+from mdmodels.lazy import LazyList
+
+
+class TestLazyLoad:
+    def test_scalars_are_validated_eagerly(self):
+        """
+        Test that scalar fields are validated and nested objects are not.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib)
+
+        # Act
+        lazy = lib.Test.lazy_load(document.model_dump_json())
+
+        # Assert
+        assert lazy.name == "Test"
+        assert lazy.ontology is lib.Ontology.GO
+        assert "single_object" not in lazy.validated_fields
+        assert "nested_array" not in lazy.validated_fields
+
+    def test_nested_objects_on_access(self):
+        """
+        Test that nested objects are validated and cached on access.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib)
+        lazy = lib.Test.lazy_load(document.model_dump_json().encode())
+
+        # Act
+        single_object = lazy.single_object
+
+        # Assert
+        assert single_object == document.single_object
+        assert single_object is lazy.single_object
+        assert "single_object" in lazy.validated_fields
+
+    def test_list_elements_on_access(self):
+        """
+        Test that list elements are validated one by one.
+
+        This test verifies that the representation of the list marks the
+        elements that have not been validated yet.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib)
+        lazy = lib.Test.lazy_load(document.model_dump(mode="json"))
+
+        # Act
+        items = lazy.nested_array
+        item = items[1]
+
+        # Assert
+        assert isinstance(items, LazyList)
+        assert len(items) == 3
+        assert item == document.nested_array[1]
+        assert repr(items).startswith("LazyList([..., Nested(")
+        assert items == document.nested_array
+
+    def test_model_dump_passes_raw_data(self):
+        """
+        Test that untouched subtrees are dumped as they were parsed.
+
+        This test also verifies that partially validated lists are dumped
+        like the original document.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib)
+        data = document.model_dump(mode="json")
+        lazy = lib.Test.lazy_load(data)
+
+        # Act
+        dumped = lazy.model_dump()
+        lazy.nested_array[0]  # noqa: B018
+
+        # Assert
+        assert dumped["single_object"] is data["single_object"]
+        assert lazy.model_dump(mode="json") == data
+        assert lib.Test.model_validate_json(lazy.model_dump_json()) == document
+
+    def test_materialize_and_assignment(self):
+        """
+        Test that values can be assigned and the document materialized.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        lazy = lib.Test.lazy_load(self._create_document(lib).model_dump_json())
+
+        # Act
+        lazy.number = "3.5"
+        materialized = lazy.materialize()
+
+        # Assert
+        assert isinstance(materialized, lib.Test)
+        assert materialized.number == 3.5
+
+        with pytest.raises(AttributeError):
+            lazy.unknown = 1
+
+    def test_invalid_scalar(self):
+        """
+        Test that invalid scalars raise right away.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        data = self._create_document(lib).model_dump(mode="json")
+
+        with pytest.raises(ValidationError) as e:
+            lib.Test.lazy_load({**data, "number": "not a number"})
+
+        assert e.value.errors()[0]["loc"] == ("number",)
+
+    def test_invalid_object_raises_on_every_access(self):
+        """
+        Test that invalid objects raise on every access.
+
+        Failed validation keeps the raw subtree, such that later accesses and
+        dumps still see the original data.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        data = self._create_document(lib).model_dump(mode="json")
+        invalid = {"number": "many"}
+        lazy = lib.Test.lazy_load({**data, "single_object": invalid})
+
+        for _ in range(2):
+            # Act & Assert
+            with pytest.raises(ValidationError):
+                lazy.single_object  # noqa: B018
+
+        # Assert
+        assert "single_object" not in lazy.validated_fields
+        assert lazy.model_dump()["single_object"] == invalid
+
+    @staticmethod
+    def _create_document(lib):
+        """
+        Helper method to create a document with nested objects and lists.
+        """
+        return lib.Test(
+            name="Test",
+            number=2.0,
+            to_reference=["abc"],
+            single_object=lib.Nested(reference="abc", names=["a"], number=2.0),
+            nested_array=[
+                lib.Nested(reference="abc", names=["x"], number=float(i))
+                for i in range(3)
+            ],
+            ontology=lib.Ontology.GO,
+        )
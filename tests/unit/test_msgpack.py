@@ -0,0 +1,163 @@
+import pytest
+
+from mdmodels.datamodel import DataModel
+from mdmodels.units.unit_definition import UnitType
+
+msgpack = pytest.importorskip("msgpack")
+
+
+class TestMsgpack:
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_roundtrip(self, trusted):
+        """
+        Test that documents survive a MessagePack roundtrip.
+
+        This test covers both the validated and the trusted decoding and
+        checks that enumerations are restored as their members.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        document = self._create_time_course(lib, 50)
+
+        # Act
+        restored = lib.TimeCourse.from_msgpack(document.to_msgpack(), trusted=trusted)
+
+        # Assert
+        assert restored == document
+        assert restored.status is lib.Status.DONE
+
+    def test_trusted_units_are_shared(self):
+        """
+        Test that trusted decoding interns units like validation does.
+
+        Units decoded without validation must be the shared, frozen instances
+        and nested objects must be instances of their data models.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        document = self._create_time_course(lib, 3)
+
+        # Act
+        validated = lib.TimeCourse.from_msgpack(document.to_msgpack())
+        trusted = lib.TimeCourse.from_msgpack(document.to_msgpack(), trusted=True)
+
+        # Assert
+        assert trusted.unit is validated.unit
+        assert trusted.unit.frozen
+        assert isinstance(trusted.replicates[0], lib.Replicate)
+
+    def test_compact_encoding(self):
+        """
+        Test that the encoding is compact.
+
+        Enumerations are stored as ordinals, numeric lists as typed arrays and
+        unit kinds as the ordinals of their unit types.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        document = self._create_time_course(lib, 3)
+        fields = list(lib.TimeCourse.model_fields)
+
+        # Act
+        packed = msgpack.unpackb(document.to_msgpack())
+
+        # Assert
+        mole = list(UnitType).index(UnitType.MOLE)
+        assert packed[fields.index("status")] == list(lib.Status).index(lib.Status.DONE)
+        assert isinstance(packed[fields.index("time")], msgpack.ExtType)
+        assert packed[fields.index("unit")][2][0] == [mole, 1, 1.0, -3.0]
+
+    def test_optional_and_nested(self):
+        """
+        Test documents with missing values, nested objects and enumerations.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = lib.Test(
+            name="Test",
+            single_object=lib.Nested(reference="abc", names=["a"], number=2.0),
+            nested_array=[lib.Nested(reference="abc")],
+            ontology=lib.Ontology.SIO,
+        )
+
+        # Act
+        buffer = document.to_msgpack()
+
+        # Assert
+        assert lib.Test.from_msgpack(buffer) == document
+        assert lib.Test.from_msgpack(buffer, trusted=True) == document
+
+    def test_unions(self):
+        """
+        Test that values of fields with multiple types keep their type.
+
+        This test verifies that e.g. booleans are not restored as integers,
+        both with and without validation.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_multiple_types.md")
+        document = lib.Test(
+            primitive_types=True,
+            complex_types=lib.SecondType(value=2),
+            array_primitive_types=["a", 1, 1.5, False],
+            array_complex_types=[lib.FirstType(value="x"), lib.SecondType(value=3)],
+        )
+
+        for trusted in (False, True):
+            # Act
+            restored = lib.Test.from_msgpack(document.to_msgpack(), trusted=trusted)
+
+            # Assert
+            assert restored == document
+            assert restored.primitive_types is True
+
+    def test_validation(self):
+        """
+        Test that untrusted decoding validates the document.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        packed = msgpack.unpackb(self._create_time_course(lib, 3).to_msgpack())
+        packed[list(lib.TimeCourse.model_fields).index("name")] = 12
+
+        with pytest.raises(ValueError):
+            lib.TimeCourse.from_msgpack(msgpack.packb(packed))
+
+    def test_schema_mismatch(self):
+        """
+        Test that buffers of a different data model are rejected.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+
+        with pytest.raises(ValueError):
+            lib.TimeCourse.from_msgpack(msgpack.packb(["too", "short"]))
+
+    def test_smaller_than_json(self):
+        """
+        Test that MessagePack buffers are smaller than the JSON documents.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+        document = self._create_time_course(lib, 1_000)
+
+        # Act
+        buffer = document.to_msgpack()
+
+        # Assert
+        assert len(buffer) < len(document.model_dump_json().encode())
+
+    @staticmethod
+    def _create_time_course(lib, points: int):
+        """
+        Helper method to create a time course with three replicates.
+        """
+        return lib.TimeCourse(
+            name="Kinetics",
+            time=[i * 0.5 for i in range(points)],
+            counts=list(range(points)),
+            unit="mmol / l",
+            status=lib.Status.DONE,
+            replicates=[
+                lib.Replicate(id=f"r{i}", values=[i + j / 3 for j in range(points)])
+                for i in range(3)
+            ],
+        )
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from mdmodels.datamodel import DataModel
+from mdmodels.units.converter import convert_unit
+
+
+class TestNormalizeUnits:
+    def test_si(self):
+        """
+        Test that all values are converted to SI base units.
+
+        This test covers offsets (degree Celsius), scaled time units and
+        compound units of concentrations and rates.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        document = self._create_experiment(lib)
+
+        # Act
+        document.normalize_units()
+
+        # Assert
+        assert document.temperature == pytest.approx(298.15)
+        assert document.temperature_unit.name == "K"
+
+        measurement = document.measurements[1]
+        np.testing.assert_allclose(measurement.time, [0.0, 60.0, 120.0])
+        np.testing.assert_allclose(measurement.data, [1.0, 0.5, 0.25])
+        assert measurement.time_unit.name == "s"
+        assert measurement.data_unit.name == "mol / m3"
+
+        km, kcat = document.parameters
+        assert (km.value, km.upper) == pytest.approx((2.0, 10.0))
+        assert kcat.value == pytest.approx(0.5)
+        assert kcat.value_unit.name == "1 / s"
+
+    def test_unrelated_unit_fields(self):
+        """
+        Test that values without a '<name>_unit' field are kept.
+
+        Unit fields that are not paired with a value are not converted either.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        document = self._create_experiment(lib)
+
+        # Act
+        document.normalize_units()
+
+        # Assert
+        km, kcat = document.parameters
+        assert (km.upper, kcat.upper) == (10.0, 60.0)
+        assert km.scale.name == "h"
+
+    def test_shared_target_units(self):
+        """
+        Test that unit fields are set to the shared target instances.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        document = self._create_experiment(lib)
+
+        # Act
+        document.normalize_units()
+
+        # Assert
+        units = [m.time_unit for m in document.measurements]
+        assert all(unit is convert_unit("s") for unit in units)
+        assert document.measurements[0].data_unit is document.parameters[0].value_unit
+
+    def test_mapping(self):
+        """
+        Test that a mapping converts the listed units only.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        document = self._create_experiment(lib)
+
+        # Act
+        document.normalize_units({"mmol / l": "umol / l"})
+
+        # Assert
+        np.testing.assert_allclose(
+            document.measurements[0].data, [1000.0, 500.0, 250.0]
+        )
+        assert document.parameters[0].value == pytest.approx(2000.0)
+        assert document.parameters[0].value_unit.name == "umol / l"
+        assert document.parameters[1].value == 30.0
+        assert document.temperature == 25.0
+
+    def test_incompatible_mapping(self):
+        """
+        Test that targets with other dimensions are rejected.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+
+        with pytest.raises(ValueError, match="different dimensions"):
+            self._create_experiment(lib).normalize_units({"min": "m"})
+
+    def test_incompatible_mapping_keeps_document(self):
+        """
+        Test that a rejected target leaves all other groups unchanged.
+
+        The document is only modified once every target has been checked.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_measurements.md")
+        document = self._create_experiment(lib)
+
+        # Act
+        with pytest.raises(ValueError, match="different dimensions"):
+            document.normalize_units({"mmol / l": "umol / l", "min": "m"})
+
+        # Assert
+        np.testing.assert_allclose(document.measurements[0].data, [1.0, 0.5, 0.25])
+        np.testing.assert_allclose(document.measurements[0].time, [0.0, 1.0, 2.0])
+        assert document.parameters[0].value == 2.0
+        assert document.measurements[0].data_unit.name == "mmol / l"
+
+    def test_numpy_arrays(self):
+        """
+        Test that NumPy-backed fields stay arrays.
+        """
+        # Arrange
+        lib = DataModel.from_markdown(
+            "./tests/fixtures/model_measurements.md",
+            numpy_arrays=True,
+        )
+        measurement = lib.Measurement(time=np.arange(4.0), time_unit="h")
+
+        # Act
+        measurement.normalize_units()
+
+        # Assert
+        assert isinstance(measurement.time, np.ndarray)
+        np.testing.assert_allclose(measurement.time, np.arange(4.0) * 3600)
+
+    @staticmethod
+    def _create_experiment(lib):
+        """
+        Helper method to create an experiment with measurements and parameters.
+        """
+        return lib.Experiment(
+            name="Kinetics",
+            temperature=25.0,
+            temperature_unit="deg_C",
+            measurements=[
+                lib.Measurement(
+                    species=f"s{i}",
+                    time=[0.0, 1.0, 2.0],
+                    time_unit="min",
+                    data=[1.0, 0.5, 0.25],
+                    data_unit="mmol / l",
+                )
+                for i in range(3)
+            ],
+            parameters=[
+                lib.Parameter(
+                    name="km", value=2.0, value_unit="mmol / l", upper=10.0, scale="h"
+                ),
+                lib.Parameter(
+                    name="kcat", value=30.0, value_unit="1 / min", upper=60.0
+                ),
+            ],
+        )
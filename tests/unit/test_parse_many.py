@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mdmodels.units import UnitDefinition, convert_unit, parse_many
+from mdmodels.units import converter
+
+
+class TestParseMany:
+    def test_parse_list(self):
+        """
+        Test that a list of unit strings is parsed to shared unit definitions.
+        """
+        # Arrange
+        units = ["mmol / l", "s", "mmol / l", "not a unit", None, "s"]
+
+        # Act
+        parsed, failed = parse_many(units)
+
+        # Assert
+        assert parsed.dtype == object
+        assert parsed[0] is parsed[2] is convert_unit("mmol / l")
+        assert parsed[1] is parsed[5]
+        assert parsed[3] is None and parsed[4] is None
+        assert failed.tolist() == [False, False, False, True, False, False]
+
+    def test_parse_series(self):
+        """
+        Test that pandas series are factorized by pandas, including missing values.
+        """
+        # Arrange
+        series = pd.Series(["mg", np.nan, "mg", "1 / min", 5])
+
+        # Act
+        parsed, failed = parse_many(series)
+
+        # Assert
+        assert parsed[0] is parsed[2]
+        assert parsed[3] == convert_unit("1 / min")
+        assert parsed[1] is None
+        assert failed.tolist() == [False, False, False, False, True]
+
+    def test_mixed_inputs(self):
+        """
+        Test that unit definitions and dictionaries are accepted as well.
+        """
+        # Arrange
+        unit = convert_unit("mol / l")
+        units = [unit, unit.model_dump(), unit.model_dump(), float("nan")]
+
+        # Act
+        parsed, failed = parse_many(units)
+
+        # Assert
+        assert parsed[0] is unit
+        assert isinstance(parsed[1], UnitDefinition)
+        assert parsed[1] == unit and parsed[1] is parsed[2]
+        assert parsed[3] is None
+        assert not failed.any()
+
+    def test_each_distinct_unit_is_parsed_once(self, monkeypatch):
+        """
+        Test that a large column with few distinct units costs one parse per unit.
+        """
+        # Arrange
+        calls = []
+        monkeypatch.setattr(
+            converter,
+            "convert_unit",
+            lambda unit: calls.append(unit) or UnitDefinition(name=unit),
+        )
+        units = [f"unit {index % 20}" for index in range(100_000)]
+
+        # Act
+        parsed, failed = parse_many(pd.Series(units))
+
+        # Assert
+        assert len(calls) == 20
+        assert len({id(unit) for unit in parsed}) == 20
+        assert not failed.any()
+
+    def test_empty(self):
+        """
+        Test that empty columns result in empty arrays.
+        """
+        # Act
+        parsed, failed = parse_many([])
+
+        # Assert
+        assert parsed.shape == failed.shape == (0,)
+
+    @pytest.mark.parametrize("units", [["mg", "g"], ("mg", "g"), np.array(["mg", "g"])])
+    def test_sequence_types(self, units):
+        """
+        Test that lists, tuples and NumPy arrays are parsed alike.
+        """
+        # Act
+        parsed, failed = parse_many(units)
+
+        # Assert
+        assert [unit.name for unit in parsed] == ["mg", "g"]
+        assert not failed.any()
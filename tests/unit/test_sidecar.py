@@ -0,0 +1,147 @@
+import json
+
+import numpy as np
+
+from mdmodels.datamodel import DataModel
+
+
+class TestSidecar:
+    def test_save(self, tmp_path):
+        """
+        Test that arrays are written to sidecars and referenced from the JSON.
+
+        Nested arrays are named after their path within the document, while
+        all other values stay in the JSON file.
+        """
+        # Arrange
+        lib = self._load_library()
+        document = self._create_time_course(lib)
+
+        # Act
+        path = document.save(tmp_path)
+        data = json.loads(path.read_text())
+
+        # Assert
+        assert data["name"] == "Kinetics"
+        assert data["time"] == {"$npy": "arrays/time.npy"}
+        assert data["replicates"][1]["values"] == {
+            "$npy": "arrays/replicates.1.values.npy"
+        }
+        assert np.array_equal(np.load(tmp_path / "arrays/counts.npy"), document.counts)
+
+    def test_load_memory_maps(self, tmp_path):
+        """
+        Test that arrays are loaded as memory maps and compare equal to the
+        saved document.
+        """
+        # Arrange
+        lib = self._load_library()
+        document = self._create_time_course(lib)
+        document.save(tmp_path)
+
+        # Act
+        loaded = lib.TimeCourse.load(tmp_path)
+
+        # Assert
+        assert isinstance(loaded.time, np.memmap)
+        assert isinstance(loaded.replicates[0].values, np.memmap)
+        assert loaded == document
+
+    def test_load_without_mmap(self, tmp_path):
+        """
+        Test that arrays can be read into memory instead of being memory mapped.
+        """
+        # Arrange
+        lib = self._load_library()
+        document = self._create_time_course(lib)
+        document.save(tmp_path)
+
+        # Act
+        loaded = lib.TimeCourse.load(tmp_path, mmap=False)
+
+        # Assert
+        assert not isinstance(loaded.time, np.memmap)
+        assert loaded == document
+
+    def test_save_in_place(self, tmp_path):
+        """
+        Test that a loaded document can be saved back to its own directory.
+
+        The loaded arrays are memory maps of the very sidecars that are written,
+        which must neither be truncated nor leave temporary files behind.
+        """
+        # Arrange
+        lib = self._load_library()
+        document = self._create_time_course(lib)
+        document.save(tmp_path)
+        loaded = lib.TimeCourse.load(tmp_path)
+        loaded.name = "Modified"
+
+        # Act
+        loaded.save(tmp_path)
+        reloaded = lib.TimeCourse.load(tmp_path)
+
+        # Assert
+        assert reloaded.name == "Modified"
+        assert np.array_equal(reloaded.time, document.time)
+        assert np.array_equal(
+            reloaded.replicates[1].values, document.replicates[1].values
+        )
+        assert not list((tmp_path / "arrays").glob("*.tmp"))
+
+    def test_model_dump_keeps_memory_maps(self, tmp_path):
+        """
+        Test that Python dumps do not read the memory mapped arrays.
+        """
+        # Arrange
+        lib = self._load_library()
+        self._create_time_course(lib).save(tmp_path)
+
+        # Act
+        dumped = lib.TimeCourse.load(tmp_path).model_dump()
+
+        # Assert
+        assert isinstance(dumped["time"], np.memmap)
+
+    def test_list_backed_model(self, tmp_path):
+        """
+        Test that list-backed data models read sidecars into lists.
+        """
+        # Arrange
+        document = self._create_time_course(self._load_library())
+        document.save(tmp_path)
+        lists = DataModel.from_markdown("./tests/fixtures/model_timecourse.md")
+
+        # Act
+        loaded = lists.TimeCourse.load(tmp_path)
+
+        # Assert
+        assert loaded.time == document.time.tolist()
+        assert loaded.replicates[1].values == document.replicates[1].values.tolist()
+
+    @staticmethod
+    def _load_library():
+        """
+        Helper method to load the time course model with NumPy-backed arrays.
+        """
+        return DataModel.from_markdown(
+            "./tests/fixtures/model_timecourse.md",
+            numpy_arrays=True,
+        )
+
+    @staticmethod
+    def _create_time_course(lib):
+        """
+        Helper method to create a time course with two random replicates.
+        """
+        return lib.TimeCourse(
+            name="Kinetics",
+            time=np.linspace(0, 10, 1001),
+            counts=np.arange(1001),
+            unit="mmol / l",
+            status=lib.Status.DONE,
+            replicates=[
+                lib.Replicate(id=f"r{i}", values=np.random.default_rng(i).random(1001))
+                for i in range(2)
+            ],
+        )
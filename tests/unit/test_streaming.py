@@ -0,0 +1,129 @@
+import importlib
+
+import pytest
+
+import mdmodels
+from mdmodels.datamodel import DataModel
+
+
+class TestQuery:
+    def test_query_instances(self):
+        """
+        Test streaming a JSON path over DataModel instances.
+
+        This test verifies that matches are yielded with the position of the
+        instance they originate from and that filter expressions are applied.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model.md")
+        docs = [
+            self._create_object(dm, name, number)
+            for name, number in [("a", 10.0), ("b", 60.0)]
+        ]
+
+        # Act
+        matches = list(
+            mdmodels.query(docs, "$.nested_array[?(@.number > 50)].reference")
+        )
+
+        # Assert
+        assert [(m.document, m.value) for m in matches] == [(1, "b")]
+
+    def test_query_files(self, tmp_path):
+        """
+        Test streaming a JSON path over JSON, JSON Lines and XML files.
+
+        This test verifies that each file format is loaded and that matches
+        are tagged with the file path (and line number for JSON Lines).
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model.md")
+        obj = self._create_object(dm, "a", 1.0)
+
+        json_file = tmp_path / "doc.json"
+        json_file.write_text(obj.model_dump_json())
+        jsonl_file = tmp_path / "docs.jsonl"
+        jsonl_file.write_text(obj.model_dump_json() + "\n" + obj.model_dump_json())
+        xml_file = tmp_path / "doc.xml"
+        xml_file.write_bytes(obj.to_xml())
+
+        # Act
+        matches = list(
+            mdmodels.query([json_file, jsonl_file, xml_file], "$.name", model=dm.Test)
+        )
+
+        # Assert
+        assert [m.document for m in matches] == [
+            str(json_file),
+            f"{jsonl_file}:1",
+            f"{jsonl_file}:2",
+            str(xml_file),
+        ]
+        assert all(m.value == "a" for m in matches)
+
+    def test_query_thread_pool(self):
+        """
+        Test that querying within a thread pool preserves document order.
+        """
+        # Arrange
+        docs = [{"id": i} for i in range(20)]
+
+        # Act
+        matches = list(mdmodels.query(docs, "$.id", workers=4))
+
+        # Assert
+        assert [m.value for m in matches] == list(range(20))
+
+    def test_query_enum_filter_across_executors(self):
+        """
+        Test that filters on enumerations match the same values, whether the
+        documents are queried sequentially or within a process pool.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("tests/fixtures/model.md")
+        docs = [
+            dm.Test(name="go", to_reference=["go"], ontology=dm.Ontology.GO),
+            dm.Test(name="sio", to_reference=["sio"], ontology=dm.Ontology.SIO),
+        ]
+        path = f"$[?(@ == '{dm.Ontology.GO.value}')]"
+
+        # Act
+        sequential = list(mdmodels.query(docs, path))
+        pooled = list(mdmodels.query(docs, path, workers=2, executor="process"))
+
+        # Assert
+        assert [m.value for m in sequential] == [dm.Ontology.GO.value]
+        assert sequential == pooled
+
+    def test_query_xml_without_model(self, tmp_path):
+        """
+        Test that querying an XML file without a data model raises an error.
+        """
+        xml_file = tmp_path / "doc.xml"
+        xml_file.write_text("<Test/>")
+
+        with pytest.raises(ValueError):
+            list(mdmodels.query(xml_file, "$.name"))
+
+    def test_module_is_not_shadowed(self):
+        """
+        Test that the exported function does not shadow its module.
+        """
+        # Act
+        module = importlib.import_module("mdmodels.streaming")
+
+        # Assert
+        assert mdmodels.query is module.query
+        assert callable(mdmodels.query)
+
+    @staticmethod
+    def _create_object(dm, name: str, number: float):
+        """
+        Helper method to create a Test object with a single nested item.
+        """
+        return dm.Test(
+            name=name,
+            to_reference=[name],
+            number=1.0,
+            nested_array=[dm.Nested(reference=name, names=[], number=number)],
+        )
@@ -0,0 +1,201 @@
+import numpy as np
+
+from mdmodels.datamodel import DataModel
+
+
+class TestLoadTrusted:
+    def test_dict(self):
+        """
+        Test that trusted dictionaries match validated objects.
+
+        This test verifies that nested objects become instances of their data
+        models, enumerations their members, and that all given fields are set.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        data = self._create_document(lib).model_dump(mode="json")
+
+        # Act
+        loaded = lib.Test.load_trusted(data)
+
+        # Assert
+        assert loaded == lib.Test.model_validate(data)
+        assert isinstance(loaded.single_object, lib.Nested)
+        assert isinstance(loaded.nested_array[0], lib.Nested)
+        assert loaded.ontology is lib.Ontology.GO
+        assert loaded.model_fields_set == set(data)
+
+    def test_json_and_xml(self):
+        """
+        Test that JSON and XML strings and bytes are loaded.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib)
+
+        # Act
+        loaded = [
+            lib.Test.load_trusted(document.model_dump_json()),
+            lib.Test.load_trusted(document.model_dump_json().encode()),
+            lib.Test.load_trusted(document.xml()),
+            lib.Test.load_trusted(document.to_xml()),
+        ]
+
+        # Assert
+        assert all(instance == document for instance in loaded)
+
+    def test_defaults(self):
+        """
+        Test that missing fields receive their defaults.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+
+        # Act
+        loaded = lib.Test.load_trusted({"name": "Test"})
+
+        # Assert
+        assert loaded.number == 1.0
+        assert loaded.nested_array == []
+        assert loaded.single_object is None
+
+    def test_wrapped_xml(self):
+        """
+        Test that wrapped XML elements are found.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_wrapped_xml.md")
+        document = lib.WrappedXML(
+            list_of_some_xml=[lib.Some(some_field="a", some_element="b")] * 2,
+            single_xml=lib.Some(some_field="c", some_element="d"),
+        )
+
+        # Act
+        loaded = lib.WrappedXML.load_trusted(document.xml())
+
+        # Assert
+        assert loaded == document
+
+    def test_units(self):
+        """
+        Test that unit definitions are loaded from all formats.
+
+        This test covers dictionaries, JSON strings and XML strings.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        document = lib.UnitExample(
+            single_unit="mmol / l",
+            multiple_units=["s", "1 / s"],
+        )
+
+        # Act
+        loaded = [
+            lib.UnitExample.load_trusted(document.model_dump(mode="json")),
+            lib.UnitExample.load_trusted(document.model_dump_json()),
+            lib.UnitExample.load_trusted(document.xml()),
+        ]
+
+        # Assert
+        assert all(instance == document for instance in loaded)
+
+    def test_numpy_arrays(self):
+        """
+        Test that NumPy-backed fields are loaded as arrays.
+        """
+        # Arrange
+        lib = DataModel.from_markdown(
+            "./tests/fixtures/model_timecourse.md",
+            numpy_arrays=True,
+        )
+        document = lib.Replicate(id="r1", values=[0.5, 1.5, 2.5])
+
+        for data in (document.model_dump(mode="json"), document.xml()):
+            # Act
+            loaded = lib.Replicate.load_trusted(data)
+
+            # Assert
+            assert isinstance(loaded.values, np.ndarray)
+            assert loaded.values.dtype == np.float64
+            assert loaded == document
+
+    def test_unions(self):
+        """
+        Test that values of fields with multiple types are loaded.
+
+        This test verifies that nested objects are instances of the matching
+        data model and that XML documents load like validated ones.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_multiple_types.md")
+        document = lib.Test(
+            primitive_types=True,
+            complex_types=lib.SecondType(value=2),
+            array_primitive_types=["a", 1, 1.5, False],
+            array_complex_types=[lib.FirstType(value="x"), lib.SecondType(value=3)],
+        )
+
+        # Act
+        loaded = lib.Test.load_trusted(document.model_dump())
+        from_xml = lib.Test.load_trusted(document.xml())
+
+        # Assert
+        assert loaded == document
+        assert isinstance(loaded.complex_types, lib.SecondType)
+        assert from_xml == lib.Test.from_xml(document.to_xml())
+
+    def test_skips_validation(self, monkeypatch):
+        """
+        Test that trusted loading never calls the validator of the model.
+
+        The validator is replaced by an object that fails on any use.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        document = self._create_document(lib, items=20)
+        data = document.model_dump(mode="json")
+        monkeypatch.setattr(lib.Test, "__pydantic_validator__", _FailingValidator())
+
+        # Act
+        loaded = lib.Test.load_trusted(data)
+
+        # Assert
+        assert loaded == document
+        assert isinstance(loaded.nested_array[19], lib.Nested)
+
+    def test_values_are_taken_as_they_are(self):
+        """
+        Test that nested values are not validated or coerced.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model.md")
+        data = self._create_document(lib).model_dump(mode="json")
+        data["nested_array"][0]["number"] = "not a number"
+
+        # Act
+        loaded = lib.Test.load_trusted(data)
+
+        # Assert
+        assert loaded.nested_array[0].number == "not a number"
+
+    @staticmethod
+    def _create_document(lib, items: int = 3):
+        """
+        Helper method to create a document with nested objects and lists.
+        """
+        return lib.Test(
+            name="Test",
+            number=2.0,
+            to_reference=["abc", "def"],
+            single_object=lib.Nested(reference="abc", names=["a", "b"], number=2.0),
+            nested_array=[
+                lib.Nested(reference="abc", names=["x"], number=float(i))
+                for i in range(items)
+            ],
+            ontology=lib.Ontology.GO,
+        )
+
+
+class _FailingValidator:
+    def __getattr__(self, name):
+        raise AssertionError(f"Validator used: {name}")
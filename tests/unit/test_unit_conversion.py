@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from mdmodels.units.converter import convert_unit
+
+
+class TestUnitConversion:
+    """Tests for converting values between unit definitions."""
+
+    @pytest.mark.parametrize(
+        "source, target, factor",
+        [
+            ("mmol / l", "mol / l", 1e-3),
+            ("mg / ml", "kg / m^3", 1.0),
+            ("min", "s", 60.0),
+            ("h", "min", 60.0),
+            ("1 / min", "Hz", 1 / 60),
+            ("umol / (min mg)", "mol / (s g)", 1e-6 / 60 * 1e3),
+            ("M", "mmol / l", 1e3),
+            ("kJ", "J", 1e3),
+            ("kPa", "Pa", 1e3),
+            ("kg", "g", 1e3),
+            ("ml", "m^3", 1e-6),
+            ("deg_C / min", "K / s", 1 / 60),
+        ],
+    )
+    def test_conversion_factor(self, source, target, factor):
+        """Test factors between units with the same dimensions."""
+        assert convert_unit(source).conversion_factor(target) == pytest.approx(factor)
+        assert convert_unit(target).conversion_factor(
+            convert_unit(source)
+        ) == pytest.approx(1 / factor)
+
+    def test_incompatible_dimensions(self):
+        """Test that units with different dimensions are rejected."""
+        with pytest.raises(ValueError, match="different dimensions"):
+            convert_unit("mmol / l").conversion_factor("mg / l")
+
+        with pytest.raises(ValueError, match="different dimensions"):
+            convert_unit("s").convert([1.0], to="m")
+
+    def test_convert_arrays(self):
+        """Test that arrays, lists and numbers are converted."""
+        minutes = convert_unit("min")
+        values = np.arange(1_000_000, dtype=np.float64)
+
+        converted = minutes.convert(values, to="s")
+
+        assert isinstance(converted, np.ndarray)
+        np.testing.assert_allclose(converted, values * 60)
+        np.testing.assert_allclose(minutes.convert([1, 2], to="h"), [1 / 60, 2 / 60])
+        assert minutes.convert(2, to="s") == 120.0
+
+    def test_celsius_offset(self):
+        """Test that conversions from and to degrees Celsius apply the offset."""
+        celsius = convert_unit("deg_C")
+        kelvin = convert_unit("K")
+
+        np.testing.assert_allclose(
+            celsius.convert([0.0, 100.0], to=kelvin), [273.15, 373.15]
+        )
+        assert kelvin.convert(300.0, to=celsius) == pytest.approx(26.85)
+        assert celsius.convert(21.5, to=celsius) == 21.5
+        assert celsius.conversion_factor(celsius) == 1.0
+
+        with pytest.raises(ValueError, match="offset"):
+            celsius.conversion_factor(kelvin)
+
+    def test_time_units(self):
+        """Test that units of time are stored with their multiplier only."""
+        for unit in ("min", "h", "d"):
+            base_unit = convert_unit(unit).base_units[0]
+            assert base_unit.scale == 0.0
+
+
+class TestCanonicalUnits:
+    """Tests for the canonical form, equality and hashing of unit definitions."""
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ("mmol / l", "mol / m^3"),
+            ("M", "mmol / ml"),
+            ("kg", "1000 g"),
+            ("umol / (min mg)", "umol/min/mg"),
+            ("1 / min", "min^-1"),
+        ],
+    )
+    def test_equal_units(self, first, second):
+        """Test that units describing the same quantity are equal."""
+        first, second = convert_unit(first), convert_unit(second)
+
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_unequal_units(self):
+        """Test that scales and offsets distinguish units."""
+        assert convert_unit("mmol / l") != convert_unit("mol / l")
+        assert convert_unit("ms") != convert_unit("s")
+        assert convert_unit("deg_C") != convert_unit("K")
+
+    def test_canonical_form(self):
+        """Test that base units are merged, sorted and normalized."""
+        dimensions, multiplier, scale, offset = convert_unit(
+            "umol / (min mg)"
+        ).canonical
+
+        assert dimensions == (("gram", -1), ("mole", 1), ("second", -1))
+        assert multiplier * 10**scale == pytest.approx(1e-6 / 60 / 1e-3)
+        assert 1 <= multiplier < 10
+        assert offset == 0.0
+
+    def test_is_equivalent(self):
+        """Test that units with the same dimensions are equivalent."""
+        assert convert_unit("mmol / l").is_equivalent("M")
+        assert convert_unit("deg_C").is_equivalent("K")
+        assert convert_unit("1 / min").is_equivalent("Hz")
+        assert not convert_unit("mmol / l").is_equivalent("mg / l")
+
+    def test_unit_keyed_dicts(self):
+        """Test that units can be used as keys and deduplicated."""
+        units = [convert_unit(u) for u in ("mmol / l", "mol / m^3", "s", "min")]
+        counts = {}
+
+        for unit in units:
+            counts[unit] = counts.get(unit, 0) + 1
+
+        assert len(set(units)) == 3
+        assert counts[convert_unit("mmol / l")] == 2
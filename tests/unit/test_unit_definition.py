@@ -1,6 +1,12 @@
+import copy
 import json
+import time
+
+import pytest
 
 from mdmodels.datamodel import DataModel
+from mdmodels.units.converter import _convert_astropy_unit, convert_unit
+from mdmodels.units.unit_definition import UnitDefinition, UnitType
 
 
 class TestUnitDefinition:
@@ -51,3 +57,161 @@ class TestUnitDefinition:
         # Assert
         expected_json = open("./tests/fixtures/expected_units_complex.json").read()
         assert json.loads(obj.model_dump_json(indent=2)) == json.loads(expected_json)
+
+
+class TestUnitCache:
+    def test_units_are_interned(self):
+        """
+        Test that fields holding the same unit share one frozen instance.
+
+        Units given as strings, JSON strings and dictionaries are memoized,
+        such that all of them resolve to the same unit definition.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+
+        # Act
+        obj = dm.UnitExample(
+            single_unit="mmol / l",
+            multiple_units=["mmol / l", "s", "s"],
+        )
+        dumped = obj.model_dump(mode="json")
+        from_dict = dm.UnitExample(**dumped)
+        from_json = dm.UnitExample(single_unit=json.dumps(dumped["single_unit"]))
+
+        # Assert
+        assert obj.single_unit is obj.multiple_units[0]
+        assert obj.multiple_units[1] is obj.multiple_units[2]
+        assert from_dict.multiple_units[1] is from_dict.multiple_units[2]
+        assert from_json.single_unit == obj.single_unit
+        assert obj.single_unit.frozen
+
+    def test_shared_units_are_immutable(self):
+        """
+        Test that shared units cannot be modified, but mutable copies can.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        obj = dm.UnitExample(single_unit="mmol / l")
+        unit = obj.single_unit
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            unit.name = "millimolar"
+        with pytest.raises(TypeError):
+            unit.base_units[0].scale = 0.0
+        with pytest.raises(TypeError):
+            unit.base_units.append(unit.base_units[0])
+        with pytest.raises(TypeError):
+            unit.add_to_base_units(kind=UnitType.SECOND, exponent=-1)
+
+        mutable = unit.model_copy()
+        mutable.name = "millimolar"
+        mutable.base_units[0].scale = 0.0
+        mutable.add_to_base_units(kind=UnitType.SECOND, exponent=-1)
+
+        assert not mutable.frozen
+        assert unit.name == "mmol / l"
+        assert unit.base_units[0].scale == -3.0
+        assert len(unit.base_units) == 2
+        assert unit.model_copy() == unit
+
+    def test_copies_of_documents(self):
+        """
+        Test that copies and XML roundtrips of documents keep their units.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        obj = dm.UnitExample(single_unit="mmol / l", multiple_units=["s"])
+
+        # Act
+        deep_copy = copy.deepcopy(obj)
+        restored = dm.UnitExample.from_xml(obj.to_xml())
+
+        # Assert
+        assert deep_copy == obj
+        assert restored == obj
+
+    @pytest.mark.expensive
+    def test_cached_parsing_speedup(self):
+        """
+        Test that validating unit-heavy documents is at least ten times faster than parsing each unit.
+        """
+        # Arrange
+        dm = DataModel.from_markdown("./tests/fixtures/model_units.md")
+        units = ["mmol / l", "mg / s * l mol^2", "1 / s"] * 200
+
+        # Act
+        start = time.perf_counter()
+        for unit in units:
+            _convert_astropy_unit(unit)
+        uncached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dm.UnitExample(multiple_units=units)
+        cached = time.perf_counter() - start
+
+        # Assert
+        assert uncached / cached >= 10
+
+
+class TestAstropyBridge:
+    @pytest.mark.parametrize(
+        "unit",
+        ["mmol / l", "umol / (min mg)", "deg_C", "kg", "1 / min", "km^2", "M", "Hz"],
+    )
+    def test_roundtrip(self, unit):
+        """
+        Test that units converted to astropy and back describe the same quantity.
+        """
+        # Arrange
+        import astropy.units as u
+
+        unit_def = convert_unit(unit)
+
+        # Act
+        astropy_unit = unit_def.to_astropy()
+        restored = UnitDefinition.from_astropy(astropy_unit)
+
+        # Assert
+        assert restored == unit_def
+        assert astropy_unit.is_equivalent(u.Unit(unit_def.name))
+        assert astropy_unit.to(u.Unit(unit_def.name)) == pytest.approx(1.0)
+
+    def test_prefixed_units(self):
+        """
+        Test that scaled base units are named with astropy's prefixes.
+        """
+        # Act
+        astropy_unit = convert_unit("mmol / l").to_astropy()
+
+        # Assert
+        assert astropy_unit.to_string() == "mmol / l"
+
+    def test_units_are_cached(self):
+        """
+        Test that shared units cache their astropy unit and conversions share the memo.
+        """
+        # Arrange
+        import astropy.units as u
+
+        unit_def = convert_unit("mmol / l")
+
+        # Act & Assert
+        assert unit_def.to_astropy() is unit_def.to_astropy()
+        assert UnitDefinition.from_astropy(u.mmol / u.l) is unit_def
+        assert UnitDefinition.from_astropy(u.Unit("0.5 s")).convert(2.0, "s") == 1.0
+        assert unit_def.model_copy().to_astropy() == unit_def.to_astropy()
+
+    def test_base_unit_to_astropy(self):
+        """
+        Test that base units convert to astropy without a name.
+        """
+        # Arrange
+        import astropy.units as u
+
+        base_units = convert_unit("mmol / min").base_units
+
+        # Act & Assert
+        assert base_units[0].to_astropy() == u.mmol
+        assert base_units[1].to_astropy() == u.min**-1
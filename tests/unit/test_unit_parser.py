@@ -0,0 +1,176 @@
+import random
+
+import pytest
+
+from mdmodels.units.converter import _convert_astropy_unit, convert_unit
+from mdmodels.units.parser import PREFIXES, SYMBOLS, parse_unit
+
+pytestmark = pytest.mark.filterwarnings("ignore::astropy.units.UnitsWarning")
+
+COMMON_UNITS = [
+    "mmol/l",
+    "mmol / l",
+    "umol/min",
+    "umol / (min mg)",
+    "umol/min/mg",
+    "mg/ml",
+    "mg / mL",
+    "mg.ml^-1",
+    "mg*ml^-1",
+    "mg / s * l mol^2",
+    "K",
+    "s",
+    "s^-1",
+    "1/s",
+    "1 / (min mg)",
+    "min",
+    "h",
+    "hr",
+    "day",
+    "kg",
+    "µg",
+    "m^2",
+    "m**2",
+    "m2",
+    "m^(-2)",
+    "deg_C",
+    "°C",
+    "Hz",
+    "mA",
+    "M",
+    "mM",
+    "µM",
+    "uM/min",
+    "mM / s",
+    "1 / mM",
+    "Pa",
+    "kPa",
+    "J",
+    "kJ / mol",
+    "mV",
+    "kN",
+    "mW",
+    "Bq",
+    "MBq",
+    "kat",
+    "nkat / mg",
+]
+
+COMBINED_UNITS = [
+    "mmol",
+    "l",
+    "ml",
+    "mg",
+    "g",
+    "s",
+    "min",
+    "h",
+    "umol",
+    "K",
+    "cm",
+    "mM",
+    "uM",
+    "kPa",
+    "J",
+    "V",
+    "N",
+    "W",
+    "Bq",
+    "kat",
+]
+SEPARATORS = [" ", "*", ".", " * ", " / ", "/"]
+POWERS = ["", "^2", "^-1", "**2", "2", "-1", "^(2)", "^(-1)"]
+
+
+def assert_equivalent(unit_string: str):
+    fast = parse_unit(unit_string)
+    reference = _convert_astropy_unit(unit_string)
+
+    assert fast is not None, unit_string
+    assert fast.id == reference.id, unit_string
+    assert fast == reference, unit_string
+
+
+def random_unit(rng: random.Random) -> str:
+    text = rng.choice(["", "1 / "])
+
+    for i in range(1 if text else rng.randint(1, 4)):
+        if i:
+            text += rng.choice(SEPARATORS)
+        text += rng.choice(COMBINED_UNITS) + rng.choice(POWERS)
+
+    return text
+
+
+class TestUnitParser:
+    """Differential tests of the fast unit parser against the astropy path."""
+
+    @pytest.mark.parametrize("unit_string", COMMON_UNITS)
+    def test_common_units(self, unit_string):
+        """Test that common units are parsed like astropy does."""
+        assert_equivalent(unit_string)
+
+    def test_prefixed_units(self):
+        """Test that every prefix on every prefixable unit matches astropy."""
+        for prefix in PREFIXES:
+            for symbol, unit in SYMBOLS.items():
+                if unit.prefixable:
+                    assert_equivalent(prefix + symbol)
+
+    def test_random_expressions(self):
+        """Test that products and quotients of units match astropy."""
+        rng = random.Random(42)
+        parsed = 0
+
+        for _ in range(500):
+            unit_string = random_unit(rng)
+
+            if parse_unit(unit_string) is not None:
+                assert_equivalent(unit_string)
+                parsed += 1
+
+        assert parsed > 250
+
+    @pytest.mark.parametrize(
+        "unit_string",
+        [
+            "kDa",
+            "Gy",
+            "1 / M / s",
+            "1 / s / m",
+            "(m / s)",
+            "mol (s)",
+            "Hz s",
+            "l L",
+            "m^(1/2)",
+            "10 m",
+        ],
+    )
+    def test_fallback(self, unit_string):
+        """Test that strings outside of the grammar are left to astropy."""
+        assert parse_unit(unit_string) is None
+
+    def test_convert_unit_falls_back_to_astropy(self):
+        """Test that units outside of the fast path are still converted."""
+        unit = convert_unit("kDa")
+
+        assert unit.id == "kDa"
+        assert unit == _convert_astropy_unit("kDa")
+
+    def test_molar_units(self):
+        """Test that molar units equal amounts of substance per litre."""
+        assert convert_unit("mM") == convert_unit("mmol / l")
+        assert _convert_astropy_unit("mM") == convert_unit("mmol / l")
+        assert convert_unit("uM / min").conversion_factor("mol / (m3 s)") == (
+            pytest.approx(1e-3 / 60)
+        )
+
+    @pytest.mark.parametrize(
+        "unit_string, target, factor",
+        [("kHz", "1 / s", 1e3), ("1 / kPa", "1 / Pa", 1e-3), ("MBq", "Bq", 1e6)],
+    )
+    def test_astropy_derived_units(self, unit_string, target, factor):
+        """Test that prefixed and inverted derived units convert through astropy."""
+        unit = _convert_astropy_unit(unit_string)
+
+        assert unit.conversion_factor(target) == pytest.approx(factor)
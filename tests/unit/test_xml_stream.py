@@ -0,0 +1,200 @@
+import io
+
+import pytest
+
+from mdmodels.datamodel import DataModel
+
+
+class TestXMLStream:
+    def test_iter_xml(self, tmp_path):
+        """
+        Test that all children are yielded in order along with the root values.
+
+        This test verifies that the attributes and elements of the root, which
+        are not streamed, are collected by the reader.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        experiment = self._create_experiment(lib)
+        path = tmp_path / "experiment.xml"
+        experiment.write_xml(path)
+
+        # Act
+        reader = lib.Experiment.iter_xml(path, item_path="measurements/measurement")
+        items = list(reader)
+
+        # Assert
+        assert items == experiment.measurements
+        assert reader.attributes == {
+            "name": "Exp & 1",
+            "temperature": 25.0,
+            "description": "Kinetics",
+        }
+
+    def test_iter_xml_default_item_path(self):
+        """
+        Test that the only list of objects is streamed without an item path.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        source = io.BytesIO(self._create_experiment(lib).to_xml())
+
+        # Act
+        reader = lib.Experiment.iter_xml(source)
+
+        # Assert
+        assert [m.time for m in reader] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_iter_xml_field_name(self):
+        """
+        Test that the list can be addressed by its field name.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        source = io.BytesIO(self._create_experiment(lib).to_xml())
+
+        # Act
+        items = list(lib.Experiment.iter_xml(source, item_path="measurements"))
+
+        # Assert
+        assert len(items) == 5
+
+    def test_iter_xml_detaches_items(self, monkeypatch):
+        """
+        Test that processed elements do not accumulate in the parsed tree.
+
+        This test records the number of children of the list element once it
+        has been parsed completely, which must be zero.
+        """
+        # Arrange
+        from mdmodels import xml_stream
+
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        source = io.BytesIO(self._create_experiment(lib).to_xml())
+        sizes = []
+        original = xml_stream.etree.iterparse
+
+        def iterparse(*args, **kwargs):
+            for event, elem in original(*args, **kwargs):
+                if event == "end" and elem.tag == "measurements":
+                    sizes.append(len(elem))
+                yield event, elem
+
+        monkeypatch.setattr(xml_stream.etree, "iterparse", iterparse)
+
+        # Act
+        list(lib.Experiment.iter_xml(source))
+
+        # Assert
+        assert sizes == [0]
+
+    def test_iter_xml_invalid_item_path(self):
+        """
+        Test that an unknown item path is rejected.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        source = io.BytesIO(self._create_experiment(lib).to_xml())
+
+        with pytest.raises(ValueError):
+            lib.Experiment.iter_xml(source, "unknown/item")
+
+    def test_xml_writer(self, tmp_path):
+        """
+        Test that the streamed output is byte-identical to 'to_xml'.
+
+        This test writes single items as well as dictionaries of items.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        experiment = self._create_experiment(lib)
+        values = experiment.model_dump(exclude={"measurements"})
+        path = tmp_path / "experiment.xml"
+
+        # Act
+        with lib.Experiment.xml_writer(path, values=values) as writer:
+            writer.write(experiment.measurements[0])
+            writer.write_all(m.model_dump() for m in experiment.measurements[1:])
+
+        # Assert
+        assert path.read_bytes() == experiment.to_xml()
+
+    def test_xml_writer_wrapped(self):
+        """
+        Test streaming into a wrapped list followed by further elements.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_wrapped_xml.md")
+        document = lib.WrappedXML(
+            list_of_some_xml=[
+                lib.Some(some_field=f"f{i}", some_element=f"e{i}") for i in range(3)
+            ],
+            single_xml=lib.Some(some_field="single", some_element="single"),
+        )
+        buffer = io.BytesIO()
+
+        # Act
+        with lib.WrappedXML.xml_writer(
+            buffer,
+            field="ListOfSomeXML/MultiPart",
+            values={"single_xml": document.single_xml},
+        ) as writer:
+            writer.write_all(document.list_of_some_xml)
+
+        # Assert
+        assert buffer.getvalue() == document.to_xml()
+
+    def test_xml_writer_empty(self, tmp_path):
+        """
+        Test that a writer without items produces the plain root.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        path = tmp_path / "empty.xml"
+        values = {"name": "Empty", "temperature": 1.0}
+
+        # Act
+        with lib.Experiment.xml_writer(path, values=values):
+            pass
+
+        # Assert
+        assert path.read_bytes() == lib.Experiment(**values).to_xml()
+
+    def test_xml_writer_roundtrip(self, tmp_path):
+        """
+        Test that streamed documents can be streamed back in.
+        """
+        # Arrange
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        experiment = self._create_experiment(lib)
+        path = tmp_path / "experiment.xml"
+        values = experiment.model_dump(exclude={"measurements"})
+
+        # Act
+        with lib.Experiment.xml_writer(path, values=values) as writer:
+            writer.write_all(experiment.measurements)
+
+        # Assert
+        assert list(lib.Experiment.iter_xml(path)) == experiment.measurements
+
+    def test_xml_writer_rejects_streamed_value(self):
+        """
+        Test that the streamed field cannot be passed as a root value.
+        """
+        lib = DataModel.from_markdown("./tests/fixtures/model_xml_stream.md")
+        values = self._create_experiment(lib).model_dump()
+
+        with pytest.raises(ValueError):
+            lib.Experiment.xml_writer(io.BytesIO(), values=values)
+
+    @staticmethod
+    def _create_experiment(lib):
+        """
+        Helper method to create an experiment with five measurements.
+        """
+        return lib.Experiment(
+            name="Exp & 1",
+            temperature=25.0,
+            description="Kinetics",
+            measurements=[lib.Measurement(time=i, value=i * 2) for i in range(5)],
+            operator=lib.Operator(name="Jane"),
+        )